@@ -112,6 +112,12 @@ get_debate_judge_backstory = get_dynamic_debate_judge_backstory
                         elif 'api_calls' in event['data']:
                             total_searches = max(total_searches, event['data']['api_calls'])
             
+            # Prefer the penalty the search ledger computed from per-advocate attempted searches;
+            # logs written before refused searches were counted always carry a zero penalty
+            session_data = log_data.get('session_data', {})
+            if 'searches_attempted' in session_data and session_data.get('search_penalty') is not None:
+                return float(session_data['search_penalty']), total_searches
+            
             # Calculate penalty: 0.01 for each search beyond 10
             search_penalty = max(0, (total_searches - 10) * 0.01)
             
@@ -14,6 +14,7 @@ import sys
 import argparse
 import time
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -38,6 +39,10 @@ import sys
 sys.path.append('src')
 
 from ai_forecasts.agents.inspect_ai_superforecaster import create_superforecaster
+from ai_forecasts.utils.search_budget import SearchBudgetLedger
+from ai_forecasts.utils.search_prefetch import prefetch_searches
+from ai_forecasts.utils.resolution_index import ResolutionIndex, load_resolution_index
+from ai_forecasts.utils.checkpoint_store import CheckpointStore, result_key, resume_state, list_checkpoints
 
 def extract_question_ids_from_failure_file(file_path: str = "failure.txt") -> List[str]:
     """
@@ -79,9 +84,24 @@ class EnhancedForecastBenchRunner:
     # Time horizons for predictions (in days)
     TIME_HORIZONS = [7, 30, 90, 180]
     
-    def __init__(self, openrouter_api_key: str, serp_api_key: str = None):
+    # SERP calls each debate advocate may make per question
+    SEARCH_BUDGET_PER_ADVOCATE = 10
+    
+    def __init__(self, openrouter_api_key: str, serp_api_key: str = None, concurrent_rebuttals: bool = False,
+                 convergence_threshold: float = None, compact_transcripts: bool = False,
+                 cache_prompt: bool = True):
         self.openrouter_api_key = openrouter_api_key
         self.serp_api_key = serp_api_key
+        self.concurrent_rebuttals = concurrent_rebuttals
+        self.convergence_threshold = convergence_threshold
+        self.compact_transcripts = compact_transcripts
+        self.cache_prompt = cache_prompt
+        
+        # One search ledger per run, shared by every worker's forecaster
+        self.search_ledger = SearchBudgetLedger(budget_per_role=self.SEARCH_BUDGET_PER_ADVOCATE)
+        
+        # Each worker thread keeps one long-lived forecaster (model client, news tool, SERP client)
+        self._worker_state = threading.local()
         
         # Create logs, checkpoints, and results directories
         self.logs_dir = Path("logs")
@@ -92,40 +112,32 @@ class EnhancedForecastBenchRunner:
         self.results_dir.mkdir(exist_ok=True)
     
     
-    def load_local_data(self) -> Tuple[List[Dict], Dict[str, Any], str]:
-        """Load questions and resolutions from local JSON files"""
+    def load_local_data(self) -> Tuple[List[Dict], ResolutionIndex, str]:
+        """Load questions and the (question id, resolution date) resolution index from local JSON files"""
         try:
             # Load questions
             with open(self.QUESTIONS_FILE, 'r') as f:
                 questions_data = json.load(f)
             
-            # Load resolutions
-            with open(self.RESOLUTIONS_FILE, 'r') as f:
-                resolutions_data = json.load(f)
+            # Load resolutions once into a hash index
+            resolution_index = load_resolution_index(self.RESOLUTIONS_FILE)
             
             questions = questions_data['questions']
             forecast_due_date = questions_data.get('forecast_due_date', '2024-07-21')  # Default fallback
             
             print(f"✅ Loaded {len(questions)} questions from local file")
-            print(f"✅ Loaded {len(resolutions_data['resolutions'])} resolutions from local file")
+            print(f"✅ Indexed {len(resolution_index)} resolved (question, date) pairs from local file")
             print(f"✅ Forecast due date: {forecast_due_date}")
             
-            return questions, resolutions_data, forecast_due_date
+            return questions, resolution_index, forecast_due_date
             
         except Exception as e:
             print(f"❌ Error loading local data: {e}")
-            return [], {}, "2024-07-21"  # Return default forecast due date on error
+            return [], None, "2024-07-21"  # Return default forecast due date on error
     
-    def get_resolution_for_question_and_date(self, question_id: str, resolution_date: str, resolutions_data: Dict) -> float:
+    def get_resolution_for_question_and_date(self, question_id: str, resolution_date: str, resolution_index: ResolutionIndex) -> float:
         """Get the resolution value for a specific question ID and date"""
-        if 'resolutions' not in resolutions_data:
-            return None
-            
-        for resolution in resolutions_data['resolutions']:
-            if (resolution['id'] == question_id and 
-                resolution['resolution_date'] == resolution_date):
-                return resolution['resolved_to']
-        return None
+        return resolution_index.get(question_id, resolution_date)
     
     def create_comprehensive_context(self, question_data: Dict) -> str:
         """Create comprehensive context from all available question information"""
@@ -200,7 +212,7 @@ class EnhancedForecastBenchRunner:
 
     def _forecast_with_retry(self, superforecaster, question: str, comprehensive_context: str, cutoff_date: datetime, 
                            time_horizons_str: List[str], effective_recommended_articles: int, 
-                           effective_max_queries: int, max_retries: int = 3) -> List:
+                           effective_max_queries: int, max_retries: int = 3, question_id: str = None) -> List:
         """Forecast with retry logic for handling N/A results"""
         
         for attempt in range(max_retries):
@@ -214,7 +226,8 @@ class EnhancedForecastBenchRunner:
                     time_horizons=time_horizons_str,
                     is_benchmark=True,
                     recommended_articles=effective_recommended_articles,
-                    max_search_queries=effective_max_queries
+                    max_search_queries=effective_max_queries,
+                    question_id=question_id
                 )
                 
                 # Check if we got valid results for all horizons
@@ -265,19 +278,37 @@ class EnhancedForecastBenchRunner:
         # Should not reach here, but return empty list as fallback
         return []
 
-    def process_single_question(self, question_data: Dict, question_idx: int, resolutions_data: Dict, base_date: datetime, forecast_due_date: str, run_timestamp: str) -> Dict:
-        """Process a single question with 4 time horizon predictions using enhanced context and retry logic"""
-        try:
-            # Create forecaster for this question
-            question_id = question_data.get('id', f"q_{question_idx}")
-            log_file = self.logs_dir / f"question_{question_idx+1}_{question_id}_{run_timestamp}.json"
-            # Initialize superforecaster for this thread
-            # Use Inspect AI with debate mode
+    def get_worker_forecaster(self):
+        """Long-lived superforecaster for the current worker thread, created on first use"""
+        superforecaster = getattr(self._worker_state, 'superforecaster', None)
+        if superforecaster is None:
             superforecaster = create_superforecaster(
                 openrouter_api_key=self.openrouter_api_key,
                 serp_api_key=self.serp_api_key,
-                debate_mode=True
+                debate_mode=True,
+                search_budget_per_advocate=self.SEARCH_BUDGET_PER_ADVOCATE,
+                search_ledger=self.search_ledger,
+                concurrent_rebuttals=self.concurrent_rebuttals,
+                convergence_threshold=self.convergence_threshold,
+                compact_transcripts=self.compact_transcripts,
+                cache_prompt=self.cache_prompt
             )
+            self._worker_state.superforecaster = superforecaster
+            print(f"🧵 Created superforecaster for worker {threading.current_thread().name}")
+        return superforecaster
+
+    def process_single_question(self, question_data: Dict, question_idx: int, resolution_index: ResolutionIndex, base_date: datetime, forecast_due_date: str, run_timestamp: str,
+                                horizon_results: List = None) -> Dict:
+        """Process a single question with 4 time horizon predictions using enhanced context and retry logic
+        
+        horizon_results, when given (from the batched eval), are scored and logged instead of running a new forecast
+        """
+        try:
+            # Create forecaster for this question
+            question_id = question_data.get('id', f"q_{question_idx}")
+            log_file = self.logs_dir / f"question_{question_idx+1}_{question_id}_{run_timestamp}.json"
+            # Reuse this worker thread's superforecaster (Inspect AI with debate mode)
+            superforecaster = self.get_worker_forecaster()
             
             question = question_data.get('question', '')
             question_id = question_data.get('id', f"q_{question_idx}")
@@ -313,18 +344,19 @@ class EnhancedForecastBenchRunner:
             effective_max_queries = 5
             
             try:
-                # Use retry logic for forecasting
-                horizon_results = self._forecast_with_retry(
-                    superforecaster=superforecaster,
-                    question=question,
-                    comprehensive_context=comprehensive_context,
-                    cutoff_date=cutoff_date,
-                    time_horizons_str=time_horizons_str,
-                    effective_recommended_articles=effective_recommended_articles,
-                    effective_max_queries=effective_max_queries,
-
-                    max_retries=3
-                )
+                # Use retry logic for forecasting (unless the batched eval already forecast this question)
+                if horizon_results is None or not self._has_valid_predictions(horizon_results):
+                    horizon_results = self._forecast_with_retry(
+                        superforecaster=superforecaster,
+                        question=question,
+                        comprehensive_context=comprehensive_context,
+                        cutoff_date=cutoff_date,
+                        time_horizons_str=time_horizons_str,
+                        effective_recommended_articles=effective_recommended_articles,
+                        effective_max_queries=effective_max_queries,
+                        max_retries=3,
+                        question_id=question_id
+                    )
                 
                 print(f"  ✅ Multi-horizon forecast completed: {len(horizon_results)} predictions")
                 
@@ -335,7 +367,7 @@ class EnhancedForecastBenchRunner:
                 
                 for i, (horizon_days, resolution_date, result) in enumerate(zip(self.TIME_HORIZONS, resolution_dates, horizon_results)):
                     # Get actual resolution value
-                    actual_value = self.get_resolution_for_question_and_date(question_id, resolution_date, resolutions_data)
+                    actual_value = self.get_resolution_for_question_and_date(question_id, resolution_date, resolution_index)
                     
                     # Handle invalid or None results
                     if not hasattr(result, 'prediction') or result.prediction is None:
@@ -395,8 +427,18 @@ class EnhancedForecastBenchRunner:
                     brier_scores[horizon_key] = None
                     actual_values[horizon_key] = None
             
-            # Finalize question logging session
-            # Session finalized
+            # Finalize question logging session with the ledger's actual search counts
+            session_data = self.search_ledger.question_summary(question_id)
+            self.save_question_log(log_file, {
+                'question_id': question_id,
+                'question': question,
+                'run_timestamp': run_timestamp,
+                'session_data': session_data,
+                'predictions': predictions,
+                'brier_scores': brier_scores,
+                'actual_values': actual_values
+            })
+            print(f"  🔍 Searches used: {session_data['search_count']} {session_data['searches_by_role']}")
             
             return {
                 'question_idx': question_idx,
@@ -407,6 +449,11 @@ class EnhancedForecastBenchRunner:
                 'predictions': predictions,
                 'brier_scores': brier_scores,
                 'actual_values': actual_values,
+                'search_count': session_data['search_count'],
+                'searches_by_role': session_data['searches_by_role'],
+                'search_penalty': session_data['search_penalty'],
+                'debate_rounds_completed': getattr(horizon_results[0], 'debate_rounds_completed', 0) if horizon_results else 0,
+                'llm_calls_saved': getattr(horizon_results[0], 'llm_calls_saved', 0) if horizon_results else 0,
                 'log_file': str(log_file),
                 'success': True
             }
@@ -431,7 +478,10 @@ class EnhancedForecastBenchRunner:
                 'success': False
             }
     
-    def run_parallel_benchmark(self, max_questions: int = 200, max_workers: int = 3, resume_from_checkpoint: str = None, question_ids: List[str] = None) -> Dict[str, Any]:
+    def run_parallel_benchmark(self, max_questions: int = 200, max_workers: int = 3, resume_from_checkpoint: str = None, question_ids: List[str] = None,
+                               prefetch: bool = False, prefetch_concurrency: int = 8, batch: bool = False,
+                               max_samples: int = None, max_connections: int = None,
+                               retry_failed: bool = False) -> Dict[str, Any]:
         """Run enhanced ForecastBench evaluation with comprehensive context and checkpoint support
         
         Args:
@@ -439,6 +489,12 @@ class EnhancedForecastBenchRunner:
             max_workers: Number of parallel workers
             resume_from_checkpoint: Path to checkpoint file or 'latest'
             question_ids: Optional list of specific question IDs to test on
+            prefetch: Warm the search cache for all remaining questions before the debates start
+            prefetch_concurrency: Maximum concurrent searches during the prefetch phase
+            batch: Forecast all remaining questions in a single Inspect AI eval before scoring them
+            max_samples: Maximum debates running at once in the batched eval
+            max_connections: Maximum concurrent model connections in the batched eval
+            retry_failed: When resuming, run questions whose checkpointed result failed again
         """
         
         # Handle checkpoint resumption or create new timestamp
@@ -446,23 +502,24 @@ class EnhancedForecastBenchRunner:
             if resume_from_checkpoint == "latest":
                 checkpoint_file = self.find_latest_checkpoint()
                 if checkpoint_file:
-                    checkpoint_data = self.load_checkpoint(checkpoint_file)
+                    checkpoint_store, checkpoint_data = self.open_checkpoint(checkpoint_file)
                     run_timestamp = checkpoint_data.get('run_timestamp', datetime.now().strftime("%Y%m%d_%H%M%S"))
                     print(f"🔄 Resuming from latest checkpoint: {checkpoint_file}")
                 else:
                     print("📄 No checkpoint found, starting fresh")
                     run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    checkpoint_data = {}
+                    checkpoint_file = self.get_checkpoint_file(run_timestamp)
+                    checkpoint_store, checkpoint_data = CheckpointStore(checkpoint_file), {}
             else:
                 # Specific checkpoint file
                 checkpoint_file = Path(resume_from_checkpoint)
-                checkpoint_data = self.load_checkpoint(checkpoint_file)
+                checkpoint_store, checkpoint_data = self.open_checkpoint(checkpoint_file)
                 run_timestamp = checkpoint_data.get('run_timestamp', datetime.now().strftime("%Y%m%d_%H%M%S"))
         else:
             # Fresh start
             run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            checkpoint_data = {}
             checkpoint_file = self.get_checkpoint_file(run_timestamp)
+            checkpoint_store, checkpoint_data = CheckpointStore(checkpoint_file), {}
         
         # Create master log file for the entire run
         master_log_file = self.logs_dir / f"benchmark_run_{run_timestamp}.json"
@@ -481,16 +538,16 @@ class EnhancedForecastBenchRunner:
         print(f"   Checkpoint file: {checkpoint_file}")
         
         # Load questions and resolutions from local files
-        questions, resolutions_data, forecast_due_date = self.load_local_data()
+        questions, resolution_index, forecast_due_date = self.load_local_data()
         if not questions:
             print("❌ Failed to load ForecastBench questions")
             return {"error": "Failed to load ForecastBench questions"}
             
-        if not resolutions_data:
+        if resolution_index is None:
             print("❌ Failed to load resolution data")
             return {"error": "Failed to load resolution data"}
         
-        print(f"✅ Loaded {len(questions)} questions and {len(resolutions_data.get('resolutions', []))} resolutions, forecast due date: {forecast_due_date}")
+        print(f"✅ Loaded {len(questions)} questions and {len(resolution_index)} resolved (question, date) pairs, forecast due date: {forecast_due_date}")
         
         # Filter questions by question IDs if specified
         if question_ids:
@@ -541,43 +598,87 @@ class EnhancedForecastBenchRunner:
         base_date = datetime(2024, 7, 21)
         print("base_date", f"Using base date: {base_date.strftime('%Y-%m-%d')}")
         
-        # Resume from checkpoint if available
+        # Resume from checkpoint if available; results are keyed by question id (last result wins)
         if checkpoint_data and 'results' in checkpoint_data:
-            completed_indices = set(r['question_idx'] for r in checkpoint_data['results'] if r.get('success', False))
-            print(f"⏮️ Found checkpoint with {len(completed_indices)} completed questions")
-            results = checkpoint_data['results']
+            results_by_id, completed_ids, failed_ids = resume_state(checkpoint_data['results'], retry_failed)
+            print(f"⏮️ Found checkpoint with {len(results_by_id) - len(failed_ids)} completed and {len(failed_ids)} failed questions"
+                  f"{' (retrying failures)' if retry_failed and failed_ids else ''}")
             start_time = datetime.fromisoformat(checkpoint_data.get('start_time', datetime.now().isoformat()))
         else:
-            completed_indices = set()
-            results = []
+            results_by_id = {}
+            completed_ids = set()
             start_time = datetime.now()
         
+        # Run metadata goes into every snapshot; finished questions are journaled as they complete
+        checkpoint_store.set_header(
+            run_timestamp=run_timestamp,
+            start_time=start_time.isoformat(),
+            base_date=base_date.strftime('%Y-%m-%d'),
+            max_questions=max_questions,
+            max_workers=max_workers,
+            time_horizons=self.TIME_HORIZONS,
+            total_questions=len(questions),
+            completed_count=len(completed_ids)
+        )
+        self.save_checkpoint(checkpoint_store)
+        
         # Filter questions that haven't been completed yet
-        remaining_questions = [(idx, q) for idx, q in enumerate(questions) if idx not in completed_indices]
+        remaining_questions = [(idx, q) for idx, q in enumerate(questions) if q.get('id', f"q_{idx}") not in completed_ids]
         
         if not remaining_questions:
             print("✅ All questions already completed from checkpoint!")
         else:
             print(f"📋 Processing {len(remaining_questions)} remaining questions (out of {len(questions)} total)")
         
+        # Optional warm-up: bulk-fill the search cache so debate tool calls become cache hits
+        prefetch_summary = None
+        if prefetch and remaining_questions:
+            prefetch_summary = prefetch_searches(
+                [q for _, q in remaining_questions],
+                cutoff_date=forecast_due_date,
+                serp_api_key=self.serp_api_key,
+                max_concurrency=prefetch_concurrency,
+                search_ledger=self.search_ledger
+            )
+        
+        # Optional batched forecasting: one eval with every remaining question as a sample,
+        # scheduled by Inspect AI; questions it could not forecast fall back to per-question evals
+        batch_forecasts = {}
+        if batch and remaining_questions:
+            batch_forecasts = self.get_worker_forecaster().forecast_batch(
+                [
+                    {
+                        'id': q.get('id', f"q_{idx}"),
+                        'question': q.get('question', ''),
+                        'background': self.create_comprehensive_context(q)
+                    }
+                    for idx, q in remaining_questions
+                ],
+                time_horizons=[f"{h}d" for h in self.TIME_HORIZONS],
+                cutoff_date=datetime.strptime(forecast_due_date, '%Y-%m-%d'),
+                max_samples=max_samples,
+                max_connections=max_connections
+            )
+        
         # Process remaining questions in parallel
         if remaining_questions:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit tasks for remaining questions
                 future_to_idx = {
-                    executor.submit(self.process_single_question, q, idx, resolutions_data, base_date, forecast_due_date, run_timestamp): idx 
+                    executor.submit(self.process_single_question, q, idx, resolution_index, base_date, forecast_due_date, run_timestamp,
+                                    batch_forecasts.get(str(q.get('id', f"q_{idx}")))): idx 
                     for idx, q in remaining_questions
                 }
                 
                 # Track progress for checkpointing
-                completed_count = len(completed_indices)
+                completed_count = len(completed_ids)
                 total_questions = len(questions)
                 
                 # Collect results as they complete
                 for future in as_completed(future_to_idx):
                     try:
                         result = future.result()
-                        results.append(result)
+                        results_by_id[result_key(result)] = result
                         completed_count += 1
                         
                         if result['success']:
@@ -601,48 +702,32 @@ class EnhancedForecastBenchRunner:
                                 "error": result.get('error')
                             })
                         
-                        # Save checkpoint after every completed question
-                        checkpoint_data_to_save = {
-                            'run_timestamp': run_timestamp,
-                            'start_time': start_time.isoformat(),
-                            'base_date': base_date.strftime('%Y-%m-%d'),
-                            'max_questions': max_questions,
-                            'max_workers': max_workers,
-                            'time_horizons': self.TIME_HORIZONS,
-                            'total_questions': len(questions),
-                            'completed_count': completed_count,
-                            'results': results
-                        }
-                        self.save_checkpoint(checkpoint_data_to_save, checkpoint_file)
+                        # Journal every completed question
+                        self.save_checkpoint(checkpoint_store, result, completed_count=completed_count)
                             
                     except Exception as e:
                         idx = future_to_idx[future]
+                        question_id = questions[idx].get('id', f"q_{idx}")
                         print(f"❌ Exception in question {idx + 1}: {e}")
                         print(f"Question {idx + 1} exception", {"error": str(e), "traceback": traceback.format_exc()})
-                        results.append({
+                        error_result = {
                             'question_idx': idx,
+                            'question_id': question_id,
                             'error': str(e),
                             'success': False
-                        })
+                        }
+                        results_by_id[question_id] = error_result
                         completed_count += 1
                         
-                        # Save checkpoint even after errors
-                        checkpoint_data_to_save = {
-                            'run_timestamp': run_timestamp,
-                            'start_time': start_time.isoformat(),
-                            'base_date': base_date.strftime('%Y-%m-%d'),
-                            'max_questions': max_questions,
-                            'max_workers': max_workers,
-                            'time_horizons': self.TIME_HORIZONS,
-                            'total_questions': len(questions),
-                            'completed_count': completed_count,
-                            'results': results
-                        }
-                        self.save_checkpoint(checkpoint_data_to_save, checkpoint_file)
+                        # Journal the failure too
+                        self.save_checkpoint(checkpoint_store, error_result, completed_count=completed_count)
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
+        # One result per question, including those completed before a resume
+        results = list(results_by_id.values())
+        
         print("benchmark_completed", f"Benchmark completed in {duration:.1f}s", {
             "total_questions": len(questions),
             "successful_results": len([r for r in results if r['success']]),
@@ -692,6 +777,13 @@ class EnhancedForecastBenchRunner:
         overall_avg_brier = statistics.mean(all_brier_scores) if all_brier_scores else None
         sum_brier_scores = sum(all_brier_scores) if all_brier_scores else None
         
+        # Search accounting (per-question counts come from the run's search ledger)
+        total_searches = sum(r.get('search_count', 0) for r in successful_results)
+        avg_search_penalty = statistics.mean([r.get('search_penalty', 0.0) for r in successful_results]) if successful_results else 0.0
+        
+        # Rebuttal turns skipped because the advocates converged early
+        total_llm_calls_saved = sum(r.get('llm_calls_saved', 0) for r in successful_results)
+        
         summary = {
             'base_date': base_date.strftime("%Y-%m-%d"),
             'forecast_due_date': forecast_due_date,
@@ -706,6 +798,12 @@ class EnhancedForecastBenchRunner:
             'overall_avg_brier_score': overall_avg_brier,
             'sum_brier_scores': sum_brier_scores,
             'horizon_statistics': horizon_stats,
+            'total_searches': total_searches,
+            'search_penalty': avg_search_penalty,
+            'llm_calls_saved': total_llm_calls_saved,
+            'search_budget_per_advocate': self.SEARCH_BUDGET_PER_ADVOCATE,
+            'prefetch': prefetch_summary,
+            'batched_eval': batch,
             'run_timestamp': run_timestamp,
             'master_log_file': str(master_log_file),
             'logs_directory': str(self.logs_dir),
@@ -728,6 +826,9 @@ class EnhancedForecastBenchRunner:
         print(f"   Total Brier scores: {total_brier_scores}")
         print(f"   Overall Average Brier Score: {overall_avg_brier:.4f}" if overall_avg_brier else "   Overall Average Brier Score: N/A")
         print(f"   Sum of All Brier Scores: {sum_brier_scores:.4f}" if sum_brier_scores else "   Sum of All Brier Scores: N/A")
+        print(f"   Total searches: {total_searches}")
+        print(f"   Search penalty: {avg_search_penalty:.4f}")
+        print(f"   LLM calls saved by early stopping: {total_llm_calls_saved}")
         print(f"   Duration: {duration:.1f}s ({summary['questions_per_minute']:.1f} questions/minute)")
         print(f"   📁 Master log: {master_log_file}")
         print(f"   📁 Individual logs: {self.logs_dir}/question_*_{run_timestamp}.json")
@@ -741,49 +842,68 @@ class EnhancedForecastBenchRunner:
             else:
                 print(f"   {horizon}-day Brier Score: N/A (no resolutions)")
         
-        # Save final results to checkpoint
-        self.save_checkpoint({
-            'run_timestamp': run_timestamp,
-            'results': results
-        }, checkpoint_file)
+        # Compact the journal into the final checkpoint snapshot
+        self.save_checkpoint(checkpoint_store)
         
         return summary
     
-    def save_checkpoint(self, checkpoint_data: Dict, checkpoint_file: Path):
-        """Save checkpoint data to file"""
+    def save_question_log(self, log_file: Path, log_data: Dict):
+        """Save the per-question log (predictions and search accounting)"""
         try:
-            with open(checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2, default=str)
-            print(f"💾 Checkpoint saved: {checkpoint_file}")
+            with open(log_file, 'w') as f:
+                json.dump(log_data, f, indent=2, default=str)
         except Exception as e:
-            print(f"❌ Failed to save checkpoint: {e}")
+            print(f"⚠️ Failed to save question log {log_file}: {e}")
     
-    def load_checkpoint(self, checkpoint_file: Path) -> Dict:
-        """Load checkpoint data from file"""
+    def save_checkpoint(self, checkpoint_store: CheckpointStore, result: Dict = None, **header_fields):
+        """Journal a finished question's result, or compact the whole checkpoint into its snapshot when no result is given"""
         try:
-            if checkpoint_file.exists():
-                with open(checkpoint_file, 'r') as f:
-                    checkpoint_data = json.load(f)
-                print(f"📂 Checkpoint loaded: {checkpoint_file}")
-                return checkpoint_data
+            if result is None:
+                checkpoint_store.compact()
             else:
-                print("📄 No checkpoint file found, starting fresh")
-                return {}
+                checkpoint_store.append(result, **header_fields)
+        except Exception as e:
+            print(f"❌ Failed to save checkpoint: {e}")
+    
+    def open_checkpoint(self, checkpoint_file: Path) -> Tuple[CheckpointStore, Dict]:
+        """Open a run's checkpoint store and replay its snapshot + journal (empty data when there is nothing to resume)"""
+        checkpoint_store = CheckpointStore(checkpoint_file)
+        try:
+            if checkpoint_file.exists() or checkpoint_store.journal_path.exists():
+                return checkpoint_store, checkpoint_store.load()
+            print("📄 No checkpoint file found, starting fresh")
         except Exception as e:
             print(f"❌ Failed to load checkpoint: {e}")
-            return {}
+            checkpoint_store = CheckpointStore(checkpoint_file)
+        return checkpoint_store, {}
     
     def get_checkpoint_file(self, run_timestamp: str) -> Path:
         """Get the checkpoint file path for a run"""
         return self.checkpoints_dir / f"benchmark_checkpoint_{run_timestamp}.json"
     
+    def run_native_evaluation(self, max_questions: int = 200, question_ids: List[str] = None,
+                              max_samples: int = None, max_connections: int = None) -> Dict[str, Any]:
+        """Run every question as a sample of one async Inspect AI eval, scored by the forecastbench scorer
+        
+        Inspect AI schedules the debates (bounded by max_samples and max_connections) instead of the thread pool
+        """
+        superforecaster = self.get_worker_forecaster()
+        return asyncio.run(superforecaster.run_native_evaluation(
+            questions_file=self.QUESTIONS_FILE,
+            resolutions_file=self.RESOLUTIONS_FILE,
+            max_questions=max_questions,
+            question_ids=question_ids,
+            max_samples=max_samples,
+            max_connections=max_connections
+        ))
+    
     def find_latest_checkpoint(self) -> Path:
-        """Find the most recent checkpoint file"""
-        checkpoint_files = list(self.checkpoints_dir.glob("benchmark_checkpoint_*.json"))
-        if checkpoint_files:
-            # Sort by modification time and return the latest
-            latest = max(checkpoint_files, key=lambda f: f.stat().st_mtime)
-            print(f"🔍 Found latest checkpoint: {latest}")
+        """Find the most recent checkpoint file (by the run timestamp in its name; progress comes from its manifest)"""
+        checkpoints = list_checkpoints(self.checkpoints_dir, "benchmark_checkpoint_*.json")
+        if checkpoints:
+            latest, manifest = checkpoints[0]['snapshot'], checkpoints[0]['manifest']
+            progress = f" ({manifest.get('completed_count', 0)}/{manifest.get('total_questions', 0)} questions completed)" if manifest else ""
+            print(f"🔍 Found latest checkpoint: {latest}{progress}")
             return latest
         return None
 
@@ -796,13 +916,33 @@ def main():
     parser.add_argument('--max-questions', type=int, default=200, help='Maximum number of questions to process')
     parser.add_argument('--max-workers', type=int, default=20, help='Maximum number of parallel workers')
     parser.add_argument('--resume', type=str, help='Resume from checkpoint file (use "latest" for most recent)')
+    parser.add_argument('--retry-failed', action='store_true', help='When resuming, run questions whose checkpointed result failed again')
     parser.add_argument('--list-checkpoints', action='store_true', help='List available checkpoints and exit')
     parser.add_argument('--question-ids', type=str, nargs='+', help='Specific question IDs to test (space-separated)')
     parser.add_argument('--failure-questions', action='store_true', help='Test only questions from failure.txt (excludes YulPWDHFTUkekmrO3v4J)')
     parser.add_argument('--seed', type=int, help='Random seed for reproducible results')
+    parser.add_argument('--search-mode', type=str, choices=['live', 'record', 'replay'], help='Google News search mode: live SERP calls, record them to a corpus, or replay a recorded corpus offline')
+    parser.add_argument('--search-corpus', type=str, help='Path of the recorded search corpus (default: cache/google_news/search_corpus.jsonl)')
+    parser.add_argument('--prefetch-searches', action='store_true', help='Warm the search cache with likely queries for every question before the debates start')
+    parser.add_argument('--prefetch-concurrency', type=int, default=8, help='Maximum concurrent searches during the prefetch phase')
+    parser.add_argument('--batch', action='store_true', help='Forecast all questions in a single Inspect AI eval (one sample per question) instead of one eval per question')
+    parser.add_argument('--concurrent-rebuttals', action='store_true', help="Generate both advocates' rebuttals in each debate round concurrently")
+    parser.add_argument('--convergence-threshold', type=float, help='Skip remaining debate rounds once the advocates\' probabilities for every horizon are within this distance (e.g. 0.1)')
+    parser.add_argument('--compact-transcripts', action='store_true', help="Compact earlier debate rounds to each advocate's structured JSON before later rounds and the judge")
+    parser.add_argument('--no-prompt-cache', action='store_true', help="Don't mark debate prompts for provider-side prompt caching")
+    parser.add_argument('--native-eval', action='store_true', help='Run the native async Inspect AI evaluation (dataset + forecastbench scorer with per-horizon Brier metrics)')
+    parser.add_argument('--max-samples', type=int, help='Maximum debates running at once in the batched or native eval')
+    parser.add_argument('--max-connections', type=int, help='Maximum concurrent model connections in the batched or native eval')
     
     args = parser.parse_args()
     
+    # Search mode settings are read by every Google News tool instance
+    if args.search_mode:
+        os.environ["GOOGLE_NEWS_SEARCH_MODE"] = args.search_mode
+    if args.search_corpus:
+        os.environ["GOOGLE_NEWS_CORPUS"] = args.search_corpus
+    replay_searches = os.getenv("GOOGLE_NEWS_SEARCH_MODE", "live").lower() == "replay"
+    
     # Get API keys
     openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
     serp_api_key = os.getenv('SERP_API_KEY')
@@ -811,8 +951,8 @@ def main():
         print("❌ OPENROUTER_API_KEY environment variable required")
         return
     
-    if not serp_api_key:
-        print("❌ SERP_API_KEY environment variable required")
+    if not serp_api_key and not replay_searches:
+        print("❌ SERP_API_KEY environment variable required (or use --search-mode replay)")
         return
     
     # Set random seed if provided
@@ -827,26 +967,28 @@ def main():
     # Create runner
     runner = EnhancedForecastBenchRunner(
         openrouter_api_key=openrouter_api_key,
-        serp_api_key=serp_api_key
+        serp_api_key=serp_api_key,
+        concurrent_rebuttals=args.concurrent_rebuttals,
+        convergence_threshold=args.convergence_threshold,
+        compact_transcripts=args.compact_transcripts,
+        cache_prompt=not args.no_prompt_cache
     )
     
     # Handle checkpoint listing
     if args.list_checkpoints:
         checkpoints_dir = Path("checkpoints")
         if checkpoints_dir.exists():
-            checkpoint_files = list(checkpoints_dir.glob("benchmark_checkpoint_*.json"))
-            if checkpoint_files:
+            # Progress comes from each run's small manifest; only runs without one have their checkpoint read (once)
+            checkpoints = list_checkpoints(checkpoints_dir, "benchmark_checkpoint_*.json")
+            if checkpoints:
                 print("📋 Available checkpoints:")
-                for checkpoint_file in sorted(checkpoint_files, key=lambda f: f.stat().st_mtime, reverse=True):
-                    try:
-                        with open(checkpoint_file, 'r') as f:
-                            data = json.load(f)
-                        completed = data.get('completed_count', 0)
-                        total = data.get('total_questions', 0)
-                        timestamp = data.get('run_timestamp', 'unknown')
-                        print(f"   {checkpoint_file.name}: {completed}/{total} questions completed (run: {timestamp})")
-                    except Exception as e:
-                        print(f"   {checkpoint_file.name}: Error reading checkpoint - {e}")
+                for checkpoint in checkpoints:
+                    manifest = checkpoint['manifest']
+                    if manifest:
+                        print(f"   {checkpoint['snapshot'].name}: {manifest.get('completed_count', 0)}/{manifest.get('total_questions', 0)} "
+                              f"questions completed, {manifest.get('failed_count', 0)} failed (run: {manifest.get('run_timestamp', 'unknown')})")
+                    else:
+                        print(f"   {checkpoint['snapshot'].name}: progress unavailable (checkpoint could not be read)")
             else:
                 print("📋 No checkpoints found")
         else:
@@ -866,6 +1008,25 @@ def main():
         question_ids_to_run = args.question_ids
         print(f"🎯 Testing {len(question_ids_to_run)} specific question IDs: {question_ids_to_run}")
     
+    if args.native_eval:
+        print(f"🚀 Starting native Inspect AI evaluation with {args.max_questions} questions")
+        results = runner.run_native_evaluation(
+            max_questions=args.max_questions,
+            question_ids=question_ids_to_run,
+            max_samples=args.max_samples,
+            max_connections=args.max_connections
+        )
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = runner.results_dir / f"native_eval_results_{timestamp}.json"
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"📊 Results saved to: {output_file}")
+        
+        for horizon_key, horizon_stats in results.get('results_by_horizon', {}).items():
+            print(f"   {horizon_key}: mean Brier {horizon_stats['mean_brier_score']:.4f} ({horizon_stats['sample_count']} samples)")
+        return
+    
     print(f"🚀 Starting benchmark with {args.max_questions} questions and {args.max_workers} workers")
     if args.resume:
         print(f"🔄 Will attempt to resume from checkpoint: {args.resume}")
@@ -877,7 +1038,13 @@ def main():
         max_questions=args.max_questions, 
         max_workers=args.max_workers,
         resume_from_checkpoint=args.resume,
-        question_ids=question_ids_to_run
+        question_ids=question_ids_to_run,
+        prefetch=args.prefetch_searches,
+        prefetch_concurrency=args.prefetch_concurrency,
+        batch=args.batch,
+        max_samples=args.max_samples,
+        max_connections=args.max_connections,
+        retry_failed=args.retry_failed
     )
     
     # Save results
@@ -11,6 +11,7 @@ import os
 import sys
 import argparse
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -34,6 +35,9 @@ sys.path.append('src')
 
 # Import the simplified superforecaster
 from ai_forecasts.agents.simplified_inspect_ai_superforecaster import create_superforecaster
+from ai_forecasts.utils.search_budget import SearchBudgetLedger
+from ai_forecasts.utils.search_prefetch import prefetch_searches
+from ai_forecasts.utils.resolution_index import ResolutionIndex, load_resolution_index
 
 def extract_question_ids_from_failure_file(file_path: str = "failure.txt") -> List[str]:
     """Return a deterministic list of question IDs from the top 10 most incorrect predictions"""
@@ -63,7 +67,11 @@ class SimplifiedForecastBenchRunner:
                  time_horizons: List[int] = None, 
                  search_budget_per_advocate: int = 10,
                  debate_rounds: int = 3,
-                 training_cutoff: str = "2024-07-01"):
+                 training_cutoff: str = "2024-07-01",
+                 concurrent_rebuttals: bool = False,
+                 convergence_threshold: float = None,
+                 compact_transcripts: bool = False,
+                 cache_prompt: bool = True):
         """
         Initialize runner with configurable parameters
         
@@ -74,6 +82,10 @@ class SimplifiedForecastBenchRunner:
             search_budget_per_advocate: Number of searches per advocate
             debate_rounds: Number of debate rounds
             training_cutoff: Model training cutoff date
+            concurrent_rebuttals: Generate both advocates' rebuttals in each round concurrently
+            convergence_threshold: Skip remaining rounds once the advocates' probabilities agree within this distance
+            compact_transcripts: Compact earlier rounds to the advocates' structured JSON before later rounds
+            cache_prompt: Mark debate prompts for provider-side prompt caching
         """
         self.openrouter_api_key = openrouter_api_key
         self.serp_api_key = serp_api_key
@@ -81,6 +93,16 @@ class SimplifiedForecastBenchRunner:
         self.search_budget_per_advocate = search_budget_per_advocate
         self.debate_rounds = debate_rounds
         self.training_cutoff = training_cutoff
+        self.concurrent_rebuttals = concurrent_rebuttals
+        self.convergence_threshold = convergence_threshold
+        self.compact_transcripts = compact_transcripts
+        self.cache_prompt = cache_prompt
+        
+        # One search ledger per run, shared by every worker's forecaster
+        self.search_ledger = SearchBudgetLedger(budget_per_role=search_budget_per_advocate)
+        
+        # Each worker thread keeps one long-lived forecaster (model client, news tool, SERP client)
+        self._worker_state = threading.local()
         
         # Create directories
         self.logs_dir = Path("logs")
@@ -95,41 +117,34 @@ class SimplifiedForecastBenchRunner:
         print(f"   Search budget per advocate: {self.search_budget_per_advocate}")
         print(f"   Debate rounds: {self.debate_rounds}")
         print(f"   Training cutoff: {self.training_cutoff}")
+        print(f"   Concurrent rebuttals: {self.concurrent_rebuttals}")
     
-    def load_local_data(self) -> Tuple[List[Dict], Dict[str, Any], str]:
-        """Load questions and resolutions from local JSON files"""
+    def load_local_data(self) -> Tuple[List[Dict], ResolutionIndex, str]:
+        """Load questions and the (question id, resolution date) resolution index from local JSON files"""
         try:
             # Load questions
             with open(self.QUESTIONS_FILE, 'r') as f:
                 questions_data = json.load(f)
             
-            # Load resolutions
-            with open(self.RESOLUTIONS_FILE, 'r') as f:
-                resolutions_data = json.load(f)
+            # Load resolutions once into a hash index
+            resolution_index = load_resolution_index(self.RESOLUTIONS_FILE)
             
             questions = questions_data['questions']
             forecast_due_date = questions_data.get('forecast_due_date', '2024-07-21')
             
             print(f"✅ Loaded {len(questions)} questions from local file")
-            print(f"✅ Loaded {len(resolutions_data['resolutions'])} resolutions from local file")
+            print(f"✅ Indexed {len(resolution_index)} resolved (question, date) pairs from local file")
             print(f"✅ Forecast due date: {forecast_due_date}")
             
-            return questions, resolutions_data, forecast_due_date
+            return questions, resolution_index, forecast_due_date
             
         except Exception as e:
             print(f"❌ Error loading local data: {e}")
-            return [], {}, "2024-07-21"
+            return [], None, "2024-07-21"
     
-    def get_resolution_for_question_and_date(self, question_id: str, resolution_date: str, resolutions_data: Dict) -> float:
+    def get_resolution_for_question_and_date(self, question_id: str, resolution_date: str, resolution_index: ResolutionIndex) -> float:
         """Get the resolution value for a specific question ID and date"""
-        if 'resolutions' not in resolutions_data:
-            return None
-            
-        for resolution in resolutions_data['resolutions']:
-            if (resolution['id'] == question_id and 
-                resolution['resolution_date'] == resolution_date):
-                return resolution['resolved_to']
-        return None
+        return resolution_index.get(question_id, resolution_date)
     
     def create_comprehensive_context(self, question_data: Dict) -> str:
         """Create comprehensive context from all available question information"""
@@ -188,7 +203,19 @@ class SimplifiedForecastBenchRunner:
         
         return "\n\n".join(context_parts)
     
-    def process_single_question(self, question_data: Dict, question_idx: int, resolutions_data: Dict, 
+    def get_worker_forecaster(self):
+        """Long-lived superforecaster for the current worker thread, created on first use"""
+        superforecaster = getattr(self._worker_state, 'superforecaster', None)
+        if superforecaster is None:
+            superforecaster = create_superforecaster(
+                openrouter_api_key=self.openrouter_api_key,
+                serp_api_key=self.serp_api_key
+            )
+            self._worker_state.superforecaster = superforecaster
+            print(f"🧵 Created superforecaster for worker {threading.current_thread().name}")
+        return superforecaster
+    
+    def process_single_question(self, question_data: Dict, question_idx: int, resolution_index: ResolutionIndex, 
                               base_date: datetime, forecast_due_date: str, run_timestamp: str) -> Dict:
         """Process a single question with configurable time horizon predictions"""
         try:
@@ -201,11 +228,8 @@ class SimplifiedForecastBenchRunner:
             print(f"Processing question {question_idx + 1}: {question[:80]}...")
             print(f"Comprehensive context length: {len(comprehensive_context)} characters")
             
-            # Initialize superforecaster with all configuration parameters
-            superforecaster = create_superforecaster(
-                openrouter_api_key=self.openrouter_api_key,
-                serp_api_key=self.serp_api_key
-            )
+            # Reuse this worker thread's superforecaster; configuration is passed per call
+            superforecaster = self.get_worker_forecaster()
             
             # Calculate resolution dates for all time horizons
             resolution_dates = []
@@ -221,6 +245,7 @@ class SimplifiedForecastBenchRunner:
             # Convert time horizons to strings for the superforecaster
             time_horizons_str = [str(h) for h in self.time_horizons]
             
+            horizon_results = []
             try:
                 # Call the simplified superforecaster with all parameters
                 horizon_results = superforecaster.forecast_with_google_news(
@@ -230,7 +255,13 @@ class SimplifiedForecastBenchRunner:
                     cutoff_date=cutoff_date,
                     search_budget_per_advocate=self.search_budget_per_advocate,
                     debate_rounds=self.debate_rounds,
-                    training_cutoff=self.training_cutoff
+                    training_cutoff=self.training_cutoff,
+                    search_ledger=self.search_ledger,
+                    question_id=question_id,
+                    concurrent_rebuttals=self.concurrent_rebuttals,
+                    convergence_threshold=self.convergence_threshold,
+                    compact_transcripts=self.compact_transcripts,
+                    cache_prompt=self.cache_prompt
                 )
                 
                 print(f"  ✅ Multi-horizon forecast completed: {len(horizon_results)} predictions")
@@ -247,7 +278,7 @@ class SimplifiedForecastBenchRunner:
                     predictions[horizon_key] = result.prediction
                     
                     # Get actual resolution value
-                    actual_value = self.get_resolution_for_question_and_date(question_id, resolution_date, resolutions_data)
+                    actual_value = self.get_resolution_for_question_and_date(question_id, resolution_date, resolution_index)
                     actual_values[horizon_key] = actual_value
                     
                     # Calculate Brier score if we have actual value
@@ -282,6 +313,11 @@ class SimplifiedForecastBenchRunner:
                 'predictions': predictions,
                 'brier_scores': brier_scores,
                 'actual_values': actual_values,
+                'search_count': self.search_ledger.used(question_id),
+                'searches_by_role': self.search_ledger.searches_by_role(question_id),
+                'search_penalty': self.search_ledger.search_penalty(question_id),
+                'debate_rounds_completed': getattr(horizon_results[0], 'debate_rounds_completed', 0) if horizon_results else 0,
+                'llm_calls_saved': getattr(horizon_results[0], 'llm_calls_saved', 0) if horizon_results else 0,
                 'success': True
             }
             
@@ -298,7 +334,8 @@ class SimplifiedForecastBenchRunner:
             }
     
     def run_parallel_benchmark(self, max_questions: int = 200, max_workers: int = 3, 
-                             question_ids: List[str] = None) -> Dict[str, Any]:
+                             question_ids: List[str] = None, prefetch: bool = False,
+                             prefetch_concurrency: int = 8) -> Dict[str, Any]:
         """Run simplified ForecastBench evaluation with configurable parameters"""
         
         run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -311,11 +348,11 @@ class SimplifiedForecastBenchRunner:
         print(f"   Training cutoff: {self.training_cutoff}")
         
         # Load questions and resolutions
-        questions, resolutions_data, forecast_due_date = self.load_local_data()
+        questions, resolution_index, forecast_due_date = self.load_local_data()
         if not questions:
             return {"error": "Failed to load ForecastBench questions"}
             
-        if not resolutions_data:
+        if resolution_index is None:
             return {"error": "Failed to load resolution data"}
         
         # Filter questions by question IDs if specified
@@ -354,6 +391,17 @@ class SimplifiedForecastBenchRunner:
         base_date = datetime(2024, 7, 21)
         print(f"📅 Using base date: {base_date.strftime('%Y-%m-%d')}")
         
+        # Optional warm-up: bulk-fill the search cache so debate tool calls become cache hits
+        prefetch_summary = None
+        if prefetch and questions:
+            prefetch_summary = prefetch_searches(
+                questions,
+                cutoff_date=forecast_due_date,
+                serp_api_key=self.serp_api_key,
+                max_concurrency=prefetch_concurrency,
+                search_ledger=self.search_ledger
+            )
+        
         results = []
         start_time = datetime.now()
         
@@ -365,7 +413,7 @@ class SimplifiedForecastBenchRunner:
                     self.process_single_question, 
                     question_data, 
                     idx, 
-                    resolutions_data, 
+                    resolution_index, 
                     base_date, 
                     forecast_due_date, 
                     run_timestamp
@@ -431,12 +479,23 @@ class SimplifiedForecastBenchRunner:
         total_brier_scores = len(all_brier_scores)
         overall_avg_brier = statistics.mean(all_brier_scores) if all_brier_scores else None
         
+        # Search accounting (per-question counts come from the run's search ledger)
+        total_searches = sum(r.get('search_count', 0) for r in successful_results)
+        avg_search_penalty = statistics.mean([r.get('search_penalty', 0.0) for r in successful_results]) if successful_results else 0.0
+        
+        # Rebuttal turns skipped because the advocates converged early
+        total_llm_calls_saved = sum(r.get('llm_calls_saved', 0) for r in successful_results)
+        
         summary = {
             'configuration': {
                 'time_horizons': self.time_horizons,
                 'search_budget_per_advocate': self.search_budget_per_advocate,
                 'debate_rounds': self.debate_rounds,
-                'training_cutoff': self.training_cutoff
+                'training_cutoff': self.training_cutoff,
+                'concurrent_rebuttals': self.concurrent_rebuttals,
+                'convergence_threshold': self.convergence_threshold,
+                'compact_transcripts': self.compact_transcripts,
+                'cache_prompt': self.cache_prompt
             },
             'base_date': base_date.strftime("%Y-%m-%d"),
             'forecast_due_date': forecast_due_date,
@@ -449,6 +508,10 @@ class SimplifiedForecastBenchRunner:
             'total_brier_scores': total_brier_scores,
             'overall_avg_brier_score': overall_avg_brier,
             'horizon_statistics': horizon_stats,
+            'total_searches': total_searches,
+            'search_penalty': avg_search_penalty,
+            'llm_calls_saved': total_llm_calls_saved,
+            'prefetch': prefetch_summary,
             'run_timestamp': run_timestamp,
             'results': results
         }
@@ -460,6 +523,9 @@ class SimplifiedForecastBenchRunner:
         print(f"   Total Brier scores: {total_brier_scores}")
         if overall_avg_brier is not None:
             print(f"   Overall Average Brier Score: {overall_avg_brier:.4f}")
+        print(f"   Total searches: {total_searches}")
+        print(f"   Search penalty: {avg_search_penalty:.4f}")
+        print(f"   LLM calls saved by early stopping: {total_llm_calls_saved}")
         print(f"   Duration: {duration:.1f}s ({summary['questions_per_minute']:.1f} questions/minute)")
         
         # Log Brier scores by time horizon
@@ -486,9 +552,24 @@ def main():
     parser.add_argument('--search-budget', type=int, default=10, help='Search budget per advocate')
     parser.add_argument('--debate-rounds', type=int, default=3, help='Number of debate rounds')
     parser.add_argument('--training-cutoff', type=str, default='2024-07-01', help='Model training cutoff date')
+    parser.add_argument('--convergence-threshold', type=float, help='Skip remaining debate rounds once the advocates\' probabilities for every horizon are within this distance (e.g. 0.1)')
+    parser.add_argument('--compact-transcripts', action='store_true', help="Compact earlier debate rounds to each advocate's structured JSON before later rounds and the judge")
+    parser.add_argument('--no-prompt-cache', action='store_true', help="Don't mark debate prompts for provider-side prompt caching")
+    parser.add_argument('--concurrent-rebuttals', action='store_true', help="Generate both advocates' rebuttals in each debate round concurrently")
+    parser.add_argument('--search-mode', type=str, choices=['live', 'record', 'replay'], help='Google News search mode: live SERP calls, record them to a corpus, or replay a recorded corpus offline')
+    parser.add_argument('--search-corpus', type=str, help='Path of the recorded search corpus (default: cache/google_news/search_corpus.jsonl)')
+    parser.add_argument('--prefetch-searches', action='store_true', help='Warm the search cache with likely queries for every question before the debates start')
+    parser.add_argument('--prefetch-concurrency', type=int, default=8, help='Maximum concurrent searches during the prefetch phase')
     
     args = parser.parse_args()
     
+    # Search mode settings are read by every Google News tool instance
+    if args.search_mode:
+        os.environ["GOOGLE_NEWS_SEARCH_MODE"] = args.search_mode
+    if args.search_corpus:
+        os.environ["GOOGLE_NEWS_CORPUS"] = args.search_corpus
+    replay_searches = os.getenv("GOOGLE_NEWS_SEARCH_MODE", "live").lower() == "replay"
+    
     # Get API keys
     openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
     serp_api_key = os.getenv('SERP_API_KEY')
@@ -497,8 +578,8 @@ def main():
         print("❌ OPENROUTER_API_KEY environment variable required")
         return
     
-    if not serp_api_key:
-        print("❌ SERP_API_KEY environment variable required")
+    if not serp_api_key and not replay_searches:
+        print("❌ SERP_API_KEY environment variable required (or use --search-mode replay)")
         return
     
     # Handle question ID filtering
@@ -521,7 +602,11 @@ def main():
         time_horizons=args.time_horizons,
         search_budget_per_advocate=args.search_budget,
         debate_rounds=args.debate_rounds,
-        training_cutoff=args.training_cutoff
+        training_cutoff=args.training_cutoff,
+        concurrent_rebuttals=args.concurrent_rebuttals,
+        convergence_threshold=args.convergence_threshold,
+        compact_transcripts=args.compact_transcripts,
+        cache_prompt=not args.no_prompt_cache
     )
     
     print(f"🚀 Starting benchmark with configurable parameters:")
@@ -539,7 +624,9 @@ def main():
     results = runner.run_parallel_benchmark(
         max_questions=args.max_questions, 
         max_workers=args.max_workers,
-        question_ids=question_ids_to_run
+        question_ids=question_ids_to_run,
+        prefetch=args.prefetch_searches,
+        prefetch_concurrency=args.prefetch_concurrency
     )
     
     # Save results
@@ -2,11 +2,15 @@
 Debate-Based Forecasting Prompts
 Research-backed adversarial forecasting system using structured debate methodology
 Based on techniques from Tetlock, adversarial collaboration, and structured analytic techniques
+Builders are memoized: backstories are identical for every question and round,
+and a question's task descriptions repeat for each of its horizons
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 from pydantic import BaseModel
 
+@lru_cache(maxsize=None)
 def get_high_advocate_backstory() -> str:
     """Ultra-calibrated iteration 5 backstory for High Probability Advocate"""
     return """You are an ULTRA-CALIBRATED superforecaster and High Probability Advocate. Your mission is to achieve EXCEPTIONAL calibration (Brier score < 0.06) through extreme precision in probability estimation.
@@ -67,6 +71,7 @@ OUTPUT REQUIREMENTS:
 
 Your goal is EXCEPTIONAL CALIBRATION through extreme precision and systematic uncertainty quantification."""
 
+@lru_cache(maxsize=None)
 def get_low_advocate_backstory() -> str:
     """Ultra-calibrated iteration 5 backstory for Low Probability Advocate"""
     return """You are an ULTRA-CALIBRATED superforecaster and Low Probability Advocate. Your mission is to achieve EXCEPTIONAL calibration (Brier score < 0.06) through extreme precision in probability estimation.
@@ -127,6 +132,7 @@ OUTPUT REQUIREMENTS:
 
 Your goal is EXCEPTIONAL CALIBRATION through extreme skeptical precision and systematic failure analysis."""
 
+@lru_cache(maxsize=None)
 def get_debate_judge_backstory() -> str:
     """Ultra-calibrated iteration 5 backstory for Debate Judge"""
     return """You are an ULTRA-CALIBRATED superforecaster and Debate Judge (Iteration 5). Your mission is to achieve EXCEPTIONAL calibration (Brier score < 0.06) through extreme precision in probability synthesis.
@@ -195,12 +201,90 @@ OUTPUT REQUIREMENTS:
 
 Your goal is EXCEPTIONAL CALIBRATION through extreme precision in synthesis and systematic uncertainty quantification."""
 
+# JSON output samples appended to the task descriptions (both advocates share one)
+ADVOCATE_JSON_SAMPLE = '''
+**SAMPLE JSON OUTPUT FORMAT:**
+```json
+{
+  "position_statement": "[str]",
+  "target_probability_range": "xx%-yy%",
+  "key_arguments": [
+    {
+      "argument_summary": "[str]",
+      "supporting_evidence": [
+        {
+          "evidence_description": "[str]",
+          "source_credibility": "[str]",
+          "evidence_strength": "[str]",
+          "evidence_type": "[str]",
+          "temporal_relevance": "[str]"
+        }
+      ],
+      "base_rate_analysis": {
+        "reference_class": "[str]",
+        "historical_frequency": [num],
+        "sample_size": [num],
+        "relevance_to_current_case": "[str]",
+        "adjustment_factors": ["[str]", "[str]"]
+      },
+      "confidence_level": "[str]",
+      "potential_weaknesses": ["[str]", "[str]"]
+    }
+  ],
+  "most_compelling_evidence": "[str]",
+  "base_rate_justification": "[str]",
+  "time_horizon_analysis": "[str]",
+  "rebuttal_preparation": ["[str]", "[str]"]
+}
+```
+'''
+
+JUDGE_JSON_SAMPLE = '''
+**SAMPLE JSON OUTPUT FORMAT:**
+```json
+{
+  "final_probability": [num],
+  "confidence_level": "[str]",
+  "high_advocate_evaluation": {
+    "argument_strength": [num],
+    "evidence_quality": [num],
+    "logical_consistency": [num],
+    "bias_detection": ["[str]", "[str]"],
+    "key_strengths": ["[str]", "[str]"],
+    "key_weaknesses": ["[str]", "[str]"]
+  },
+  "low_advocate_evaluation": {
+    "argument_strength": [num],
+    "evidence_quality": [num],
+    "logical_consistency": [num],
+    "bias_detection": ["[str]", "[str]"],
+    "key_strengths": ["[str]", "[str]"],
+    "key_weaknesses": ["[str]", "[str]"]
+  },
+  "synthesis_reasoning": "[str]",
+  "evidence_weighting_rationale": "[str]",
+  "uncertainty_factors": ["[str]", "[str]"],
+  "decision_rationale": "[str]",
+  "calibration_check": "[str]"
+}
+```
+'''
+
 def get_high_advocate_task_description(question: str, search_timeframe: Dict, cutoff_date: str,
                                      search_strategy: str, query_limit: str, article_target: str,
                                      background: str = "", comprehensive_context: str = "",
                                      total_rounds: int = 3, search_budget_per_advocate: int = 10,
                                      searches_used_so_far: int = 0) -> str:
     """Task description for the High Probability Advocate"""
+    return _high_advocate_task_description(
+        question, search_timeframe['start'], search_timeframe['end'], cutoff_date,
+        search_strategy, query_limit, article_target, background, comprehensive_context
+    )
+
+@lru_cache(maxsize=256)
+def _high_advocate_task_description(question: str, search_start: str, search_end: str, cutoff_date: str,
+                                    search_strategy: str, query_limit: str, article_target: str,
+                                    background: str, comprehensive_context: str) -> str:
     
     context_section = ""
     if comprehensive_context:
@@ -219,7 +303,7 @@ MISSION: Build the strongest possible case for a HIGH probability outcome for th
 
 **Question:** {question}
 **Current Date:** {cutoff_date}
-**Search Period:** {search_timeframe['start']} to {search_timeframe['end']}
+**Search Period:** {search_start} to {search_end}
 **Search Strategy:** {search_strategy} ({query_limit}, {article_target})
 {context_section}
 
@@ -259,50 +343,22 @@ MISSION: Build the strongest possible case for a HIGH probability outcome for th
 
 **OUTPUT:** Provide ONLY the JSON output following the `HighAdvocateOutput` structure.
 """
-
-    json_sample = '''
-**SAMPLE JSON OUTPUT FORMAT:**
-```json
-{
-  "position_statement": "[str]",
-  "target_probability_range": "xx%-yy%",
-  "key_arguments": [
-    {
-      "argument_summary": "[str]",
-      "supporting_evidence": [
-        {
-          "evidence_description": "[str]",
-          "source_credibility": "[str]",
-          "evidence_strength": "[str]",
-          "evidence_type": "[str]",
-          "temporal_relevance": "[str]"
-        }
-      ],
-      "base_rate_analysis": {
-        "reference_class": "[str]",
-        "historical_frequency": [num],
-        "sample_size": [num],
-        "relevance_to_current_case": "[str]",
-        "adjustment_factors": ["[str]", "[str]"]
-      },
-      "confidence_level": "[str]",
-      "potential_weaknesses": ["[str]", "[str]"]
-    }
-  ],
-  "most_compelling_evidence": "[str]",
-  "base_rate_justification": "[str]",
-  "time_horizon_analysis": "[str]",
-  "rebuttal_preparation": ["[str]", "[str]"]
-}
-```
-'''
     
-    return base_description + json_sample
+    return base_description + ADVOCATE_JSON_SAMPLE
 
 def get_low_advocate_task_description(question: str, search_timeframe: Dict, cutoff_date: str,
                                     search_strategy: str, query_limit: str, article_target: str,
                                     background: str = "", comprehensive_context: str = "") -> str:
     """Task description for the Low Probability Advocate"""
+    return _low_advocate_task_description(
+        question, search_timeframe['start'], search_timeframe['end'], cutoff_date,
+        search_strategy, query_limit, article_target, background, comprehensive_context
+    )
+
+@lru_cache(maxsize=256)
+def _low_advocate_task_description(question: str, search_start: str, search_end: str, cutoff_date: str,
+                                   search_strategy: str, query_limit: str, article_target: str,
+                                   background: str, comprehensive_context: str) -> str:
     
     context_section = ""
     if comprehensive_context:
@@ -321,7 +377,7 @@ MISSION: Build the strongest possible case for a LOW probability outcome for thi
 
 **Question:** {question}
 **Current Date:** {cutoff_date}
-**Search Period:** {search_timeframe['start']} to {search_timeframe['end']}
+**Search Period:** {search_start} to {search_end}
 **Search Strategy:** {search_strategy} ({query_limit}, {article_target})
 {context_section}
 
@@ -362,45 +418,9 @@ MISSION: Build the strongest possible case for a LOW probability outcome for thi
 **OUTPUT:** Provide ONLY the JSON output following the `LowAdvocateOutput` structure.
 """
 
-    json_sample = '''
-**SAMPLE JSON OUTPUT FORMAT:**
-```json
-{
-  "position_statement": "[str]",
-  "target_probability_range": "xx%-yy%",
-  "key_arguments": [
-    {
-      "argument_summary": "[str]",
-      "supporting_evidence": [
-        {
-          "evidence_description": "[str]",
-          "source_credibility": "[str]",
-          "evidence_strength": "[str]",
-          "evidence_type": "[str]",
-          "temporal_relevance": "[str]"
-        }
-      ],
-      "base_rate_analysis": {
-        "reference_class": "[str]",
-        "historical_frequency": [num],
-        "sample_size": [num],
-        "relevance_to_current_case": "[str]",
-        "adjustment_factors": ["[str]", "[str]"]
-      },
-      "confidence_level": "[str]",
-      "potential_weaknesses": ["[str]", "[str]"]
-    }
-  ],
-  "most_compelling_evidence": "[str]",
-  "base_rate_justification": "[str]",
-  "time_horizon_analysis": "[str]",
-  "rebuttal_preparation": ["[str]", "[str]"]
-}
-```
-'''
-
-    return base_description + json_sample
+    return base_description + ADVOCATE_JSON_SAMPLE
 
+@lru_cache(maxsize=256)
 def get_debate_judge_task_description(question: str, cutoff_date: str, time_horizon: str,
                                     comprehensive_context: str = "") -> str:
     """Task description for the Debate Judge"""
@@ -460,35 +480,4 @@ MISSION: Evaluate the competing arguments and synthesize them into a well-calibr
 **OUTPUT:** Provide ONLY the JSON output following the `DebateJudgmentOutput` structure.
 """
 
-    json_sample = '''
-**SAMPLE JSON OUTPUT FORMAT:**
-```json
-{
-  "final_probability": [num],
-  "confidence_level": "[str]",
-  "high_advocate_evaluation": {
-    "argument_strength": [num],
-    "evidence_quality": [num],
-    "logical_consistency": [num],
-    "bias_detection": ["[str]", "[str]"],
-    "key_strengths": ["[str]", "[str]"],
-    "key_weaknesses": ["[str]", "[str]"]
-  },
-  "low_advocate_evaluation": {
-    "argument_strength": [num],
-    "evidence_quality": [num],
-    "logical_consistency": [num],
-    "bias_detection": ["[str]", "[str]"],
-    "key_strengths": ["[str]", "[str]"],
-    "key_weaknesses": ["[str]", "[str]"]
-  },
-  "synthesis_reasoning": "[str]",
-  "evidence_weighting_rationale": "[str]",
-  "uncertainty_factors": ["[str]", "[str]"],
-  "decision_rationale": "[str]",
-  "calibration_check": "[str]"
-}
-```
-'''
-
-    return base_description + json_sample
\ No newline at end of file
+    return base_description + JUDGE_JSON_SAMPLE
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""
+Shared Inspect AI solvers for debate forecasting
+Debate turns that do not depend on each other (both advocates' opening
+positions, or both rebuttals in a round) can be generated concurrently from
+the same transcript and merged back into one conversation. Between rounds the
+advocates' structured predictions are compared, and once they agree the
+remaining rebuttal turns are skipped and the debate goes straight to the judge.
+Earlier rounds can also be compacted to each advocate's structured JSON so
+prompt size stays bounded as rounds accumulate. Role backstories are added to
+the system messages only once, so every later turn shares the same transcript
+prefix and provider-side prompt caching can reuse it
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from inspect_ai.model import ChatMessage, ChatMessageSystem, ChatMessageUser
+from inspect_ai.solver import fork, solver, Solver, TaskState, Generate
+
+# Sample store keys written by the debate solvers
+DEBATE_CONVERGED_KEY = "debate_converged"
+DEBATE_ROUNDS_COMPLETED_KEY = "debate_rounds_completed"
+LLM_CALLS_SAVED_KEY = "llm_calls_saved"
+
+# Message metadata keys for advocate turns and compacted transcripts
+DEBATE_ROLE_METADATA = "debate_role"
+DEBATE_ROUND_METADATA = "debate_round"
+DEBATE_SUMMARY_METADATA = "debate_turn_summaries"
+
+# Fields of an advocate's JSON output kept when earlier rounds are compacted
+TURN_SUMMARY_FIELDS = (
+    "position_statement", "key_arguments", "arguments",
+    "rebuttal_to_opponent", "strengthened_position", "strengthened_arguments",
+    "evidence_summary", "evidence_analysis", "new_evidence",
+    "time_horizon_predictions", "time_horizon_analysis",
+)
+
+
+def find_json_object(text: str, key: str) -> Optional[Dict[str, Any]]:
+    """First JSON object embedded in text that has the given top-level key"""
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r'\{', text):
+        try:
+            parsed_json, _ = decoder.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed_json, dict) and key in parsed_json:
+            return parsed_json
+    return None
+
+
+def advocate_predictions(text: str) -> Dict[str, float]:
+    """Per-horizon probabilities ({"7_day": 0.42, ...}) from an advocate's time_horizon_predictions JSON"""
+    advocate_output = find_json_object(text, "time_horizon_predictions") or {}
+    predictions = {}
+    for horizon_key, data in (advocate_output.get("time_horizon_predictions") or {}).items():
+        probability = data.get("probability") if isinstance(data, dict) else data
+        try:
+            predictions[horizon_key] = float(probability)
+        except (TypeError, ValueError):
+            continue
+    return predictions
+
+
+def predictions_converged(high: Dict[str, float], low: Dict[str, float], threshold: float) -> bool:
+    """True when both advocates gave every shared horizon probabilities within threshold of each other"""
+    shared_horizons = set(high) & set(low)
+    return bool(shared_horizons) and all(abs(high[h] - low[h]) <= threshold for h in shared_horizons)
+
+
+def turn_summary(text: str, max_chars: int = 1500) -> Any:
+    """Compact form of an advocate turn: its structured JSON fields, or the truncated text if it has none"""
+    advocate_output = (find_json_object(text, "time_horizon_predictions")
+                       or find_json_object(text, "time_horizon_analysis") or {})
+    summary = {field: advocate_output[field] for field in TURN_SUMMARY_FIELDS if field in advocate_output}
+    if summary:
+        return summary
+    return text if len(text) <= max_chars else text[:max_chars] + "..."
+
+
+def debate_stats(store: Dict[str, Any]) -> Dict[str, int]:
+    """Rounds completed and LLM calls saved by early stopping, from a sample's store"""
+    store = store or {}
+    return {
+        DEBATE_ROUNDS_COMPLETED_KEY: store.get(DEBATE_ROUNDS_COMPLETED_KEY, 0),
+        LLM_CALLS_SAVED_KEY: store.get(LLM_CALLS_SAVED_KEY, 0),
+    }
+
+
+def insert_system_message(messages: List[ChatMessage], message: ChatMessageSystem) -> None:
+    """Insert a system message after the existing system messages, unless an identical one is already there"""
+    system_messages = [existing for existing in messages if existing.role == "system"]
+    if any(existing.text == message.text for existing in system_messages):
+        return
+    insert_at = max((i + 1 for i, existing in enumerate(messages) if existing.role == "system"), default=0)
+    messages.insert(insert_at, message)
+
+
+@solver
+def static_system_message(content: str) -> Solver:
+    """
+    Add a static system message (a role backstory) once per transcript
+    Unlike system_message, a later turn for the same role does not add another
+    copy, so the system prefix stays identical across rounds and stays cacheable.
+    The content is used verbatim, without template substitution
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        insert_system_message(state.messages, ChatMessageSystem(content=content))
+        return state
+
+    return solve
+
+
+@solver
+def parallel_turns(*turns: Solver) -> Solver:
+    """
+    Run debate turns concurrently, each on a copy of the current transcript
+    Messages each turn added (identified by message id) are appended in turn
+    order, so later turns see every concurrent turn's output; new system messages
+    go with the existing ones. Store values and the sample output are taken from
+    the turns in order (the last turn wins)
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        turn_states: List[TaskState] = await fork(state, list(turns))
+
+        seen_ids = {message.id for message in state.messages}
+        for turn_state in turn_states:
+            for message in turn_state.messages:
+                if message.id not in seen_ids:
+                    seen_ids.add(message.id)
+                    if message.role == "system":
+                        insert_system_message(state.messages, message)
+                    else:
+                        state.messages.append(message)
+            for key, value in turn_state.store.items():
+                state.store.set(key, value)
+
+        if turn_states:
+            state.output = turn_states[-1].output
+            state.completed = any(turn_state.completed for turn_state in turn_states)
+        return state
+
+    return solve
+
+
+@solver
+def record_advocate_turn(role: str, round_num: int = None) -> Solver:
+    """
+    Store the per-horizon probabilities from an advocate's latest output under
+    '<role>_predictions' and tag its message with the role and round for compaction
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        predictions = advocate_predictions(state.output.completion if state.output else "")
+        if predictions:
+            state.store.set(f"{role}_predictions", predictions)
+
+        for message in reversed(state.messages):
+            if message.role == "assistant":
+                message.metadata = {**(message.metadata or {}), DEBATE_ROLE_METADATA: role, DEBATE_ROUND_METADATA: round_num}
+                break
+        return state
+
+    return solve
+
+
+@solver
+def compact_transcript(max_turn_chars: int = 1500) -> Solver:
+    """
+    Replace the debate so far with one message holding each advocate turn's structured JSON
+    System messages and the sample input are kept; advocate prompts, tool calls,
+    search results and full turn texts are dropped. Summaries from an earlier
+    compaction are carried over, so it can run between every pair of rounds
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        system_messages = [message for message in state.messages if message.role == "system"]
+        conversation = [message for message in state.messages if message.role != "system"]
+        if len(conversation) < 2:
+            return state
+
+        summaries = []
+        for message in conversation[1:]:
+            metadata = message.metadata or {}
+            if DEBATE_SUMMARY_METADATA in metadata:
+                summaries.extend(metadata[DEBATE_SUMMARY_METADATA])
+            elif message.role == "assistant" and metadata.get(DEBATE_ROLE_METADATA):
+                summaries.append({
+                    "role": metadata[DEBATE_ROLE_METADATA],
+                    "round": metadata.get(DEBATE_ROUND_METADATA),
+                    "summary": turn_summary(message.text, max_turn_chars)
+                })
+        if not summaries:
+            return state
+
+        sections = []
+        for entry in summaries:
+            heading = entry["role"].replace("_", " ").title()
+            if entry["round"] is not None:
+                heading = f"Round {entry['round']} - {heading}"
+            summary = entry["summary"]
+            sections.append(f"[{heading}]\n{summary if isinstance(summary, str) else json.dumps(summary, indent=1)}")
+
+        compacted = ChatMessageUser(
+            content="DEBATE SO FAR (earlier rounds compacted to each advocate's structured position):\n\n" + "\n\n".join(sections),
+            metadata={DEBATE_SUMMARY_METADATA: summaries}
+        )
+        state.messages = system_messages + [conversation[0], compacted]
+        return state
+
+    return solve
+
+
+@solver
+def end_debate_round(round_num: int, total_rounds: int, convergence_threshold: Optional[float] = None) -> Solver:
+    """
+    Mark a debate round as completed and, with a convergence threshold, check
+    whether the advocates now agree; if so later turns wrapped in unless_converged are skipped
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        if state.store.get(DEBATE_CONVERGED_KEY, False):
+            return state
+
+        state.store.set(DEBATE_ROUNDS_COMPLETED_KEY, round_num)
+        if convergence_threshold is not None and round_num < total_rounds:
+            high = state.store.get("high_advocate_predictions", {})
+            low = state.store.get("low_advocate_predictions", {})
+            if predictions_converged(high, low, convergence_threshold):
+                print(f"🤝 Advocates converged after round {round_num} of {total_rounds}, skipping to the judge")
+                state.store.set(DEBATE_CONVERGED_KEY, True)
+        return state
+
+    return solve
+
+
+@solver
+def unless_converged(turn: Solver, llm_calls: int = 1) -> Solver:
+    """
+    Run a debate turn only while the debate has not converged
+    A skipped turn counts as llm_calls saved generate calls (at least one per advocate turn)
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        if state.store.get(DEBATE_CONVERGED_KEY, False):
+            state.store.set(LLM_CALLS_SAVED_KEY, state.store.get(LLM_CALLS_SAVED_KEY, 0) + llm_calls)
+            return state
+        return await turn(state, generate)
+
+    return solve
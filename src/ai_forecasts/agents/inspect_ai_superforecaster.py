@@ -4,30 +4,44 @@ Implements advanced superforecaster methodology using Inspect AI framework
 with strategic Google News integration and comprehensive bias correction techniques
 """
 import json
+import math
 import os
 import re
+import statistics
 import time
 import random
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from pydantic import BaseModel
 from pathlib import Path
 
-from inspect_ai import Task, eval, task
-from inspect_ai.dataset import Sample, Dataset
+from inspect_ai import Task, eval, eval_async, task
+from inspect_ai.dataset import Sample, Dataset, MemoryDataset
 from inspect_ai.model import get_model, Model
 from inspect_ai.solver import (
     generate, system_message, user_message, assistant_message,
-    chain, fork, basic_agent, use_tools, solver, Solver
+    chain, fork, basic_agent, use_tools, solver, Solver, TaskState, Generate
 )
 from inspect_ai.tool import tool, Tool, ToolError
 from inspect_ai.agent import Agent
 from inspect_ai.log import EvalLog
-from inspect_ai.scorer import Scorer, Score, Target
+from inspect_ai.scorer import Scorer, Score, Target, Metric, SampleScore, scorer, metric
 
 # Removed forecasting_prompts import - using only debate methodology
 
+from .debate_solvers import (
+    parallel_turns,
+    record_advocate_turn,
+    end_debate_round,
+    unless_converged,
+    compact_transcript,
+    static_system_message,
+    find_json_object,
+    debate_stats
+)
+
 from .debate_forecasting_prompts import (
     get_high_advocate_backstory,
     get_low_advocate_backstory,
@@ -48,6 +62,8 @@ class ForecastResult:
     search_count: int = 0
     api_calls: int = 0
     timestamp: str = ""
+    debate_rounds_completed: int = 0
+    llm_calls_saved: int = 0
     
     def __post_init__(self):
         if not self.timestamp:
@@ -55,6 +71,8 @@ class ForecastResult:
 
 # Import cached SERP API Google News Tool with intelligent caching
 from ..utils.google_news_tool import CachedGoogleNewsTool
+from ..utils.search_budget import SearchBudgetLedger, SearchBudgetScope, DEBATE_ROLES
+from ..utils.resolution_index import ResolutionIndex, load_resolution_index
 
 
 class InspectAIGoogleNewsTool:
@@ -66,89 +84,196 @@ class InspectAIGoogleNewsTool:
             search_timeframe=search_timeframe
         )
     
-    @tool
-    def google_news_search(self, query: str, num_results: int = 10) -> str:
-        """Search Google News for recent articles related to the query"""
-        try:
-            # Use the cached tool's search functionality
-            results = self.cached_tool._run(query)
-            return results
-        except Exception as e:
-            raise ToolError(f"Google News search failed: {str(e)}")
+    def google_news_search(self, budget_scope: SearchBudgetScope = None) -> Tool:
+        """Create the async Inspect AI tool backed by the cached Google News search, charging API calls to budget_scope"""
+        cached_tool = self.cached_tool
+        
+        @tool(name="google_news_search")
+        def google_news_search() -> Tool:
+            async def execute(query: str, search_type: str = "focused", priority: str = "high") -> str:
+                """
+                Search Google News for recent articles related to the query.
+                
+                Args:
+                    query: Search query for Google News
+                    search_type: Type of search: focused, comprehensive, expert_opinions, historical, contrarian
+                    priority: Priority level: high, medium, low - affects API usage
+                
+                Returns:
+                    Formatted list of matching news articles
+                """
+                try:
+                    # Non-blocking search so tool calls from concurrent samples overlap
+                    return await cached_tool._arun(query, search_type=search_type, priority=priority,
+                                                   budget_scope=budget_scope)
+                except Exception as e:
+                    raise ToolError(f"Google News search failed: {str(e)}")
+            
+            return execute
+        
+        return google_news_search()
+
+
+def template_literal(text: str) -> str:
+    """Escape braces so text (JSON examples, question text) survives user_message's str.format templating"""
+    return text.replace("{", "{{").replace("}", "}}")
 
 
-class ForecastBenchScorer(Scorer):
-    """Custom scorer for forecasting accuracy using Brier scores"""
+@solver
+def search_budget_status(ledger: SearchBudgetLedger, question_id: str = None) -> Solver:
+    """Publish actual search counts from the ledger into the sample store for prompt templates"""
     
-    def __init__(self):
-        pass
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        question_key = question_id or state.metadata.get("question_id") or str(state.sample_id)
+        for role in DEBATE_ROLES:
+            remaining = ledger.remaining(question_key, role)
+            state.store.set(f"searches_used_{role}", ledger.used(question_key, role))
+            state.store.set(f"searches_remaining_{role}", "unlimited" if remaining is None else remaining)
+        state.store.set("searches_used_total", ledger.used(question_key))
+        return state
     
-    def _score(self, state, target):
-        """Calculate Brier score for forecast accuracy"""
-        # Extract predictions from model output
-        predictions = self._extract_predictions_from_output(state.output.completion)
-        
-        # Get target values from metadata
-        targets = target.get("resolutions", {}) if target else {}
-        
-        scores = []
-        total_brier = 0.0
-        count = 0
+    return solve
+
+
+FORECAST_HORIZON_DAYS = [7, 30, 90, 180]
+
+
+def find_judge_output(text: str) -> Optional[Dict]:
+    """First JSON object in text with a final_predictions key (judge output nests three levels deep)"""
+    return find_json_object(text, "final_predictions")
+
+
+def extract_final_predictions(text: str) -> Dict[str, float]:
+    """Per-horizon probabilities ({"7_day": 0.42, ...}) from judge output text"""
+    judge_output = find_judge_output(text) or {}
+    predictions = {}
+    for horizon_key, data in judge_output.get("final_predictions", {}).items():
+        probability = data.get("probability") if isinstance(data, dict) else data
+        try:
+            predictions[horizon_key] = float(probability)
+        except (TypeError, ValueError):
+            continue
+    return predictions
+
+
+def parse_horizon_prediction(judge_output: Dict, horizon_key: str) -> Optional[Tuple[float, Any, str]]:
+    """
+    (probability, confidence, reasoning) for one horizon of judge output, or None if it has no usable probability
+    Accepts {"7_day": {"probability": ...}} and the bare {"7_day": 0.42} format with sibling
+    confidence_scores/reasoning maps that final_judge_decision asks for
+    """
+    judge_output = judge_output or {}
+    horizon_data = judge_output.get("final_predictions", {}).get(horizon_key)
+    if isinstance(horizon_data, dict):
+        probability = horizon_data.get("probability")
+        confidence = horizon_data.get("confidence", "MEDIUM")
+        reasoning = horizon_data.get("reasoning", "No specific reasoning provided")
+    else:
+        confidence_scores = judge_output.get("confidence_scores")
+        reasonings = judge_output.get("reasoning")
+        probability = horizon_data
+        confidence = confidence_scores.get(horizon_key, "MEDIUM") if isinstance(confidence_scores, dict) else "MEDIUM"
+        reasoning = reasonings.get(horizon_key) if isinstance(reasonings, dict) else None
+        reasoning = reasoning or "No specific reasoning provided"
+    try:
+        return float(probability), confidence, reasoning
+    except (TypeError, ValueError):
+        return None
+
+
+def horizon_brier_metric(score_key: str) -> Metric:
+    """Mean of one key of the forecastbench scorer value over the samples where it was resolved"""
+    
+    @metric(name=score_key, scores="unreduced")
+    def horizon_brier() -> Metric:
+        def compute(scores: List[SampleScore]) -> float:
+            values = [
+                sample_score.score.value.get(score_key)
+                for sample_score in scores
+                if isinstance(sample_score.score.value, dict)
+            ]
+            values = [value for value in values if value is not None]
+            return statistics.mean(values) if values else float("nan")
         
-        time_horizons = ["7", "30", "90", "180"]
+        return compute
+    
+    return horizon_brier()
+
+
+@scorer(metrics=[horizon_brier_metric(f"brier_score_{h}_day") for h in FORECAST_HORIZON_DAYS] + [horizon_brier_metric("brier_score")])
+def forecastbench_scorer() -> Scorer:
+    """Brier score per time horizon (lower is better) against the sample's resolutions"""
+    
+    async def score(state: TaskState, target: Target) -> Score:
+        predictions = extract_final_predictions(state.output.completion)
+        resolutions = state.metadata.get("resolutions")
+        if resolutions is None:
+            resolutions = json.loads(target.text) if target.text else {}
         
-        for horizon in time_horizons:
+        value = {}
+        explanations = []
+        for horizon in state.metadata.get("time_horizons", FORECAST_HORIZON_DAYS):
             horizon_key = f"{horizon}_day"
+            pred = predictions.get(horizon_key)
+            actual = resolutions.get(horizon_key)
             
-            if horizon_key in predictions and horizon_key in targets:
-                pred = predictions[horizon_key]
-                actual = targets[horizon_key]
-                
-                if pred is not None and actual is not None:
-                    # Brier score: (prediction - actual)^2
-                    brier = (pred - actual) ** 2
-                    total_brier += brier
-                    count += 1
-                    
-                    scores.append(Score(
-                        value=1.0 - brier,  # Higher is better (accuracy)
-                        answer=pred,
-                        explanation=f"Brier score for {horizon} days: {brier:.4f}"
-                    ))
-        
-        # Return average accuracy across time horizons
-        if count > 0:
-            avg_brier = total_brier / count
-            return Score(
-                value=1.0 - avg_brier,  # Convert to accuracy score
-                answer=f"Average Brier: {avg_brier:.4f}",
-                explanation=f"Average Brier score across {count} time horizons: {avg_brier:.4f}"
-            )
-        else:
-            return Score(value=0.0, answer="No valid predictions", explanation="No predictions could be evaluated")
+            if pred is not None and actual is not None:
+                # Brier score: (prediction - actual)^2
+                brier = (pred - actual) ** 2
+                value[f"brier_score_{horizon_key}"] = brier
+                explanations.append(f"{horizon} days: {brier:.4f}")
+            else:
+                value[f"brier_score_{horizon_key}"] = None
+        
+        horizon_briers = [brier for brier in value.values() if brier is not None]
+        value["brier_score"] = statistics.mean(horizon_briers) if horizon_briers else None
+        
+        return Score(
+            value=value,
+            answer=json.dumps(predictions),
+            explanation=f"Brier scores - {', '.join(explanations)}" if explanations else "No predictions could be evaluated"
+        )
     
-    def _extract_predictions_from_output(self, output: str) -> Dict[str, float]:
-        """Extract predictions from model output JSON"""
-        try:
-            # Look for JSON in the output
-            json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-            json_matches = re.findall(json_pattern, output, re.DOTALL)
-            
-            for match in json_matches:
-                try:
-                    parsed = json.loads(match)
-                    if "final_predictions" in parsed:
-                        predictions = {}
-                        for horizon, data in parsed["final_predictions"].items():
-                            if isinstance(data, dict) and "probability" in data:
-                                predictions[horizon] = float(data["probability"])
-                        return predictions
-                except json.JSONDecodeError:
-                    continue
-            
-            return {}
-        except Exception:
-            return {}
+    return score
+
+
+def forecastbench_sample(question_data: Dict, forecast_due_date: str,
+                         resolution_index: ResolutionIndex = None,
+                         time_horizons: List[int] = None) -> Sample:
+    """Build the Inspect AI sample for one ForecastBench question (resolutions go in metadata)"""
+    time_horizons = time_horizons or [7, 30, 90, 180]
+    resolution_index = resolution_index or ResolutionIndex()
+    question_id = question_data.get('id')
+    
+    # Each horizon resolves on forecast_due_date + horizon days
+    due_date = datetime.strptime(forecast_due_date, "%Y-%m-%d")
+    resolutions = {}
+    for horizon in time_horizons:
+        resolution_date = (due_date + timedelta(days=horizon)).strftime("%Y-%m-%d")
+        resolved_to = resolution_index.get(question_id, resolution_date)
+        if resolved_to is not None:
+            resolutions[f"{horizon}_day"] = resolved_to
+    
+    return Sample(
+        id=question_id,
+        input=create_comprehensive_context(question_data),
+        target=json.dumps(resolutions),
+        metadata={
+            "question_id": question_id,
+            "question": question_data.get('question', ''),
+            "time_horizons": time_horizons,
+            "forecast_due_date": forecast_due_date,
+            "resolutions": resolutions,
+            "source": question_data.get('source', ''),
+            "resolution_criteria": question_data.get('resolution_criteria', ''),
+            "background": question_data.get('background', ''),
+            "url": question_data.get('url', ''),
+            "freeze_datetime": question_data.get('freeze_datetime', ''),
+            "freeze_datetime_value": question_data.get('freeze_datetime_value', ''),
+            "market_info_open_datetime": question_data.get('market_info_open_datetime', ''),
+            "market_info_close_datetime": question_data.get('market_info_close_datetime', ''),
+        }
+    )
 
 
 def load_forecastbench_dataset(
@@ -160,73 +285,29 @@ def load_forecastbench_dataset(
 ) -> Dataset:
     """Load ForecastBench dataset into Inspect AI format"""
     
-    # Load questions
+    # Load questions (ForecastBench files wrap them with the question set metadata)
     with open(questions_file, 'r') as f:
         questions_data = json.load(f)
+    if isinstance(questions_data, dict):
+        forecast_due_date = questions_data.get('forecast_due_date', forecast_due_date)
+        questions_data = questions_data.get('questions', [])
     
-    # Load resolutions
-    with open(resolutions_file, 'r') as f:
-        resolutions_data = json.load(f)
-    
-    # Create resolution lookup
-    resolution_lookup = {}
-    if 'resolutions' in resolutions_data:
-        for resolution in resolutions_data['resolutions']:
-            if resolution['id'] and resolution['resolution_date'] == forecast_due_date:
-                resolution_lookup[resolution['id']] = resolution['resolved_to']
+    # Resolutions keyed by (question id, resolution date), shared with the benchmark runners
+    resolution_index = load_resolution_index(resolutions_file)
     
     # Filter questions if question_ids provided
     if question_ids:
         questions_data = [q for q in questions_data if q.get('id') in question_ids]
     
     # Limit questions
-    questions_data = questions_data[:max_questions]
+    questions_data = [q for q in questions_data if q.get('id')][:max_questions]
     
-    # Time horizons for predictions (in days)
-    time_horizons = [7, 30, 90, 180]
-    
-    samples = []
-    for question_data in questions_data:
-        question_id = question_data.get('id')
-        if not question_id:
-            continue
-            
-        # Create comprehensive context
-        comprehensive_context = create_comprehensive_context(question_data)
-        
-        # Get resolutions for all time horizons
-        resolutions = {}
-        for horizon in time_horizons:
-            horizon_key = f"{horizon}_day"
-            if question_id in resolution_lookup:
-                resolutions[horizon_key] = resolution_lookup[question_id]
-        
-        # Create sample
-        sample = Sample(
-            input=comprehensive_context,
-            target={
-                "question_id": question_id,
-                "question": question_data.get('question', ''),
-                "resolutions": resolutions,
-                "time_horizons": time_horizons,
-                "forecast_due_date": forecast_due_date
-            },
-            metadata={
-                "question_id": question_id,
-                "source": question_data.get('source', ''),
-                "resolution_criteria": question_data.get('resolution_criteria', ''),
-                "background": question_data.get('background', ''),
-                "url": question_data.get('url', ''),
-                "freeze_datetime": question_data.get('freeze_datetime', ''),
-                "freeze_datetime_value": question_data.get('freeze_datetime_value', ''),
-                "market_info_open_datetime": question_data.get('market_info_open_datetime', ''),
-                "market_info_close_datetime": question_data.get('market_info_close_datetime', ''),
-            }
-        )
-        
-        samples.append(sample)
+    samples = [
+        forecastbench_sample(question_data, forecast_due_date, resolution_index)
+        for question_data in questions_data
+    ]
     
-    return Dataset(samples)
+    return MemoryDataset(samples, name="forecastbench")
 
 
 def create_comprehensive_context(question_data: Dict) -> str:
@@ -284,6 +365,131 @@ def create_comprehensive_context(question_data: Dict) -> str:
     return "\n\n".join(context_parts)
 
 
+@lru_cache(maxsize=64)
+def _multi_horizon_high_advocate_instructions(search_budget_per_advocate: int, debate_rounds: int,
+                                              search_penalty_rate: float, training_cutoff: str) -> str:
+    """Instructions for high advocate considering multiple time horizons"""
+    return f"""
+**MULTI-HORIZON ANALYSIS:**
+- Consider how probability changes over time (e.g., 7-day vs 180-day horizons)
+- Shorter horizons: Focus on immediate momentum and near-term catalysts
+- Longer horizons: Consider trend continuation and fundamental drivers
+- Provide probability ranges for each time horizon
+
+**SEARCH BUDGET MANAGEMENT:**
+- You have {search_budget_per_advocate} searches total across all {debate_rounds} rounds
+- Each search beyond the budget incurs a {search_penalty_rate * 100}% penalty
+- Prioritize searches for information after {training_cutoff} (your training cutoff)
+- Use strategic queries that maximize information gain per search
+- Consider saving searches for later rounds if current information is sufficient
+
+**SEARCH STRATEGY TIPS:**
+- Combine multiple concepts in single queries for efficiency
+- Focus on recent developments and expert opinions
+- Look for quantitative data and specific commitments
+- Prioritize authoritative and credible sources
+
+**JSON OUTPUT FORMAT:**
+```json
+{{
+  "position_statement": "Your overall position",
+  "searches_used_this_round": 0,
+  "search_strategy_notes": "Brief notes on your search approach",
+  "time_horizon_predictions": {{
+    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}}
+  }},
+  "key_arguments": ["arg1", "arg2", "arg3"],
+  "evidence_summary": "Summary of key evidence",
+  "rebuttal_points": ["point1", "point2"]
+}}
+```
+"""
+
+
+@lru_cache(maxsize=64)
+def _multi_horizon_low_advocate_instructions(search_budget_per_advocate: int, debate_rounds: int,
+                                             search_penalty_rate: float, training_cutoff: str) -> str:
+    """Instructions for low advocate considering multiple time horizons"""
+    return f"""
+**MULTI-HORIZON ANALYSIS:**
+- Consider how obstacles compound over time
+- Shorter horizons: Focus on immediate barriers and missing prerequisites
+- Longer horizons: Consider how challenges accumulate and multiply
+- Provide probability ranges for each time horizon
+
+**SEARCH BUDGET MANAGEMENT:**
+- You have {search_budget_per_advocate} searches total across all {debate_rounds} rounds
+- Each search beyond the budget incurs a {search_penalty_rate * 100}% penalty
+- Prioritize searches for information after {training_cutoff} (your training cutoff)
+- Use strategic queries that maximize information gain per search
+- Consider saving searches for later rounds if current information is sufficient
+
+**SEARCH STRATEGY TIPS:**
+- Look for evidence of obstacles, delays, and challenges
+- Search for expert skepticism and critical assessments
+- Find data on resource constraints and competing priorities
+- Identify failure modes and risk factors
+
+**JSON OUTPUT FORMAT:**
+```json
+{{
+  "position_statement": "Your overall position",
+  "searches_used_this_round": 0,
+  "search_strategy_notes": "Brief notes on your search approach",
+  "time_horizon_predictions": {{
+    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
+    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}}
+  }},
+  "key_arguments": ["arg1", "arg2", "arg3"],
+  "evidence_summary": "Summary of key evidence",
+  "rebuttal_points": ["point1", "point2"]
+}}
+```
+"""
+
+
+@lru_cache(maxsize=64)
+def _judge_output_format(training_cutoff: str) -> str:
+    """Output format for final judge"""
+    return f"""
+**JSON OUTPUT FORMAT:**
+```json
+{{
+  "final_predictions": {{
+    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}}
+  }},
+  "synthesis_reasoning": "Overall synthesis of the debate",
+  "evidence_quality_assessment": "Assessment of evidence from both sides",
+  "search_efficiency_evaluation": "How well did advocates use their search budget?",
+  "training_cutoff_impact": "How much did post-{training_cutoff} information influence the forecast?",
+  "uncertainty_factors": ["factor1", "factor2", "factor3"],
+  "high_advocate_evaluation": {{
+    "strength": 0.X,
+    "evidence_quality": 0.Y,
+    "search_effectiveness": 0.Z,
+    "key_strengths": ["strength1", "strength2"]
+  }},
+  "low_advocate_evaluation": {{
+    "strength": 0.X,
+    "evidence_quality": 0.Y,
+    "search_effectiveness": 0.Z,
+    "key_strengths": ["strength1", "strength2"]
+  }},
+  "calibration_notes": "Notes on calibration and confidence",
+  "search_budget_analysis": "Analysis of how search budget constraints affected the debate quality"
+}}
+```
+"""
+
+
 class InspectAISuperforecaster:
     """
     Enhanced superforecaster system using Inspect AI with strategic analysis and bias correction
@@ -292,7 +498,9 @@ class InspectAISuperforecaster:
     def __init__(self, openrouter_api_key: str, serp_api_key: str = None, training_cutoff: str = "2024-07-01", 
                  recommended_articles: int = 10, max_search_queries: int = None, 
                  debate_mode: bool = True, debate_rounds: int = 3, enhanced_quality_mode: bool = True,
-                 search_budget_per_advocate: int = 10):
+                 search_budget_per_advocate: int = 10, search_ledger: SearchBudgetLedger = None,
+                 concurrent_rebuttals: bool = False, convergence_threshold: float = None,
+                 compact_transcripts: bool = False, cache_prompt: bool = True):
         # Inspect AI handles logging automatically via eval() function
         self.openrouter_api_key = openrouter_api_key
         self.serp_api_key = serp_api_key or os.getenv("SERP_API_KEY")
@@ -301,9 +509,62 @@ class InspectAISuperforecaster:
         self.debate_rounds = debate_rounds
         self.enhanced_quality_mode = enhanced_quality_mode
         self.search_budget_per_advocate = search_budget_per_advocate
+        # Generate both advocates' rebuttals in a round concurrently from the previous round's transcript
+        self.concurrent_rebuttals = concurrent_rebuttals
+        # Skip the remaining rebuttal rounds once every horizon's advocate probabilities are this close (None: never)
+        self.convergence_threshold = convergence_threshold
+        # Replace earlier rounds with the advocates' structured JSON before each later round and the judge
+        self.compact_transcripts = compact_transcripts
+        # Mark debate prompts for provider-side prefix caching (backstories and earlier turns are reused every turn)
+        self.cache_prompt = cache_prompt
         
         # Time horizons for predictions (in days)
         self.time_horizons = [7, 30, 90, 180]
+        
+        self.search_penalty_rate = 0.01  # 1% penalty per search beyond budget
+        
+        # Actual per-question, per-advocate search counts (shared across forecasters in a run)
+        self.search_ledger = search_ledger or SearchBudgetLedger(
+            budget_per_role=search_budget_per_advocate,
+            penalty_rate=self.search_penalty_rate
+        )
+        
+        # Search configuration parameters
+        self.recommended_articles = recommended_articles
+        self.max_search_queries = max_search_queries or (
+            None if recommended_articles == -1 else
+            max(2, min(5, recommended_articles // 3))
+        )
+        
+        # Configure model for Inspect AI - use OpenRouter with OPENAI_API_KEY
+        model_name = os.getenv("DEFAULT_MODEL", "meta-llama/llama-3.1-8b-instruct:free")
+        
+        # Set up environment for OpenRouter
+        openrouter_key = os.getenv("OPENROUTER_API_KEY")
+        if not openrouter_key:
+            raise ValueError("OPENROUTER_API_KEY environment variable is required")
+        
+        os.environ["OPENROUTER_API_KEY"] = openrouter_key
+        os.environ["OPENAI_API_BASE"] = "https://openrouter.ai/api/v1"
+        
+        # Create Inspect AI model
+        self.model = get_model(
+            f"openrouter/{model_name}",
+            api_key=openrouter_key,
+            base_url="https://openrouter.ai/api/v1"
+        )
+        
+        # Initialize Google News tool
+        search_timeframe = {
+            "start": "06/01/2024",
+            "end": datetime.now().strftime("%m/%d/%Y")
+        }
+        self.google_news_tool = InspectAIGoogleNewsTool(
+            serp_api_key=self.serp_api_key,
+            search_timeframe=search_timeframe
+        )
+        
+        print("✅ Inspect AI Superforecaster initialized successfully")
     
     async def run_native_evaluation(self, 
                                    questions_file: str = "forecastbench_human_2024.json",
@@ -311,52 +572,73 @@ class InspectAISuperforecaster:
                                    forecast_due_date: str = "2024-07-21",
                                    max_questions: int = 200,
                                    question_ids: List[str] = None,
-                                   model_name: str = "anthropic/claude-3-5-sonnet-20241022",
-                                   parallel: bool = True) -> Dict[str, Any]:
+                                   model_name: str = None,
+                                   max_samples: int = None,
+                                   max_connections: int = None) -> Dict[str, Any]:
         """
         Run native Inspect AI evaluation on ForecastBench dataset
         
+        Every question is a sample of one task; Inspect AI runs the debates
+        concurrently (bounded by max_samples and max_connections) and the
+        forecastbench scorer emits per-horizon Brier metrics.
+        
         Args:
             questions_file: Path to questions JSON file
             resolutions_file: Path to resolutions JSON file
-            forecast_due_date: Date for forecast evaluation
+            forecast_due_date: Date for forecast evaluation (overridden by the questions file)
             max_questions: Maximum number of questions to process
             question_ids: Optional list of specific question IDs to evaluate
-            model_name: Model to use for evaluation
-            parallel: Whether to run evaluations in parallel
+            model_name: Model to use for evaluation (the forecaster's model if None)
+            max_samples: Maximum samples (debates) running at once
+            max_connections: Maximum concurrent model connections
             
         Returns:
             Dictionary containing evaluation results and metrics
         """
-        print(f"🚀 Starting native Inspect AI evaluation")
-        print(f"   Model: {model_name}")
-        print(f"   Questions: {max_questions if not question_ids else len(question_ids)}")
-        print(f"   Parallel: {parallel}")
-        print(f"   Debate rounds: {self.debate_rounds}")
-        
         # Create the Inspect AI task
-        task_func = self.create_multi_horizon_debate_task(
+        debate_task = self.create_multi_horizon_debate_task(
             questions_file=questions_file,
             resolutions_file=resolutions_file,
             forecast_due_date=forecast_due_date,
             max_questions=max_questions,
             question_ids=question_ids
         )
+        if len(debate_task.dataset) == 0:
+            print("❌ No ForecastBench questions to evaluate")
+            return {"error": "No ForecastBench questions to evaluate"}
+        
+        # Searches must not see information after the forecast due date
+        forecast_due_date = debate_task.dataset[0].metadata.get("forecast_due_date", forecast_due_date)
+        self._set_benchmark_cutoff_date(forecast_due_date)
+        
+        print(f"🚀 Starting native Inspect AI evaluation")
+        print(f"   Model: {model_name or self.model}")
+        print(f"   Questions: {len(debate_task.dataset)}")
+        print(f"   Max samples: {max_samples or 'default'}, max connections: {max_connections or 'default'}")
+        print(f"   Debate rounds: {self.debate_rounds}")
+        
+        eval_options = {}
+        if max_samples:
+            eval_options["max_samples"] = max_samples
+        if max_connections:
+            eval_options["max_connections"] = max_connections
         
         # Run evaluation using Inspect AI
-        log = await eval(
-            task_func,
-            model=model_name,
+        logs = await eval_async(
+            debate_task,
+            model=model_name or self.model,
             log_dir="logs/inspect_ai_evaluation",
-            parallel=parallel
+            fail_on_error=False,
+            **eval_options
         )
+        log = logs[0]
         
         # Process results
         results = self.process_evaluation_results(log)
         
-        print(f"✅ Evaluation completed successfully")
-        print(f"   Total samples: {len(log.samples)}")
-        print(f"   Mean Brier score: {results.get('mean_brier_score', 'N/A'):.4f}")
+        print(f"✅ Evaluation completed with status: {log.status}")
+        print(f"   Total samples: {results['total_samples']}")
+        print(f"   Mean Brier score: {results['mean_brier_score']:.4f}" if results['mean_brier_score'] is not None else "   Mean Brier score: N/A")
         
         return results
     
@@ -377,16 +659,12 @@ class InspectAISuperforecaster:
             question_ids=question_ids
         )
         
-        # Create the task
-        @task
-        def multi_horizon_debate_forecasting():
-            return Task(
-                dataset=dataset,
-                solver=self.create_multi_horizon_debate_solver(),
-                scorer=ForecastBenchScorer()
-            )
-        
-        return multi_horizon_debate_forecasting
+        return Task(
+            dataset=dataset,
+            solver=self.per_question_debate_solver(),
+            scorer=forecastbench_scorer(),
+            name="multi_horizon_debate_forecasting"
+        )
     
     def create_multi_horizon_debate_solver(self) -> Solver:
         """Create the main solver for multi-horizon debate forecasting"""
@@ -440,7 +718,7 @@ Use all available context to make informed predictions."""),
             return fork(
                 # High advocate initialization
                 chain(
-                    system_message(get_high_advocate_backstory()),
+                    static_system_message(get_high_advocate_backstory()),
                     user_message(f"""INITIALIZATION - Round 1 of {self.debate_rounds}
 
 {get_high_advocate_task_description()}
@@ -470,7 +748,7 @@ Required JSON format:
                 
                 # Low advocate initialization  
                 chain(
-                    system_message(get_low_advocate_backstory()),
+                    static_system_message(get_low_advocate_backstory()),
                     user_message(f"""INITIALIZATION - Round 1 of {self.debate_rounds}
 
 {get_low_advocate_task_description()}
@@ -513,14 +791,15 @@ Required JSON format:
             return chain(
                 # High advocate rebuttal
                 chain(
-                    system_message(get_high_advocate_backstory()),
+                    search_budget_status(self.search_ledger),
+                    static_system_message(get_high_advocate_backstory()),
                     user_message(f"""REBUTTAL - Round {round_num} of {self.debate_rounds}
 
 Previous round arguments are available in conversation history.
 
 Search Budget Status:
-- Estimated searches used: {(round_num-1) * 2}
-- Searches remaining: {self.search_budget_per_advocate - (round_num-1) * 2}
+- Searches used: {{searches_used_high_advocate}}
+- Searches remaining: {{searches_remaining_high_advocate}}
 - Search penalty rate: Increasing with usage
 - Training cutoff: {self.training_cutoff}
 
@@ -547,14 +826,15 @@ Required JSON format:
                 
                 # Low advocate rebuttal
                 chain(
-                    system_message(get_low_advocate_backstory()),
+                    search_budget_status(self.search_ledger),
+                    static_system_message(get_low_advocate_backstory()),
                     user_message(f"""REBUTTAL - Round {round_num} of {self.debate_rounds}
 
 Previous round arguments are available in conversation history.
 
 Search Budget Status:
-- Estimated searches used: {(round_num-1) * 2}
-- Searches remaining: {self.search_budget_per_advocate - (round_num-1) * 2}
+- Searches used: {{searches_used_low_advocate}}
+- Searches remaining: {{searches_remaining_low_advocate}}
 - Search penalty rate: Increasing with usage
 - Training cutoff: {self.training_cutoff}
 
@@ -588,7 +868,7 @@ Required JSON format:
         @solver  
         def judge_decision():
             return chain(
-                system_message(get_debate_judge_backstory()),
+                static_system_message(get_debate_judge_backstory()),
                 user_message(f"""FINAL JUDGMENT
 
 {get_debate_judge_task_description()}
@@ -655,37 +935,59 @@ Extract the final_predictions from your judge decision and format as:
     
     def process_evaluation_results(self, log: EvalLog) -> Dict[str, Any]:
         """Process Inspect AI evaluation results into summary statistics"""
+        samples = log.samples or []
         
         results = {
-            "total_samples": len(log.samples),
+            "total_samples": len(samples),
+            "failed_samples": len([sample for sample in samples if sample.error]),
             "results_by_horizon": {},
-            "mean_brier_score": 0.0,
+            "mean_brier_score": None,
+            "metrics": {},
+            "total_searches": self.search_ledger.used(),
+            "search_penalty": self.search_ledger.search_penalty(),
+            "llm_calls_saved": sum(debate_stats(sample.store)["llm_calls_saved"] for sample in samples),
             "evaluation_metadata": {
-                "model": log.model,
-                "started": log.started,
-                "completed": log.completed,
+                "model": log.eval.model,
+                "status": log.status,
+                "started": log.stats.started_at,
+                "completed": log.stats.completed_at,
+                "log_location": log.location,
                 "config": {
                     "debate_rounds": self.debate_rounds,
+                    "convergence_threshold": self.convergence_threshold,
+                    "compact_transcripts": self.compact_transcripts,
+                    "cache_prompt": self.cache_prompt,
                     "search_budget_per_advocate": self.search_budget_per_advocate,
                     "training_cutoff": self.training_cutoff
                 }
             }
         }
         
+        # Aggregate metrics as computed by Inspect AI
+        if log.results:
+            for eval_score in log.results.scores:
+                for name, eval_metric in eval_score.metrics.items():
+                    # Horizons with no resolved samples have a NaN mean
+                    results["metrics"][name] = None if math.isnan(eval_metric.value) else eval_metric.value
+        
         # Collect all Brier scores for overall mean
         all_brier_scores = []
+        sample_values = [
+            score.value
+            for sample in samples
+            for score in (sample.scores or {}).values()
+            if isinstance(score.value, dict)
+        ]
         
         # Process results by time horizon
         for horizon in self.time_horizons:
             horizon_key = f"{horizon}_day"
-            horizon_scores = []
-            
-            for sample in log.samples:
-                if sample.score and hasattr(sample.score, 'metrics'):
-                    horizon_score = sample.score.metrics.get(f"brier_score_{horizon_key}")
-                    if horizon_score is not None:
-                        horizon_scores.append(horizon_score)
-                        all_brier_scores.append(horizon_score)
+            horizon_scores = [
+                value[f"brier_score_{horizon_key}"]
+                for value in sample_values
+                if value.get(f"brier_score_{horizon_key}") is not None
+            ]
+            all_brier_scores.extend(horizon_scores)
             
             if horizon_scores:
                 results["results_by_horizon"][horizon_key] = {
@@ -700,46 +1002,6 @@ Extract the final_predictions from your judge decision and format as:
             results["mean_brier_score"] = statistics.mean(all_brier_scores)
         
         return results
-        self.enhanced_quality_mode = enhanced_quality_mode
-        self.search_budget_per_advocate = search_budget_per_advocate
-        self.search_penalty_rate = 0.01  # 1% penalty per search beyond budget
-        
-        # Search configuration parameters
-        self.recommended_articles = recommended_articles
-        self.max_search_queries = max_search_queries or (
-            None if recommended_articles == -1 else
-            max(2, min(5, recommended_articles // 3))
-        )
-        
-        # Configure model for Inspect AI - use OpenRouter with OPENAI_API_KEY
-        model_name = os.getenv("DEFAULT_MODEL", "meta-llama/llama-3.1-8b-instruct:free")
-        
-        # Set up environment for OpenRouter
-        openrouter_key = os.getenv("OPENROUTER_API_KEY")
-        if not openrouter_key:
-            raise ValueError("OPENROUTER_API_KEY environment variable is required")
-        
-        os.environ["OPENROUTER_API_KEY"] = openrouter_key
-        os.environ["OPENAI_API_BASE"] = "https://openrouter.ai/api/v1"
-        
-        # Create Inspect AI model
-        self.model = get_model(
-            f"openrouter/{model_name}",
-            api_key=openrouter_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
-        
-        # Initialize Google News tool
-        search_timeframe = {
-            "start": "06/01/2024",
-            "end": datetime.now().strftime("%m/%d/%Y")
-        }
-        self.google_news_tool = InspectAIGoogleNewsTool(
-            serp_api_key=self.serp_api_key,
-            search_timeframe=search_timeframe
-        )
-        
-        print("✅ Inspect AI Superforecaster initialized successfully")
     
     
     def _set_benchmark_cutoff_date(self, cutoff_date: str):
@@ -766,9 +1028,9 @@ Extract the final_predictions from your judge decision and format as:
         )
         
         return chain(
-            system_message(get_high_advocate_backstory()),
+            static_system_message(get_high_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
+            use_tools([self.google_news_tool.google_news_search()]),
             generate()
         )
     
@@ -791,48 +1053,59 @@ Extract the final_predictions from your judge decision and format as:
         )
         
         return chain(
-            system_message(get_low_advocate_backstory()),
+            static_system_message(get_low_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
+            use_tools([self.google_news_tool.google_news_search()]),
             generate()
         )
     
     @solver
-    def multi_horizon_debate_solver(self, question: str, background: str, time_horizons: List[str]) -> Solver:
+    def multi_horizon_debate_solver(self, question: str, background: str, time_horizons: List[str],
+                                    question_id: str = None) -> Solver:
         """
         Multi-horizon debate solver that handles alternating turns and produces structured output
+        Searches are charged to the ledger under question_id (the question text if not given)
         """
+        question_key = question_id or question
         # Convert time horizons to a formatted string for the prompts
         time_horizons_str = ", ".join([f"{h} days" for h in time_horizons])
         
         def create_multi_turn_debate_chain():
             # Initial positions
-            initial_high_solver = self.initial_high_advocate_solver(question, background, time_horizons_str)
-            initial_low_solver = self.initial_low_advocate_solver(question, background, time_horizons_str)
+            initial_high_solver = self.initial_high_advocate_solver(question, background, time_horizons_str, question_key)
+            initial_low_solver = self.initial_low_advocate_solver(question, background, time_horizons_str, question_key)
             
             # Create debate turns
             debate_chain = [
                 # Round 1: Initial positions (parallel)
-                fork(initial_high_solver, initial_low_solver),
-                
-                # Round 2: First rebuttals (sequential)
-                self.high_rebuttal_solver(question, background, time_horizons_str, round_num=1),
-                self.low_rebuttal_solver(question, background, time_horizons_str, round_num=1),
-                
-                # Round 3: Final rebuttals (sequential) 
-                self.high_rebuttal_solver(question, background, time_horizons_str, round_num=2),
-                self.low_rebuttal_solver(question, background, time_horizons_str, round_num=2),
-                
-                # Final judgment
-                self.final_judge_solver(question, background, time_horizons_str)
+                parallel_turns(initial_high_solver, initial_low_solver),
+                end_debate_round(1, self.debate_rounds, self.convergence_threshold)
             ]
+            if self.compact_transcripts:
+                debate_chain.append(compact_transcript())
+            
+            # Later rounds: rebuttals (sequential, or concurrent within the round), skipped once the advocates converge
+            for round_num in range(1, self.debate_rounds):
+                high_rebuttal = self.high_rebuttal_solver(question, background, time_horizons_str, round_num=round_num, question_id=question_key)
+                low_rebuttal = self.low_rebuttal_solver(question, background, time_horizons_str, round_num=round_num, question_id=question_key)
+                if self.concurrent_rebuttals:
+                    debate_chain.append(unless_converged(parallel_turns(high_rebuttal, low_rebuttal), llm_calls=2))
+                else:
+                    debate_chain.extend([unless_converged(high_rebuttal), unless_converged(low_rebuttal)])
+                debate_chain.append(end_debate_round(round_num + 1, self.debate_rounds, self.convergence_threshold))
+                if self.compact_transcripts:
+                    debate_chain.append(compact_transcript())
+            
+            # Final judgment
+            debate_chain.append(self.final_judge_solver(question, background, time_horizons_str, question_key))
             
             return chain(*debate_chain)
         
         return create_multi_turn_debate_chain()
     
     @solver
-    def initial_high_advocate_solver(self, question: str, background: str, time_horizons_str: str) -> Solver:
+    def initial_high_advocate_solver(self, question: str, background: str, time_horizons_str: str,
+                                     question_id: str = None) -> Solver:
         """Initial high probability advocate position"""
         search_timeframe = {
             "start": "06/01/2024",
@@ -840,43 +1113,44 @@ Extract the final_predictions from your judge decision and format as:
         }
         cutoff_date = datetime.now().strftime("%Y-%m-%d")
         
-        # Search budget information
-        searches_used = 0
-        searches_remaining = self.search_budget_per_advocate
-        
         task_description = f"""
 MISSION: Build the strongest possible case for HIGH probability outcomes across multiple time horizons.
 
-**Question:** {question}
+**Question:** {template_literal(question)}
 **Time Horizons:** {time_horizons_str}
 **Current Date:** {cutoff_date}
 **Training Cutoff:** {self.training_cutoff}
-**Background:** {background}
+**Background:** {template_literal(background)}
 
 **SEARCH BUDGET STATUS:**
-- Searches Used: {searches_used}/{self.search_budget_per_advocate}
-- Searches Remaining: {searches_remaining}
+- Searches Used: {{searches_used_high_advocate}}/{self.search_budget_per_advocate}
+- Searches Remaining: {{searches_remaining_high_advocate}}
 - Search Penalty Rate: {self.search_penalty_rate * 100}% per search beyond budget
 - Round: 1 of {self.debate_rounds}
 
 This is Round 1 of {self.debate_rounds}. Provide your initial position for ALL time horizons, considering how probability may change over time.
 
-IMPORTANT: You have a soft limit of {self.search_budget_per_advocate} searches total across all rounds. Use them strategically. Information after {self.training_cutoff} should be prioritized from your searches.
+IMPORTANT: You have a limit of {self.search_budget_per_advocate} searches total across all rounds; searches beyond it are refused. Use them strategically. Information after {self.training_cutoff} should be prioritized from your searches.
 
-{self._get_multi_horizon_high_advocate_instructions()}
+{template_literal(self._get_multi_horizon_high_advocate_instructions())}
 
 OUTPUT: Provide your analysis in JSON format with predictions for each time horizon.
 """
         
         return chain(
-            system_message(get_high_advocate_backstory()),
+            search_budget_status(self.search_ledger, question_id or question),
+            static_system_message(get_high_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
-            generate()
+            use_tools([self.google_news_tool.google_news_search(
+                self.search_ledger.scope(question_id or question, "high_advocate")
+            )]),
+            generate(cache_prompt=self.cache_prompt),
+            record_advocate_turn("high_advocate", 1)
         )
     
     @solver
-    def initial_low_advocate_solver(self, question: str, background: str, time_horizons_str: str) -> Solver:
+    def initial_low_advocate_solver(self, question: str, background: str, time_horizons_str: str,
+                                    question_id: str = None) -> Solver:
         """Initial low probability advocate position"""
         search_timeframe = {
             "start": "06/01/2024", 
@@ -884,61 +1158,57 @@ OUTPUT: Provide your analysis in JSON format with predictions for each time hori
         }
         cutoff_date = datetime.now().strftime("%Y-%m-%d")
         
-        # Search budget information
-        searches_used = 0
-        searches_remaining = self.search_budget_per_advocate
-        
         task_description = f"""
 MISSION: Build the strongest possible case for LOW probability outcomes across multiple time horizons.
 
-**Question:** {question}
+**Question:** {template_literal(question)}
 **Time Horizons:** {time_horizons_str}
 **Current Date:** {cutoff_date}
 **Training Cutoff:** {self.training_cutoff}
-**Background:** {background}
+**Background:** {template_literal(background)}
 
 **SEARCH BUDGET STATUS:**
-- Searches Used: {searches_used}/{self.search_budget_per_advocate}
-- Searches Remaining: {searches_remaining}
+- Searches Used: {{searches_used_low_advocate}}/{self.search_budget_per_advocate}
+- Searches Remaining: {{searches_remaining_low_advocate}}
 - Search Penalty Rate: {self.search_penalty_rate * 100}% per search beyond budget
 - Round: 1 of {self.debate_rounds}
 
 This is Round 1 of {self.debate_rounds}. Provide your initial position for ALL time horizons, considering how probability may change over time.
 
-IMPORTANT: You have a soft limit of {self.search_budget_per_advocate} searches total across all rounds. Use them strategically. Information after {self.training_cutoff} should be prioritized from your searches.
+IMPORTANT: You have a limit of {self.search_budget_per_advocate} searches total across all rounds; searches beyond it are refused. Use them strategically. Information after {self.training_cutoff} should be prioritized from your searches.
 
-{self._get_multi_horizon_low_advocate_instructions()}
+{template_literal(self._get_multi_horizon_low_advocate_instructions())}
 
 OUTPUT: Provide your analysis in JSON format with predictions for each time horizon.
 """
         
         return chain(
-            system_message(get_low_advocate_backstory()),
+            search_budget_status(self.search_ledger, question_id or question),
+            static_system_message(get_low_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
-            generate()
+            use_tools([self.google_news_tool.google_news_search(
+                self.search_ledger.scope(question_id or question, "low_advocate")
+            )]),
+            generate(cache_prompt=self.cache_prompt),
+            record_advocate_turn("low_advocate", 1)
         )
     
     @solver
-    def high_rebuttal_solver(self, question: str, background: str, time_horizons_str: str, round_num: int) -> Solver:
+    def high_rebuttal_solver(self, question: str, background: str, time_horizons_str: str, round_num: int,
+                             question_id: str = None) -> Solver:
         """High advocate rebuttal solver"""
         
-        # Estimate searches used based on round (conservative estimate)
-        estimated_searches_per_round = 2  # Assume 2 searches per round on average
-        searches_used_estimate = (round_num) * estimated_searches_per_round
-        searches_remaining_estimate = max(0, self.search_budget_per_advocate - searches_used_estimate)
-        
         task_description = f"""
 This is Round {round_num + 1} of {self.debate_rounds}. Review the Low Advocate's arguments and provide your rebuttal.
 
-**Question:** {question}
+**Question:** {template_literal(question)}
 **Time Horizons:** {time_horizons_str}
 **Training Cutoff:** {self.training_cutoff}
-**Background:** {background}
+**Background:** {template_literal(background)}
 
 **SEARCH BUDGET STATUS:**
-- Estimated Searches Used: ~{searches_used_estimate}/{self.search_budget_per_advocate}
-- Estimated Searches Remaining: ~{searches_remaining_estimate}
+- Searches Used: {{searches_used_high_advocate}}/{self.search_budget_per_advocate}
+- Searches Remaining: {{searches_remaining_high_advocate}}
 - Search Penalty Rate: {self.search_penalty_rate * 100}% per search beyond budget
 - Round: {round_num + 1} of {self.debate_rounds}
 
@@ -950,36 +1220,36 @@ REBUTTAL INSTRUCTIONS:
 
 SEARCH STRATEGY: Use remaining searches wisely. Focus on finding decisive evidence that counters the Low Advocate's key points. Information after {self.training_cutoff} should be prioritized from your searches.
 
-{self._get_multi_horizon_high_advocate_instructions()}
+{template_literal(self._get_multi_horizon_high_advocate_instructions())}
 """
         
         return chain(
-            system_message(get_high_advocate_backstory()),
+            search_budget_status(self.search_ledger, question_id or question),
+            static_system_message(get_high_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
-            generate()
+            use_tools([self.google_news_tool.google_news_search(
+                self.search_ledger.scope(question_id or question, "high_advocate")
+            )]),
+            generate(cache_prompt=self.cache_prompt),
+            record_advocate_turn("high_advocate", round_num + 1)
         )
     
     @solver
-    def low_rebuttal_solver(self, question: str, background: str, time_horizons_str: str, round_num: int) -> Solver:
+    def low_rebuttal_solver(self, question: str, background: str, time_horizons_str: str, round_num: int,
+                            question_id: str = None) -> Solver:
         """Low advocate rebuttal solver"""
         
-        # Estimate searches used based on round (conservative estimate)
-        estimated_searches_per_round = 2  # Assume 2 searches per round on average
-        searches_used_estimate = (round_num) * estimated_searches_per_round
-        searches_remaining_estimate = max(0, self.search_budget_per_advocate - searches_used_estimate)
-        
         task_description = f"""
 This is Round {round_num + 1} of {self.debate_rounds}. Review the High Advocate's arguments and provide your rebuttal.
 
-**Question:** {question}
+**Question:** {template_literal(question)}
 **Time Horizons:** {time_horizons_str}
 **Training Cutoff:** {self.training_cutoff}
-**Background:** {background}
+**Background:** {template_literal(background)}
 
 **SEARCH BUDGET STATUS:**
-- Estimated Searches Used: ~{searches_used_estimate}/{self.search_budget_per_advocate}
-- Estimated Searches Remaining: ~{searches_remaining_estimate}
+- Searches Used: {{searches_used_low_advocate}}/{self.search_budget_per_advocate}
+- Searches Remaining: {{searches_remaining_low_advocate}}
 - Search Penalty Rate: {self.search_penalty_rate * 100}% per search beyond budget
 - Round: {round_num + 1} of {self.debate_rounds}
 
@@ -991,36 +1261,38 @@ REBUTTAL INSTRUCTIONS:
 
 SEARCH STRATEGY: Use remaining searches wisely. Focus on finding decisive evidence that counters the High Advocate's key points. Information after {self.training_cutoff} should be prioritized from your searches.
 
-{self._get_multi_horizon_low_advocate_instructions()}
+{template_literal(self._get_multi_horizon_low_advocate_instructions())}
 """
         
         return chain(
-            system_message(get_low_advocate_backstory()),
+            search_budget_status(self.search_ledger, question_id or question),
+            static_system_message(get_low_advocate_backstory()),
             user_message(task_description),
-            use_tools([self.google_news_tool.google_news_search]),
-            generate()
+            use_tools([self.google_news_tool.google_news_search(
+                self.search_ledger.scope(question_id or question, "low_advocate")
+            )]),
+            generate(cache_prompt=self.cache_prompt),
+            record_advocate_turn("low_advocate", round_num + 1)
         )
     
     @solver
-    def final_judge_solver(self, question: str, background: str, time_horizons_str: str) -> Solver:
+    def final_judge_solver(self, question: str, background: str, time_horizons_str: str,
+                           question_id: str = None) -> Solver:
         """Final judge that synthesizes the debate into calibrated predictions"""
         
-        # Estimate total searches used across all rounds
-        total_estimated_searches = self.debate_rounds * 2  # Conservative estimate
-        
         task_description = f"""
 MISSION: Synthesize the full debate into well-calibrated probability estimates for each time horizon.
 
-**Question:** {question}
+**Question:** {template_literal(question)}
 **Time Horizons:** {time_horizons_str}
 **Training Cutoff:** {self.training_cutoff}
-**Background:** {background}
+**Background:** {template_literal(background)}
 
 **DEBATE CONTEXT:**
 - Total Debate Rounds: {self.debate_rounds}
 - Search Budget per Advocate: {self.search_budget_per_advocate}
 - Search Penalty Rate: {self.search_penalty_rate * 100}% per search beyond budget
-- Estimated Total Searches Used: ~{total_estimated_searches}
+- Total Searches Used: {{searches_used_total}} (High Advocate: {{searches_used_high_advocate}}, Low Advocate: {{searches_used_low_advocate}})
 
 JUDICIAL SYNTHESIS PROTOCOL:
 1. Review all arguments from both advocates across all {self.debate_rounds} rounds
@@ -1037,149 +1309,50 @@ JUDICIAL SYNTHESIS PROTOCOL:
 - Account for information gathered after {self.training_cutoff} vs prior knowledge
 - Consider if advocates used their search budget effectively
 
-{self._get_judge_output_format()}
+{template_literal(self._get_judge_output_format())}
 """
         
         return chain(
-            system_message(get_debate_judge_backstory()),
+            search_budget_status(self.search_ledger, question_id or question),
+            static_system_message(get_debate_judge_backstory()),
             user_message(task_description),
-            generate()
+            generate(cache_prompt=self.cache_prompt)
         )
     
     def _get_multi_horizon_high_advocate_instructions(self) -> str:
         """Instructions for high advocate considering multiple time horizons"""
-        return f"""
-**MULTI-HORIZON ANALYSIS:**
-- Consider how probability changes over time (e.g., 7-day vs 180-day horizons)
-- Shorter horizons: Focus on immediate momentum and near-term catalysts
-- Longer horizons: Consider trend continuation and fundamental drivers
-- Provide probability ranges for each time horizon
-
-**SEARCH BUDGET MANAGEMENT:**
-- You have {self.search_budget_per_advocate} searches total across all {self.debate_rounds} rounds
-- Each search beyond the budget incurs a {self.search_penalty_rate * 100}% penalty
-- Prioritize searches for information after {self.training_cutoff} (your training cutoff)
-- Use strategic queries that maximize information gain per search
-- Consider saving searches for later rounds if current information is sufficient
-
-**SEARCH STRATEGY TIPS:**
-- Combine multiple concepts in single queries for efficiency
-- Focus on recent developments and expert opinions
-- Look for quantitative data and specific commitments
-- Prioritize authoritative and credible sources
-
-**JSON OUTPUT FORMAT:**
-```json
-{{
-  "position_statement": "Your overall position",
-  "searches_used_this_round": 0,
-  "search_strategy_notes": "Brief notes on your search approach",
-  "time_horizon_predictions": {{
-    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}}
-  }},
-  "key_arguments": ["arg1", "arg2", "arg3"],
-  "evidence_summary": "Summary of key evidence",
-  "rebuttal_points": ["point1", "point2"]
-}}
-```
-"""
+        return _multi_horizon_high_advocate_instructions(self.search_budget_per_advocate, self.debate_rounds,
+                                                         self.search_penalty_rate, self.training_cutoff)
     
     def _get_multi_horizon_low_advocate_instructions(self) -> str:
         """Instructions for low advocate considering multiple time horizons"""
-        return f"""
-**MULTI-HORIZON ANALYSIS:**
-- Consider how obstacles compound over time
-- Shorter horizons: Focus on immediate barriers and missing prerequisites
-- Longer horizons: Consider how challenges accumulate and multiply
-- Provide probability ranges for each time horizon
-
-**SEARCH BUDGET MANAGEMENT:**
-- You have {self.search_budget_per_advocate} searches total across all {self.debate_rounds} rounds
-- Each search beyond the budget incurs a {self.search_penalty_rate * 100}% penalty
-- Prioritize searches for information after {self.training_cutoff} (your training cutoff)
-- Use strategic queries that maximize information gain per search
-- Consider saving searches for later rounds if current information is sufficient
-
-**SEARCH STRATEGY TIPS:**
-- Look for evidence of obstacles, delays, and challenges
-- Search for expert skepticism and critical assessments
-- Find data on resource constraints and competing priorities
-- Identify failure modes and risk factors
-
-**JSON OUTPUT FORMAT:**
-```json
-{{
-  "position_statement": "Your overall position",
-  "searches_used_this_round": 0,
-  "search_strategy_notes": "Brief notes on your search approach",
-  "time_horizon_predictions": {{
-    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}},
-    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "key_factors": ["factor1", "factor2"]}}
-  }},
-  "key_arguments": ["arg1", "arg2", "arg3"],
-  "evidence_summary": "Summary of key evidence",
-  "rebuttal_points": ["point1", "point2"]
-}}
-```
-"""
+        return _multi_horizon_low_advocate_instructions(self.search_budget_per_advocate, self.debate_rounds,
+                                                        self.search_penalty_rate, self.training_cutoff)
     
     def _get_judge_output_format(self) -> str:
         """Output format for final judge"""
-        return f"""
-**JSON OUTPUT FORMAT:**
-```json
-{{
-  "final_predictions": {{
-    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}}
-  }},
-  "synthesis_reasoning": "Overall synthesis of the debate",
-  "evidence_quality_assessment": "Assessment of evidence from both sides",
-  "search_efficiency_evaluation": "How well did advocates use their search budget?",
-  "training_cutoff_impact": "How much did post-{self.training_cutoff} information influence the forecast?",
-  "uncertainty_factors": ["factor1", "factor2", "factor3"],
-  "high_advocate_evaluation": {{
-    "strength": 0.X,
-    "evidence_quality": 0.Y,
-    "search_effectiveness": 0.Z,
-    "key_strengths": ["strength1", "strength2"]
-  }},
-  "low_advocate_evaluation": {{
-    "strength": 0.X,
-    "evidence_quality": 0.Y,
-    "search_effectiveness": 0.Z,
-    "key_strengths": ["strength1", "strength2"]
-  }},
-  "calibration_notes": "Notes on calibration and confidence",
-  "search_budget_analysis": "Analysis of how search budget constraints affected the debate quality"
-}}
-```
-"""
+        return _judge_output_format(self.training_cutoff)
     
     @task
     def multi_horizon_debate_forecasting_task(self, question: str, background: str = "", 
-                                             time_horizons: List[str] = None) -> Task:
+                                             time_horizons: List[str] = None, question_id: str = None) -> Task:
         """Create a multi-horizon debate-based forecasting task"""
         
         if time_horizons is None:
             time_horizons = ["7", "30", "90", "180"]  # Default time horizons in days
         
         # Create the multi-horizon debate solver
-        debate_solver = self.multi_horizon_debate_solver(question, background, time_horizons)
+        debate_solver = self.multi_horizon_debate_solver(question, background, time_horizons, question_id)
         
         return Task(
-            dataset=[{
-                "question": question, 
-                "background": background, 
-                "time_horizons": time_horizons
-            }],
+            dataset=[Sample(
+                input=background or question,
+                metadata={
+                    "question_id": question_id or question,
+                    "question": question,
+                    "time_horizons": time_horizons
+                }
+            )],
             solver=debate_solver,
             scorer=None  # We'll handle scoring manually
         )
@@ -1193,7 +1366,8 @@ JUDICIAL SYNTHESIS PROTOCOL:
         recommended_articles: int = None,
         max_search_queries: int = None,
         prior_probability: float = None,
-        is_benchmark: bool = False
+        is_benchmark: bool = False,
+        question_id: str = None
     ) -> List[ForecastResult]:
         """
         Generate forecasts using Inspect AI multi-horizon debate methodology
@@ -1206,6 +1380,7 @@ JUDICIAL SYNTHESIS PROTOCOL:
             recommended_articles: Number of articles to search for
             max_search_queries: Maximum search queries
             prior_probability: Prior probability estimate
+            question_id: Key the question's searches are counted under in the search ledger
             
         Returns:
             List of ForecastResult objects, one per time horizon
@@ -1229,7 +1404,7 @@ JUDICIAL SYNTHESIS PROTOCOL:
         
         try:
             if self.debate_mode:
-                return self._run_multi_horizon_debate_forecast(question, background, normalized_horizons)
+                return self._run_multi_horizon_debate_forecast(question, background, normalized_horizons, question_id)
             else:
                 return self._run_standard_multi_horizon_forecast(question, background, normalized_horizons)
                 
@@ -1247,14 +1422,16 @@ JUDICIAL SYNTHESIS PROTOCOL:
                 fallback_results.append(fallback_result)
             return fallback_results
     
-    def _run_multi_horizon_debate_forecast(self, question: str, background: str, time_horizons: List[str]) -> List[ForecastResult]:
+    def _run_multi_horizon_debate_forecast(self, question: str, background: str, time_horizons: List[str],
+                                           question_id: str = None) -> List[ForecastResult]:
         """Run multi-horizon debate-based forecasting using Inspect AI"""
+        question_key = question_id or question
         
         print("🗣️ Running multi-horizon debate-based forecast")
         
         try:
             # Create the multi-horizon debate task
-            debate_task = self.multi_horizon_debate_forecasting_task(question, background, time_horizons)
+            debate_task = self.multi_horizon_debate_forecasting_task(question, background, time_horizons, question_key)
             
             # Run the evaluation with Inspect AI native logging
             eval_result = eval(
@@ -1277,40 +1454,9 @@ JUDICIAL SYNTHESIS PROTOCOL:
             )
             
             # Extract results from Inspect AI evaluation for each time horizon
-            results = []
-            judge_output = self._extract_judge_output_from_result(eval_result)
-            
-            for horizon in time_horizons:
-                horizon_key = f"{horizon}_day"
-                
-                if judge_output and "final_predictions" in judge_output and horizon_key in judge_output["final_predictions"]:
-                    horizon_data = judge_output["final_predictions"][horizon_key]
-                    probability = horizon_data.get("probability", 0.5)
-                    confidence = horizon_data.get("confidence", "MEDIUM")
-                    reasoning = horizon_data.get("reasoning", "No specific reasoning provided")
-                else:
-                    # Fallback parsing
-                    probability = self._extract_probability_from_result(eval_result)
-                    confidence = self._extract_confidence_from_result(eval_result)
-                    reasoning = f"Extracted from general result for {horizon} days"
-                
-                # Extract metadata for search tracking
-                search_count = self._extract_search_count_from_result(eval_result)
-                api_calls = self._extract_api_calls_from_result(eval_result)
-                
-                result = ForecastResult(
-                    question=question,
-                    prediction=probability,
-                    confidence=confidence,
-                    reasoning=reasoning,
-                    search_count=search_count,
-                    api_calls=api_calls,
-                    timestamp=datetime.now().isoformat()
-                )
-                
-                results.append(result)
-            
-            return results
+            samples = eval_result[0].samples if eval_result and eval_result[0].samples else []
+            stats = debate_stats(samples[0].store if samples else {})
+            return self._build_horizon_results(question, question_key, time_horizons, eval_result, stats)
             
         except Exception as e:
             print(f"Error in Inspect AI multi-horizon debate forecast: {str(e)}")
@@ -1344,6 +1490,163 @@ JUDICIAL SYNTHESIS PROTOCOL:
                     results.append(result)
                 return results
     
+    def _build_horizon_results(self, question: str, question_key: str, time_horizons: List[str],
+                               eval_result, stats: Dict[str, int] = None) -> List[ForecastResult]:
+        """One ForecastResult per horizon from a debate's output (an eval result or the judge's completion)"""
+        stats = stats or debate_stats({})
+        results = []
+        judge_output = self._extract_judge_output_from_result(eval_result)
+        
+        for horizon in time_horizons:
+            horizon_prediction = parse_horizon_prediction(judge_output, f"{horizon}_day")
+            
+            if horizon_prediction is not None:
+                probability, confidence, reasoning = horizon_prediction
+            else:
+                # Fallback parsing
+                probability = self._extract_probability_from_result(eval_result)
+                confidence = self._extract_confidence_from_result(eval_result)
+                reasoning = f"Extracted from general result for {horizon} days"
+            
+            # Actual SERP calls made by both advocates on this question
+            search_count = self.search_ledger.used(question_key)
+            api_calls = self._extract_api_calls_from_result(eval_result)
+            
+            result = ForecastResult(
+                question=question,
+                prediction=probability,
+                confidence=confidence,
+                reasoning=reasoning,
+                search_count=search_count,
+                api_calls=api_calls,
+                timestamp=datetime.now().isoformat(),
+                debate_rounds_completed=stats["debate_rounds_completed"],
+                llm_calls_saved=stats["llm_calls_saved"]
+            )
+            
+            results.append(result)
+        
+        return results
+    
+    @solver
+    def per_question_debate_solver(self) -> Solver:
+        """
+        Debate solver for a dataset of questions: builds each sample's multi-horizon
+        debate from its metadata (question, question_id, time_horizons) and its input (background)
+        Searches are budgeted and session-limited per sample, although every sample shares one tool
+        """
+        async def solve(state: TaskState, generate: Generate) -> TaskState:
+            question = state.metadata.get("question", state.input_text)
+            time_horizons = [str(h) for h in state.metadata.get("time_horizons", self.time_horizons)]
+            question_id = state.metadata.get("question_id") or str(state.sample_id)
+            debate_solver = self.multi_horizon_debate_solver(
+                question, state.input_text, time_horizons, question_id
+            )
+            return await debate_solver(state, generate)
+        
+        return solve
+    
+    def forecast_batch(
+        self,
+        questions: List[Dict[str, Any]],
+        time_horizons: List[str] = None,
+        cutoff_date: datetime = None,
+        max_samples: int = None,
+        max_connections: int = None
+    ) -> Dict[str, List[ForecastResult]]:
+        """
+        Run the multi-horizon debate for many questions in a single Inspect AI eval
+        
+        Each question is one sample, so Inspect AI schedules all debates together
+        (bounded by max_samples concurrent samples and max_connections concurrent
+        model requests) instead of one eval per question. The samples share the
+        forecaster's Google News tool, whose session limit and search budget are
+        counted per question.
+        
+        Args:
+            questions: Dicts with 'id', 'question' and 'background' (the comprehensive context)
+            time_horizons: Horizons in days (e.g. ["7", "30"] or ["7d", "30d"])
+            cutoff_date: Information cutoff date for searches
+            max_samples: Maximum debates running at once (Inspect AI default if None)
+            max_connections: Maximum concurrent model connections (Inspect AI default if None)
+            
+        Returns:
+            Dict of question id -> list of ForecastResult objects, one per time horizon
+            (questions whose sample failed are left out so callers can retry them)
+        """
+        if time_horizons is None:
+            time_horizons = ["7", "30", "90", "180"]
+        normalized_horizons = [str(h)[:-1] if str(h).endswith('d') else str(h) for h in time_horizons]
+        
+        if cutoff_date:
+            self._set_benchmark_cutoff_date(cutoff_date.strftime("%Y-%m-%d"))
+        
+        samples = [
+            Sample(
+                id=question_data['id'],
+                input=question_data.get('background') or question_data['question'],
+                metadata={
+                    "question_id": question_data['id'],
+                    "question": question_data['question'],
+                    "time_horizons": normalized_horizons
+                }
+            )
+            for question_data in questions
+        ]
+        if not samples:
+            return {}
+        questions_by_id = {str(question_data['id']): question_data['question'] for question_data in questions}
+        
+        print(f"🗣️ Running batched multi-horizon debate eval for {len(samples)} questions "
+              f"(max_samples: {max_samples or 'default'}, max_connections: {max_connections or 'default'})")
+        
+        batch_task = Task(
+            dataset=MemoryDataset(samples, name="forecastbench_batch"),
+            solver=self.per_question_debate_solver(),
+            scorer=None  # Scored by the caller against resolutions
+        )
+        
+        eval_options = {}
+        if max_samples:
+            eval_options["max_samples"] = max_samples
+        if max_connections:
+            eval_options["max_connections"] = max_connections
+        
+        try:
+            logs = eval(
+                batch_task,
+                model=self.model,
+                log_dir="logs/inspect_ai",
+                fail_on_error=False,
+                metadata={
+                    "time_horizons": normalized_horizons,
+                    "question_count": len(samples),
+                    "debate_mode": self.debate_mode,
+                    "debate_rounds": self.debate_rounds,
+                    "search_budget": self.search_budget_per_advocate,
+                    "search_penalty_rate": self.search_penalty_rate
+                },
+                **eval_options
+            )
+        except Exception as e:
+            print(f"❌ Batched debate eval failed: {str(e)}")
+            return {}
+        
+        forecasts = {}
+        for log in logs:
+            for sample in log.samples or []:
+                question_id = str(sample.id)
+                if sample.error or not sample.output or not sample.output.completion:
+                    print(f"⚠️ No debate output for question {question_id}: {sample.error.message if sample.error else 'empty completion'}")
+                    continue
+                forecasts[question_id] = self._build_horizon_results(
+                    questions_by_id.get(question_id, ""), question_id, normalized_horizons, sample.output.completion,
+                    debate_stats(sample.store)
+                )
+        
+        print(f"✅ Batched debate eval completed: {len(forecasts)}/{len(samples)} questions forecast")
+        return forecasts
+    
     def _run_standard_multi_horizon_forecast(self, question: str, background: str, time_horizons: List[str]) -> List[ForecastResult]:
         """Run standard multi-horizon forecasting using Inspect AI"""
         
@@ -1370,22 +1673,7 @@ JUDICIAL SYNTHESIS PROTOCOL:
         """Extract structured judge output from Inspect AI evaluation result"""
         try:
             # Look for JSON output in the result
-            result_str = str(eval_result)
-            
-            # Try to find JSON structure in the result
-            import re
-            json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-            json_matches = re.findall(json_pattern, result_str, re.DOTALL)
-            
-            for match in json_matches:
-                try:
-                    parsed_json = json.loads(match)
-                    if "final_predictions" in parsed_json:
-                        return parsed_json
-                except json.JSONDecodeError:
-                    continue
-            
-            return None
+            return find_judge_output(str(eval_result))
             
         except Exception as e:
             print(f"Warning: Could not extract judge output: {e}")
@@ -1407,7 +1695,7 @@ JUDICIAL SYNTHESIS PROTOCOL:
                 solver=chain(
                     system_message("You are an expert forecasting analyst. Provide probability estimates based on available information."),
                     user_message(f"Question: {question}\nBackground: {background}\nTime Horizon: {time_horizon}\n\nProvide a probability estimate (0.0-1.0) and reasoning."),
-                    use_tools([self.google_news_tool.google_news_search]),
+                    use_tools([self.google_news_tool.google_news_search()]),
                     generate()
                 ),
                 scorer=None
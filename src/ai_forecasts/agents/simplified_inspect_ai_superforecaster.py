@@ -6,17 +6,18 @@ import json
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence
 from dataclasses import dataclass
 
 from inspect_ai import Task, eval, task
 from inspect_ai.dataset import Sample, Dataset
 from inspect_ai.model import get_model
 from inspect_ai.solver import (
-    generate, system_message, user_message,
-    chain, fork, use_tools, solver, Solver
+    generate, user_message,
+    chain, use_tools, solver, Solver
 )
-from inspect_ai.tool import tool, ToolError
+from inspect_ai.tool import tool, Tool, ToolError
 from inspect_ai.scorer import Scorer, Score
 from inspect_ai.log import EvalLog
 
@@ -28,6 +29,17 @@ from .simplified_debate_prompts import (
 
 # Import cached SERP API Google News Tool
 from ..utils.google_news_tool import CachedGoogleNewsTool
+from ..utils.search_budget import SearchBudgetLedger, SearchBudgetScope
+from .inspect_ai_superforecaster import search_budget_status, template_literal
+from .debate_solvers import (
+    parallel_turns,
+    record_advocate_turn,
+    end_debate_round,
+    unless_converged,
+    compact_transcript,
+    static_system_message,
+    debate_stats
+)
 
 
 @dataclass
@@ -40,6 +52,8 @@ class ForecastResult:
     search_count: int = 0
     api_calls: int = 0
     timestamp: str = ""
+    debate_rounds_completed: int = 0
+    llm_calls_saved: int = 0
     
     def __post_init__(self):
         if not self.timestamp:
@@ -55,14 +69,194 @@ class InspectAIGoogleNewsTool:
             search_timeframe=search_timeframe
         )
     
-    @tool
-    def google_news_search(self, query: str, num_results: int = 10) -> str:
-        """Search Google News for recent articles related to the query"""
-        try:
-            results = self.cached_tool._run(query)
-            return results
-        except Exception as e:
-            raise ToolError(f"Google News search failed: {str(e)}")
+    def google_news_search(self, budget_scope: SearchBudgetScope = None) -> Tool:
+        """Create the async Inspect AI tool backed by the cached Google News search"""
+        cached_tool = self.cached_tool
+        
+        @tool(name="google_news_search")
+        def google_news_search() -> Tool:
+            async def execute(query: str, search_type: str = "focused", priority: str = "high") -> str:
+                """
+                Search Google News for recent articles related to the query.
+                
+                Args:
+                    query: Search query for Google News
+                    search_type: Type of search: focused, comprehensive, expert_opinions, historical, contrarian
+                    priority: Priority level: high, medium, low - affects API usage
+                
+                Returns:
+                    Formatted list of matching news articles
+                """
+                try:
+                    # Non-blocking search so tool calls from concurrent samples overlap
+                    return await cached_tool._arun(query, search_type=search_type, priority=priority,
+                                                   budget_scope=budget_scope)
+                except Exception as e:
+                    raise ToolError(f"Google News search failed: {str(e)}")
+            
+            return execute
+        
+        return google_news_search()
+
+
+@lru_cache(maxsize=256)
+def _initial_advocate_prompt(
+    advocate_type: str,
+    round_num: int,
+    time_horizons_str: str,
+    search_budget_per_advocate: int,
+    debate_rounds: int,
+    training_cutoff: str
+) -> str:
+    """Generate initial advocate prompt"""
+    mission = "HIGH probability outcomes" if advocate_type == "high" else "LOW probability outcomes"
+    
+    output_format = f"""```json
+{{
+  "round": {round_num},
+  "advocate_type": "{advocate_type}",
+  "position_statement": "Your overall position",
+  "time_horizon_predictions": {{
+    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
+    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}}
+  }},
+  "key_arguments": ["arg1", "arg2", "arg3"],
+  "evidence_summary": "Summary of key evidence",
+  "searches_used_this_round": 0
+}}
+```
+"""
+    
+    return f"""
+MISSION: Build the strongest possible case for {mission} across multiple time horizons.
+
+**Time Horizons:** {time_horizons_str}
+**Training Cutoff:** {training_cutoff}
+**Round:** {round_num} of {debate_rounds}
+
+**SEARCH BUDGET STATUS:**
+- Total Search Budget: {search_budget_per_advocate} queries
+- Searches Used: {{searches_used_{advocate_type}_advocate}}
+- Searches Remaining: {{searches_remaining_{advocate_type}_advocate}}
+
+**INSTRUCTIONS:**
+1. Analyze the question for ALL time horizons
+2. Consider how probability changes over time
+3. Use your search budget strategically
+4. Provide structured analysis with probability estimates
+
+**REQUIRED JSON OUTPUT:**
+{template_literal(output_format)}
+"""
+
+
+@lru_cache(maxsize=256)
+def _rebuttal_prompt(
+    advocate_type: str,
+    round_num: int,
+    time_horizons_str: str,
+    search_budget_per_advocate: int,
+    debate_rounds: int,
+    training_cutoff: str
+) -> str:
+    """Generate rebuttal prompt"""
+    mission = "HIGH probability outcomes" if advocate_type == "high" else "LOW probability outcomes"
+    opponent_type = "Low" if advocate_type == "high" else "High"
+    
+    output_format = f"""```json
+{{
+  "round": {round_num},
+  "advocate_type": "{advocate_type}",
+  "rebuttal_to_opponent": "Direct response to opponent's arguments",
+  "strengthened_position": "Your reinforced position",
+  "time_horizon_predictions": {{
+    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
+    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
+    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
+    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}}
+  }},
+  "new_evidence": "New evidence presented in this round",
+  "searches_used_this_round": 1
+}}
+```
+"""
+    
+    return f"""
+REBUTTAL - Round {round_num} of {debate_rounds}
+
+Review the {opponent_type} Advocate's arguments and provide your rebuttal to strengthen your case for {mission}.
+
+**Time Horizons:** {time_horizons_str}
+**Training Cutoff:** {training_cutoff}
+
+**SEARCH BUDGET STATUS:**
+- Total Search Budget: {search_budget_per_advocate} queries
+- Searches Used: {{searches_used_{advocate_type}_advocate}}
+- Searches Remaining: {{searches_remaining_{advocate_type}_advocate}}
+
+**REBUTTAL INSTRUCTIONS:**
+1. Address the opponent's strongest arguments directly
+2. Provide new evidence or reasoning that counters their position
+3. Strengthen your case across all time horizons
+4. Use remaining searches strategically
+
+**REQUIRED JSON OUTPUT:**
+{template_literal(output_format)}
+"""
+
+
+@lru_cache(maxsize=256)
+def _judge_prompt(
+    time_horizons_str: str,
+    search_budget_per_advocate: int,
+    debate_rounds: int,
+    training_cutoff: str,
+    time_horizons: Sequence[str]
+) -> str:
+    """Generate judge prompt"""
+    # Create dynamic predictions structure based on actual time horizons
+    predictions_structure = {}
+    for horizon in time_horizons:
+        predictions_structure[f"{horizon}_day"] = "0.XX"
+    
+    predictions_json = json.dumps(predictions_structure, indent=4)
+    
+    output_format = f"""```json
+{{
+  "final_predictions": {predictions_json.replace('"0.XX"', '0.XX')},
+  "confidence_scores": {predictions_json.replace('"0.XX"', '0.XX')},
+  "reasoning": {{
+    {', '.join([f'"{horizon}_day": "Reasoning for {horizon}-day prediction"' for horizon in time_horizons])}
+  }},
+  "debate_summary": "Summary of key debate points that influenced your decision",
+  "search_efficiency_evaluation": "Assessment of how well advocates used their search budget",
+  "training_cutoff_impact": "How the training cutoff affected prediction quality"
+}}
+```
+"""
+    
+    return f"""
+FINAL JUDGMENT
+
+You have observed {debate_rounds} rounds of debate between high and low probability advocates.
+Each advocate had a search budget of {search_budget_per_advocate} queries.
+Searches actually used: {{searches_used_total}} (High Advocate: {{searches_used_high_advocate}}, Low Advocate: {{searches_used_low_advocate}})
+
+**Time Horizons:** {time_horizons_str}
+**Training Cutoff:** {training_cutoff}
+
+**JUDICIAL SYNTHESIS PROTOCOL:**
+1. Review all arguments from both advocates across all {debate_rounds} rounds
+2. Evaluate evidence quality, logical consistency, and bias detection
+3. Apply proper calibration techniques for each time horizon
+4. Provide final probability estimates with reasoning
+5. Consider how probabilities change across time horizons
+
+**REQUIRED JSON OUTPUT:**
+{template_literal(output_format)}
+"""
 
 
 class SimplifiedInspectAISuperforecaster:
@@ -93,6 +287,16 @@ class SimplifiedInspectAISuperforecaster:
             base_url="https://openrouter.ai/api/v1"
         )
         
+        # Initialize Google News tool once; it is reused by every forecast from this instance
+        search_timeframe = {
+            "start": "06/01/2024",
+            "end": datetime.now().strftime("%m/%d/%Y")
+        }
+        self.google_news_tool = InspectAIGoogleNewsTool(
+            serp_api_key=self.serp_api_key,
+            search_timeframe=search_timeframe
+        )
+        
         print("✅ Simplified Inspect AI Superforecaster initialized successfully")
     
     def forecast_with_google_news(
@@ -104,6 +308,12 @@ class SimplifiedInspectAISuperforecaster:
         search_budget_per_advocate: int = 10,
         debate_rounds: int = 3,
         training_cutoff: str = "2024-07-01",
+        search_ledger: SearchBudgetLedger = None,
+        question_id: str = None,
+        concurrent_rebuttals: bool = False,
+        convergence_threshold: float = None,
+        compact_transcripts: bool = False,
+        cache_prompt: bool = True,
         **kwargs
     ) -> List[ForecastResult]:
         """
@@ -117,6 +327,12 @@ class SimplifiedInspectAISuperforecaster:
             search_budget_per_advocate: Number of searches per advocate
             debate_rounds: Number of debate rounds
             training_cutoff: Model training cutoff date
+            search_ledger: Run-wide search ledger (a per-call ledger is used if not given)
+            question_id: Key the question's searches are counted under in the ledger
+            concurrent_rebuttals: Generate both advocates' rebuttals in a round concurrently from the previous round's transcript
+            convergence_threshold: Skip the remaining rebuttal rounds once every horizon's advocate probabilities are this close
+            compact_transcripts: Replace earlier rounds with the advocates' structured JSON before each later round and the judge
+            cache_prompt: Mark debate prompts for provider-side prefix caching
             
         Returns:
             List of ForecastResult objects, one per time horizon
@@ -132,15 +348,11 @@ class SimplifiedInspectAISuperforecaster:
             else:
                 normalized_horizons.append(str(horizon))
         
-        # Initialize Google News tool
-        search_timeframe = {
-            "start": "06/01/2024",
-            "end": datetime.now().strftime("%m/%d/%Y")
-        }
-        google_news_tool = InspectAIGoogleNewsTool(
-            serp_api_key=self.serp_api_key,
-            search_timeframe=search_timeframe
-        )
+        google_news_tool = self.google_news_tool
+        
+        # Actual per-advocate search accounting for this question
+        search_ledger = search_ledger or SearchBudgetLedger(budget_per_role=search_budget_per_advocate)
+        question_key = question_id or question
         
         # Set cutoff date if provided
         if cutoff_date and hasattr(google_news_tool.cached_tool, 'set_benchmark_cutoff_date'):
@@ -151,6 +363,9 @@ class SimplifiedInspectAISuperforecaster:
         print(f"   Debate rounds: {debate_rounds}")
         print(f"   Search budget per advocate: {search_budget_per_advocate}")
         print(f"   Training cutoff: {training_cutoff}")
+        print(f"   Concurrent rebuttals: {concurrent_rebuttals}")
+        if convergence_threshold is not None:
+            print(f"   Convergence threshold: {convergence_threshold}")
         
         try:
             # Create and run the debate task
@@ -161,7 +376,13 @@ class SimplifiedInspectAISuperforecaster:
                 search_budget_per_advocate=search_budget_per_advocate,
                 debate_rounds=debate_rounds,
                 training_cutoff=training_cutoff,
-                google_news_tool=google_news_tool
+                google_news_tool=google_news_tool,
+                search_ledger=search_ledger,
+                question_key=question_key,
+                concurrent_rebuttals=concurrent_rebuttals,
+                convergence_threshold=convergence_threshold,
+                compact_transcripts=compact_transcripts,
+                cache_prompt=cache_prompt
             )
             
             # Run the evaluation
@@ -174,6 +395,8 @@ class SimplifiedInspectAISuperforecaster:
             # Extract results for each time horizon
             results = []
             judge_output = self._extract_judge_output_from_result(eval_result)
+            samples = eval_result[0].samples if eval_result and eval_result[0].samples else []
+            stats = debate_stats(samples[0].store if samples else {})
             
             for horizon in normalized_horizons:
                 horizon_key = f"{horizon}_day"
@@ -210,7 +433,10 @@ class SimplifiedInspectAISuperforecaster:
                     prediction=probability,
                     confidence=confidence,
                     reasoning=reasoning,
-                    timestamp=datetime.now().isoformat()
+                    search_count=search_ledger.used(question_key),
+                    timestamp=datetime.now().isoformat(),
+                    debate_rounds_completed=stats["debate_rounds_completed"],
+                    llm_calls_saved=stats["llm_calls_saved"]
                 )
                 
                 results.append(result)
@@ -239,24 +465,42 @@ class SimplifiedInspectAISuperforecaster:
         search_budget_per_advocate: int,
         debate_rounds: int,
         training_cutoff: str,
-        google_news_tool: InspectAIGoogleNewsTool
+        google_news_tool: InspectAIGoogleNewsTool,
+        search_ledger: SearchBudgetLedger,
+        question_key: str,
+        concurrent_rebuttals: bool = False,
+        convergence_threshold: float = None,
+        compact_transcripts: bool = False,
+        cache_prompt: bool = True
     ) -> Task:
         """Create a configurable debate task"""
         
+        # The runner's comprehensive context already opens with the question
+        sample_input = background if question in background else f"QUESTION: {question}\n\n{background}".strip()
+        
         @task
         def configurable_debate_forecasting():
             return Task(
-                dataset=[{
-                    "question": question,
-                    "background": background,
-                    "time_horizons": time_horizons
-                }],
+                dataset=[Sample(
+                    input=sample_input,
+                    metadata={
+                        "question_id": question_key,
+                        "question": question,
+                        "time_horizons": time_horizons
+                    }
+                )],
                 solver=self._create_debate_solver(
                     time_horizons=time_horizons,
                     search_budget_per_advocate=search_budget_per_advocate,
                     debate_rounds=debate_rounds,
                     training_cutoff=training_cutoff,
-                    google_news_tool=google_news_tool
+                    google_news_tool=google_news_tool,
+                    search_ledger=search_ledger,
+                    question_key=question_key,
+                    concurrent_rebuttals=concurrent_rebuttals,
+                    convergence_threshold=convergence_threshold,
+                    compact_transcripts=compact_transcripts,
+                    cache_prompt=cache_prompt
                 ),
                 scorer=None
             )
@@ -269,23 +513,39 @@ class SimplifiedInspectAISuperforecaster:
         search_budget_per_advocate: int,
         debate_rounds: int,
         training_cutoff: str,
-        google_news_tool: InspectAIGoogleNewsTool
+        google_news_tool: InspectAIGoogleNewsTool,
+        search_ledger: SearchBudgetLedger,
+        question_key: str,
+        concurrent_rebuttals: bool = False,
+        convergence_threshold: float = None,
+        compact_transcripts: bool = False,
+        cache_prompt: bool = True
     ) -> Solver:
-        """Create the main debate solver with configurable parameters"""
+        """
+        Create the main debate solver with configurable parameters
+        Opening positions always run concurrently; with concurrent_rebuttals both
+        advocates' rebuttals in each later round do too (each sees only the previous rounds).
+        With a convergence_threshold, rebuttal rounds stop once the advocates agree;
+        with compact_transcripts, each later round sees earlier rounds only as structured JSON.
+        Backstories are added once, so later turns share one cacheable system prefix
+        """
         
         @solver
         def debate_solver():
             time_horizons_str = ", ".join([f"{h} days" for h in time_horizons])
+            high_search_scope = search_ledger.scope(question_key, "high_advocate")
+            low_search_scope = search_ledger.scope(question_key, "low_advocate")
             
             # Create debate chain with configurable rounds
             debate_chain = []
             
             # Round 1: Initial positions (parallel)
             debate_chain.append(
-                fork(
+                parallel_turns(
                     # High advocate initial position
                     chain(
-                        system_message(get_high_advocate_backstory()),
+                        search_budget_status(search_ledger, question_key),
+                        static_system_message(get_high_advocate_backstory()),
                         user_message(self._get_initial_advocate_prompt(
                             advocate_type="high",
                             round_num=1,
@@ -294,12 +554,14 @@ class SimplifiedInspectAISuperforecaster:
                             debate_rounds=debate_rounds,
                             training_cutoff=training_cutoff
                         )),
-                        use_tools([google_news_tool.google_news_search]),
-                        generate()
+                        use_tools([google_news_tool.google_news_search(high_search_scope)]),
+                        generate(cache_prompt=cache_prompt),
+                        record_advocate_turn("high_advocate", 1)
                     ),
                     # Low advocate initial position
                     chain(
-                        system_message(get_low_advocate_backstory()),
+                        search_budget_status(search_ledger, question_key),
+                        static_system_message(get_low_advocate_backstory()),
                         user_message(self._get_initial_advocate_prompt(
                             advocate_type="low",
                             round_num=1,
@@ -308,60 +570,75 @@ class SimplifiedInspectAISuperforecaster:
                             debate_rounds=debate_rounds,
                             training_cutoff=training_cutoff
                         )),
-                        use_tools([google_news_tool.google_news_search]),
-                        generate()
+                        use_tools([google_news_tool.google_news_search(low_search_scope)]),
+                        generate(cache_prompt=cache_prompt),
+                        record_advocate_turn("low_advocate", 1)
                     )
                 )
             )
             
-            # Subsequent rounds: alternating rebuttals
+            debate_chain.append(end_debate_round(1, debate_rounds, convergence_threshold))
+            if compact_transcripts:
+                debate_chain.append(compact_transcript())
+            
+            # Subsequent rounds: rebuttals, alternating or concurrent within the round
             for round_num in range(2, debate_rounds + 1):
                 # High advocate rebuttal
-                debate_chain.append(
-                    chain(
-                        system_message(get_high_advocate_backstory()),
-                        user_message(self._get_rebuttal_prompt(
-                            advocate_type="high",
-                            round_num=round_num,
-                            time_horizons_str=time_horizons_str,
-                            search_budget_per_advocate=search_budget_per_advocate,
-                            debate_rounds=debate_rounds,
-                            training_cutoff=training_cutoff
-                        )),
-                        use_tools([google_news_tool.google_news_search]),
-                        generate()
-                    )
+                high_rebuttal = chain(
+                    search_budget_status(search_ledger, question_key),
+                    static_system_message(get_high_advocate_backstory()),
+                    user_message(self._get_rebuttal_prompt(
+                        advocate_type="high",
+                        round_num=round_num,
+                        time_horizons_str=time_horizons_str,
+                        search_budget_per_advocate=search_budget_per_advocate,
+                        debate_rounds=debate_rounds,
+                        training_cutoff=training_cutoff
+                    )),
+                    use_tools([google_news_tool.google_news_search(high_search_scope)]),
+                    generate(cache_prompt=cache_prompt),
+                    record_advocate_turn("high_advocate", round_num)
                 )
                 
                 # Low advocate rebuttal
-                debate_chain.append(
-                    chain(
-                        system_message(get_low_advocate_backstory()),
-                        user_message(self._get_rebuttal_prompt(
-                            advocate_type="low",
-                            round_num=round_num,
-                            time_horizons_str=time_horizons_str,
-                            search_budget_per_advocate=search_budget_per_advocate,
-                            debate_rounds=debate_rounds,
-                            training_cutoff=training_cutoff
-                        )),
-                        use_tools([google_news_tool.google_news_search]),
-                        generate()
-                    )
+                low_rebuttal = chain(
+                    search_budget_status(search_ledger, question_key),
+                    static_system_message(get_low_advocate_backstory()),
+                    user_message(self._get_rebuttal_prompt(
+                        advocate_type="low",
+                        round_num=round_num,
+                        time_horizons_str=time_horizons_str,
+                        search_budget_per_advocate=search_budget_per_advocate,
+                        debate_rounds=debate_rounds,
+                        training_cutoff=training_cutoff
+                    )),
+                    use_tools([google_news_tool.google_news_search(low_search_scope)]),
+                    generate(cache_prompt=cache_prompt),
+                    record_advocate_turn("low_advocate", round_num)
                 )
+                
+                # Skipped once the advocates have converged
+                if concurrent_rebuttals:
+                    debate_chain.append(unless_converged(parallel_turns(high_rebuttal, low_rebuttal), llm_calls=2))
+                else:
+                    debate_chain.extend([unless_converged(high_rebuttal), unless_converged(low_rebuttal)])
+                debate_chain.append(end_debate_round(round_num, debate_rounds, convergence_threshold))
+                if compact_transcripts:
+                    debate_chain.append(compact_transcript())
             
             # Final judge decision
             debate_chain.append(
                 chain(
-                    system_message(get_debate_judge_backstory()),
+                    search_budget_status(search_ledger, question_key),
+                    static_system_message(get_debate_judge_backstory()),
                     user_message(self._get_judge_prompt(
                         time_horizons_str=time_horizons_str,
                         search_budget_per_advocate=search_budget_per_advocate,
                         debate_rounds=debate_rounds,
                         training_cutoff=training_cutoff,
-                        time_horizons=time_horizons
+                        time_horizons=tuple(time_horizons)
                     )),
-                    generate()
+                    generate(cache_prompt=cache_prompt)
                 )
             )
             
@@ -379,44 +656,8 @@ class SimplifiedInspectAISuperforecaster:
         training_cutoff: str
     ) -> str:
         """Generate initial advocate prompt"""
-        mission = "HIGH probability outcomes" if advocate_type == "high" else "LOW probability outcomes"
-        
-        return f"""
-MISSION: Build the strongest possible case for {mission} across multiple time horizons.
-
-**Time Horizons:** {time_horizons_str}
-**Training Cutoff:** {training_cutoff}
-**Round:** {round_num} of {debate_rounds}
-
-**SEARCH BUDGET STATUS:**
-- Total Search Budget: {search_budget_per_advocate} queries
-- Searches Used This Round: 0
-- Searches Remaining: {search_budget_per_advocate}
-
-**INSTRUCTIONS:**
-1. Analyze the question for ALL time horizons
-2. Consider how probability changes over time
-3. Use your search budget strategically
-4. Provide structured analysis with probability estimates
-
-**REQUIRED JSON OUTPUT:**
-```json
-{{
-  "round": {round_num},
-  "advocate_type": "{advocate_type}",
-  "position_statement": "Your overall position",
-  "time_horizon_predictions": {{
-    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}},
-    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Brief reasoning"}}
-  }},
-  "key_arguments": ["arg1", "arg2", "arg3"],
-  "evidence_summary": "Summary of key evidence",
-  "searches_used_this_round": 0
-}}
-```
-"""
+        return _initial_advocate_prompt(advocate_type, round_num, time_horizons_str,
+                                        search_budget_per_advocate, debate_rounds, training_cutoff)
     
     def _get_rebuttal_prompt(
         self,
@@ -428,49 +669,8 @@ MISSION: Build the strongest possible case for {mission} across multiple time ho
         training_cutoff: str
     ) -> str:
         """Generate rebuttal prompt"""
-        mission = "HIGH probability outcomes" if advocate_type == "high" else "LOW probability outcomes"
-        opponent_type = "Low" if advocate_type == "high" else "High"
-        
-        estimated_searches_used = (round_num - 1) * 2
-        searches_remaining = max(0, search_budget_per_advocate - estimated_searches_used)
-        
-        return f"""
-REBUTTAL - Round {round_num} of {debate_rounds}
-
-Review the {opponent_type} Advocate's arguments and provide your rebuttal to strengthen your case for {mission}.
-
-**Time Horizons:** {time_horizons_str}
-**Training Cutoff:** {training_cutoff}
-
-**SEARCH BUDGET STATUS:**
-- Total Search Budget: {search_budget_per_advocate} queries
-- Estimated Searches Used: ~{estimated_searches_used}
-- Searches Remaining: ~{searches_remaining}
-
-**REBUTTAL INSTRUCTIONS:**
-1. Address the opponent's strongest arguments directly
-2. Provide new evidence or reasoning that counters their position
-3. Strengthen your case across all time horizons
-4. Use remaining searches strategically
-
-**REQUIRED JSON OUTPUT:**
-```json
-{{
-  "round": {round_num},
-  "advocate_type": "{advocate_type}",
-  "rebuttal_to_opponent": "Direct response to opponent's arguments",
-  "strengthened_position": "Your reinforced position",
-  "time_horizon_predictions": {{
-    "7_day": {{"probability": 0.X, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
-    "30_day": {{"probability": 0.Y, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
-    "90_day": {{"probability": 0.Z, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}},
-    "180_day": {{"probability": 0.W, "confidence": "HIGH/MEDIUM/LOW", "reasoning": "Updated reasoning"}}
-  }},
-  "new_evidence": "New evidence presented in this round",
-  "searches_used_this_round": 1
-}}
-```
-"""
+        return _rebuttal_prompt(advocate_type, round_num, time_horizons_str,
+                                search_budget_per_advocate, debate_rounds, training_cutoff)
     
     def _get_judge_prompt(
         self,
@@ -478,46 +678,11 @@ Review the {opponent_type} Advocate's arguments and provide your rebuttal to str
         search_budget_per_advocate: int,
         debate_rounds: int,
         training_cutoff: str,
-        time_horizons: List[str]
+        time_horizons: Sequence[str]
     ) -> str:
         """Generate judge prompt"""
-        # Create dynamic predictions structure based on actual time horizons
-        predictions_structure = {}
-        for horizon in time_horizons:
-            predictions_structure[f"{horizon}_day"] = "0.XX"
-        
-        predictions_json = json.dumps(predictions_structure, indent=4)
-        
-        return f"""
-FINAL JUDGMENT
-
-You have observed {debate_rounds} rounds of debate between high and low probability advocates.
-Each advocate had a search budget of {search_budget_per_advocate} queries.
-
-**Time Horizons:** {time_horizons_str}
-**Training Cutoff:** {training_cutoff}
-
-**JUDICIAL SYNTHESIS PROTOCOL:**
-1. Review all arguments from both advocates across all {debate_rounds} rounds
-2. Evaluate evidence quality, logical consistency, and bias detection
-3. Apply proper calibration techniques for each time horizon
-4. Provide final probability estimates with reasoning
-5. Consider how probabilities change across time horizons
-
-**REQUIRED JSON OUTPUT:**
-```json
-{{
-  "final_predictions": {predictions_json.replace('"0.XX"', '0.XX')},
-  "confidence_scores": {predictions_json.replace('"0.XX"', '0.XX')},
-  "reasoning": {{
-    {', '.join([f'"{horizon}_day": "Reasoning for {horizon}-day prediction"' for horizon in time_horizons])}
-  }},
-  "debate_summary": "Summary of key debate points that influenced your decision",
-  "search_efficiency_evaluation": "Assessment of how well advocates used their search budget",
-  "training_cutoff_impact": "How the training cutoff affected prediction quality"
-}}
-```
-"""
+        return _judge_prompt(time_horizons_str, search_budget_per_advocate, debate_rounds,
+                             training_cutoff, time_horizons)
     
     def _extract_judge_output_from_result(self, eval_result: EvalLog) -> Optional[Dict]:
         """Extract structured judge output from Inspect AI evaluation result"""
@@ -0,0 +1,328 @@
+"""
+Article-level store for Google News search results
+Articles are stored once by URL with a parsed publication date, and every
+query remembers which articles it returned and which timeframe windows it has
+already searched. A later search for the same query with a cutoff inside an
+already-searched window is answered by filtering stored articles by date
+instead of issuing a new SERP call
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, NamedTuple, Optional, Tuple, Union
+
+DAY_SECONDS = 86400
+
+_RELATIVE_DATE_PATTERN = re.compile(r"^(\d+)\s+(minute|min|hour|day|week|month|year)s?\s+ago$")
+_RELATIVE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "min": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+_ABSOLUTE_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%m/%d/%Y", "%Y-%m-%d", "%d %b %Y", "%d %B %Y")
+
+
+class NewsArticle(NamedTuple):
+    """Compact, immutable article record (tuple-backed, no per-article dict)"""
+    title: str
+    source: str
+    link: str
+    snippet: str
+    date: str
+    position: int
+    query: str
+
+    @classmethod
+    def from_dict(cls, article: Dict[str, Any]) -> "NewsArticle":
+        return cls(
+            article.get("title", ""), article.get("source", ""), article.get("link", ""),
+            article.get("snippet", ""), article.get("date", ""), article.get("position", 0),
+            article.get("query", "")
+        )
+
+
+def as_news_articles(articles: Iterable[Union[NewsArticle, Dict[str, Any]]]) -> Tuple[NewsArticle, ...]:
+    """Normalize articles (including dicts from older cache entries) to NewsArticle records"""
+    return tuple(article if isinstance(article, NewsArticle) else NewsArticle.from_dict(article) for article in articles)
+
+
+def parse_article_date(date_text: str, reference_time: datetime = None) -> Optional[datetime]:
+    """
+    Parse a SERP article date such as 'Jul 15, 2024', '07/15/2024, 09:00 AM, +0000 UTC'
+    or '3 days ago' (relative to reference_time). Returns None when the date is unknown
+    """
+    if not date_text:
+        return None
+    text = date_text.strip()
+
+    relative = _RELATIVE_DATE_PATTERN.match(text.lower())
+    if relative:
+        reference_time = reference_time or datetime.now()
+        return reference_time - int(relative.group(1)) * _RELATIVE_UNITS[relative.group(2)]
+
+    # Absolute dates may carry a trailing time/zone after a comma
+    candidates = [text]
+    parts = [part.strip() for part in text.split(",")]
+    if len(parts) > 2:
+        candidates.append(f"{parts[0]}, {parts[1]}")
+    if len(parts) > 1:
+        candidates.append(parts[0])
+
+    for candidate in candidates:
+        for date_format in _ABSOLUTE_DATE_FORMATS:
+            try:
+                return datetime.strptime(candidate, date_format)
+            except ValueError:
+                continue
+    return None
+
+
+def timeframe_bounds(timeframe: Dict[str, str]) -> Tuple[float, float]:
+    """Epoch bounds (start of first day, start of last day) of a SERP mm/dd/YYYY timeframe"""
+    start = datetime.strptime(timeframe["start"], "%m/%d/%Y")
+    end = datetime.strptime(timeframe["end"], "%m/%d/%Y")
+    return start.timestamp(), end.timestamp()
+
+
+class ArticleStore:
+    """SQLite-backed article store keyed by URL, with query -> article and searched-window mappings"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        url TEXT PRIMARY KEY,
+        title TEXT,
+        source TEXT,
+        snippet TEXT,
+        date_text TEXT,
+        published REAL,
+        first_seen REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);
+    CREATE TABLE IF NOT EXISTS query_articles (
+        query_key TEXT NOT NULL,
+        url TEXT NOT NULL,
+        position INTEGER,
+        PRIMARY KEY (query_key, url)
+    );
+    CREATE TABLE IF NOT EXISTS searched_windows (
+        query_key TEXT NOT NULL,
+        window_start REAL NOT NULL,
+        window_end REAL NOT NULL,
+        searched_at REAL NOT NULL,
+        PRIMARY KEY (query_key, window_start, window_end)
+    );
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def query_key(query: str) -> str:
+        """Normalized query text (same normalization as the search cache key)"""
+        return query.lower().strip()
+
+    def record_search(self, query: str, timeframe: Dict[str, str], articles: Iterable[NewsArticle],
+                      searched_at: float = None):
+        """Store a completed search: its articles, their query mapping and the searched window"""
+        searched_at = searched_at or time.time()
+        reference_time = datetime.fromtimestamp(searched_at)
+        query_key = self.query_key(query)
+        window_start, window_end = timeframe_bounds(timeframe)
+
+        article_rows = []
+        mapping_rows = []
+        for article in articles:
+            if not article.link:
+                continue
+            published = parse_article_date(article.date, reference_time)
+            article_rows.append((
+                article.link, article.title, article.source, article.snippet,
+                article.date, published.timestamp() if published else None, searched_at
+            ))
+            mapping_rows.append((query_key, article.link, article.position))
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # Keep the first parsed publication date; absolute dates never change
+                self._conn.executemany(
+                    """INSERT INTO articles (url, title, source, snippet, date_text, published, first_seen)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(url) DO UPDATE SET
+                           title = excluded.title,
+                           source = excluded.source,
+                           snippet = excluded.snippet,
+                           date_text = COALESCE(articles.date_text, excluded.date_text),
+                           published = COALESCE(articles.published, excluded.published)""",
+                    article_rows
+                )
+                self._conn.executemany(
+                    """INSERT INTO query_articles (query_key, url, position) VALUES (?, ?, ?)
+                       ON CONFLICT(query_key, url) DO UPDATE SET position = MIN(position, excluded.position)""",
+                    mapping_rows
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO searched_windows (query_key, window_start, window_end, searched_at) VALUES (?, ?, ?, ?)",
+                    (query_key, window_start, window_end, searched_at)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def covering_window(self, query: str, timeframe: Dict[str, str],
+                        max_age_seconds: Optional[float] = None) -> Optional[Tuple[float, float]]:
+        """
+        An already-searched window for this query that contains the timeframe
+        Windows that ended at least a day before they were searched are settled
+        and never expire; more recent windows are only valid within max_age_seconds
+        """
+        window_start, window_end = timeframe_bounds(timeframe)
+        min_searched_at = time.time() - max_age_seconds if max_age_seconds is not None else 0.0
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT window_start, window_end FROM searched_windows
+                   WHERE query_key = ? AND window_start <= ? AND window_end >= ?
+                     AND (window_end + ? <= searched_at OR searched_at >= ?)
+                   ORDER BY (window_end - window_start) ASC LIMIT 1""",
+                (self.query_key(query), window_start, window_end, 2 * DAY_SECONDS, min_searched_at)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def articles_for(self, query: str, timeframe: Dict[str, str], include_undated: bool = False) -> List[NewsArticle]:
+        """
+        Stored articles previously returned for this query, published within the timeframe
+        Undated articles are only included when include_undated is set (exact window match),
+        since their publication date cannot be checked against a narrower cutoff
+        """
+        window_start, window_end = timeframe_bounds(timeframe)
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT a.title, a.source, a.url, a.snippet, a.date_text, qa.position
+                   FROM query_articles qa JOIN articles a ON a.url = qa.url
+                   WHERE qa.query_key = ?
+                     AND ((a.published >= ? AND a.published < ?) OR (? AND a.published IS NULL))
+                   ORDER BY qa.position""",
+                (self.query_key(query), window_start, window_end + DAY_SECONDS, int(include_undated))
+            ).fetchall()
+
+        return [
+            NewsArticle(title, source, url, snippet, date_text, position, query)
+            for title, source, url, snippet, date_text, position in rows
+        ]
+
+    def total_bytes(self) -> int:
+        """Approximate on-disk size of stored articles, query mappings and searched windows"""
+        with self._lock:
+            return sum(self._conn.execute(sql).fetchone()[0] for sql in (
+                """SELECT COALESCE(SUM(length(url) + IFNULL(length(title), 0) + IFNULL(length(source), 0)
+                                       + IFNULL(length(snippet), 0) + IFNULL(length(date_text), 0) + 16), 0)
+                   FROM articles""",
+                "SELECT COALESCE(SUM(length(query_key) + length(url) + 8), 0) FROM query_articles",
+                "SELECT COALESCE(SUM(length(query_key) + 24), 0) FROM searched_windows",
+            ))
+
+    def delete_expired(self, max_age_seconds: float) -> int:
+        """
+        Delete unsettled windows searched more than max_age_seconds ago, then the mappings and
+        articles no remaining window refers to; settled windows never expire (see covering_window)
+        Returns the number of windows removed
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                removed = self._conn.execute(
+                    "DELETE FROM searched_windows WHERE window_end + ? > searched_at AND searched_at < ?",
+                    (2 * DAY_SECONDS, time.time() - max_age_seconds)
+                ).rowcount
+                if removed:
+                    self._delete_orphans()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def forget_queries(self, queries: Iterable[str]) -> int:
+        """
+        Delete the windows and mappings of these queries and of their strategic variants
+        ('<query> latest news' etc.), plus articles left without a mapping; returns windows removed
+        """
+        query_keys = {self.query_key(query) for query in queries}
+        if not query_keys:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                removed = 0
+                for query_key in query_keys:
+                    removed += self._conn.execute(
+                        "DELETE FROM searched_windows WHERE query_key = ? OR substr(query_key, 1, ?) = ?",
+                        (query_key, len(query_key) + 1, query_key + " ")
+                    ).rowcount
+                self._delete_orphans()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def evict_to_budget(self, max_bytes: int, batch_size: int = 100) -> int:
+        """Forget the least recently searched queries until the store fits max_bytes; returns windows removed"""
+        removed = 0
+        with self._lock:
+            while self.total_bytes() > max_bytes:
+                query_keys = [row[0] for row in self._conn.execute(
+                    "SELECT query_key FROM searched_windows GROUP BY query_key ORDER BY MAX(searched_at) ASC LIMIT ?",
+                    (batch_size,)
+                )]
+                if not query_keys:
+                    break
+                self._conn.execute("BEGIN")
+                try:
+                    removed += self._conn.executemany(
+                        "DELETE FROM searched_windows WHERE query_key = ?", [(key,) for key in query_keys]
+                    ).rowcount
+                    self._delete_orphans()
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        return removed
+
+    def _delete_orphans(self):
+        """Delete mappings of queries without a searched window and articles without a mapping"""
+        self._conn.execute("DELETE FROM query_articles WHERE query_key NOT IN (SELECT query_key FROM searched_windows)")
+        self._conn.execute("DELETE FROM articles WHERE url NOT IN (SELECT url FROM query_articles)")
+
+    def count(self) -> int:
+        """Number of distinct stored articles"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def clear(self):
+        """Delete every stored article, mapping and searched window"""
+        with self._lock:
+            self._conn.execute("DELETE FROM articles")
+            self._conn.execute("DELETE FROM query_articles")
+            self._conn.execute("DELETE FROM searched_windows")
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,360 @@
+"""
+Journaled checkpoint store for benchmark runs
+Each finished question is appended as one line to a JSONL journal next to the
+checkpoint snapshot, so saving progress costs one small write instead of
+re-serializing every result. The journal is periodically compacted into the
+snapshot, and loading replays snapshot + journal. Snapshots are replaced
+atomically (temp file, fsync, rename) and every result carries a sha256
+checksum, so a crash or corruption loses at most the damaged records: loading
+salvages every intact result instead of starting the run over. Results are
+indexed by question, and a newer result for a question replaces the older one.
+A small manifest per run carries the progress counters, so listing runs and
+finding the latest one never parse a results payload
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+DAMAGED_SUFFIX = ".damaged"
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def record_checksum(record: Any) -> str:
+    """sha256 of a record's canonical JSON (sorted keys, non-JSON values as strings)"""
+    return hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """Question a result belongs to: its question_id, or q_<question_idx> for results without one"""
+    question_id = result.get('question_id')
+    return str(question_id) if question_id is not None else f"q_{result.get('question_idx')}"
+
+
+def resume_state(results: List[Dict[str, Any]],
+                 retry_failed: bool = False) -> Tuple[Dict[str, Dict[str, Any]], Set[str], Set[str]]:
+    """
+    Checkpointed results keyed by question (last result wins), the questions a
+    resumed run skips, and the failed ones (skipped too unless retry_failed)
+    """
+    results_by_id = {result_key(result): result for result in results}
+    failed_ids = {question_id for question_id, result in results_by_id.items() if not result.get('success', False)}
+    completed_ids = set(results_by_id) - failed_ids if retry_failed else set(results_by_id)
+    return results_by_id, completed_ids, failed_ids
+
+
+def atomic_write_json(path: Union[str, Path], data: Any, indent: Optional[int] = 2):
+    """Write JSON to a temp file in the same directory, fsync it and rename it over path"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=indent, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    # Persist the rename itself (not possible on every platform)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def salvage_json_object(text: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Top-level fields of a possibly truncated JSON object, and whether it was intact
+    Parsing stops at the first damaged field; a damaged list (such as results)
+    keeps every element decoded before the damage
+    """
+    decoder = json.JSONDecoder()
+    fields: Dict[str, Any] = {}
+
+    def skip(pos: int, chars: str = " \t\r\n") -> int:
+        while pos < len(text) and text[pos] in chars:
+            pos += 1
+        return pos
+
+    pos = skip(0)
+    if not text.startswith("{", pos):
+        return fields, False
+    pos += 1
+    while True:
+        pos = skip(pos)
+        if text.startswith("}", pos):
+            return fields, True
+        try:
+            key, pos = decoder.raw_decode(text, pos)
+            pos = skip(pos)
+            if not text.startswith(":", pos):
+                return fields, False
+            pos = skip(pos + 1)
+            value, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            if text.startswith("[", pos):
+                fields[key] = salvage_json_list(text, pos + 1)
+            return fields, False
+        fields[key] = value
+        pos = skip(pos, " \t\r\n,")
+
+
+def salvage_json_list(text: str, pos: int) -> List[Any]:
+    """Elements of a JSON list starting at pos, up to the first one that does not decode"""
+    decoder = json.JSONDecoder()
+    items = []
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return items
+        items.append(item)
+
+
+def read_manifest(manifest_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """A run manifest, or None if it is missing or unreadable"""
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def list_checkpoints(checkpoints_dir: Union[str, Path], pattern: str = "*.json") -> List[Dict[str, Any]]:
+    """
+    Checkpoint snapshots matching pattern with their manifests, newest first by
+    the run timestamp in the file name. Runs written before manifests get one
+    built from their snapshot + journal (read once); the manifest is None only
+    if that fails
+    """
+    snapshots = [
+        path for path in Path(checkpoints_dir).glob(pattern)
+        if not path.name.endswith(MANIFEST_SUFFIX) and not path.name.startswith(".")
+    ]
+    checkpoints = []
+    for path in sorted(snapshots, key=lambda path: path.name, reverse=True):
+        manifest = read_manifest(path.with_name(path.stem + MANIFEST_SUFFIX))
+        if manifest is None:
+            try:
+                manifest = CheckpointStore(path).rebuild_manifest()
+                print(f"🗂️ Wrote manifest for checkpoint {path.name}")
+            except Exception as e:
+                print(f"⚠️ Could not build a manifest for checkpoint {path.name}: {e}")
+        checkpoints.append({'snapshot': path, 'manifest': manifest})
+    return checkpoints
+
+
+class CheckpointStore:
+    """
+    Snapshot (the checkpoint JSON file) plus an append-only journal of results
+    Results are kept per question (last write wins), so a retried question
+    replaces its earlier failure instead of adding a duplicate. Journal
+    records carry a sequence number and the snapshot remembers the last one
+    it contains, so a crash between writing a snapshot and truncating the
+    journal never replays a result twice
+    """
+
+    def __init__(self, snapshot_path: Union[str, Path], fsync_every: int = 8, compact_every: int = 50):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.stem + JOURNAL_SUFFIX)
+        self.manifest_path = self.snapshot_path.with_name(self.snapshot_path.stem + MANIFEST_SUFFIX)
+        self.fsync_every = max(1, fsync_every)
+        self.compact_every = compact_every
+        self.header: Dict[str, Any] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._journal = None
+        self._unsynced = 0
+        self._since_compaction = 0
+
+    def load(self) -> Dict[str, Any]:
+        """Replay snapshot + journal into the store and return the checkpoint data (header fields and results)"""
+        with self._lock:
+            replayed = self._read()
+            if self.header or self.results:
+                print(f"📂 Checkpoint loaded: {self.snapshot_path} ({len(self.results)} results, {replayed} from journal)")
+            return {**self.header, 'results': list(self.results.values())}
+
+    def rebuild_manifest(self) -> Optional[Dict[str, Any]]:
+        """Write the manifest of a run checkpointed before manifests, reading its snapshot + journal once"""
+        with self._lock:
+            self._read(set_aside_damaged=False)
+            self._write_manifest()
+        return read_manifest(self.manifest_path)
+
+    def _read(self, set_aside_damaged: bool = True) -> int:
+        """Replace the store's header and results with snapshot + journal; returns how many came from the journal"""
+        snapshot = self._load_snapshot(set_aside_damaged)
+        results = snapshot.pop('results', None)
+        checksums = snapshot.pop('result_checksums', None)
+        self._seq = snapshot.pop('journal_seq', 0)
+        self.header = snapshot
+        self.results = {}
+        for result in self._verified_results(results if isinstance(results, list) else [], checksums):
+            self.results[result_key(result)] = result
+        return self._replay_journal()
+
+    def _load_snapshot(self, set_aside_damaged: bool = True) -> Dict[str, Any]:
+        """Snapshot fields; a damaged snapshot is salvaged and (when set_aside_damaged) kept aside as <name>.damaged"""
+        if not self.snapshot_path.exists():
+            return {}
+        text = self.snapshot_path.read_text()
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            snapshot, _ = salvage_json_object(text)
+            salvaged = snapshot.get('results') if isinstance(snapshot.get('results'), list) else []
+            if not set_aside_damaged:
+                print(f"⚠️ Checkpoint {self.snapshot_path} is damaged ({e}); counted {len(salvaged)} salvageable results")
+                return snapshot
+            damaged_path = self.snapshot_path.with_name(self.snapshot_path.name + DAMAGED_SUFFIX)
+            os.replace(self.snapshot_path, damaged_path)
+            print(f"⚠️ Checkpoint {self.snapshot_path} is damaged ({e}); "
+                  f"salvaged {len(salvaged)} results, original kept as {damaged_path}")
+            return snapshot
+
+    def _verified_results(self, results: List[Any], checksums: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Snapshot results whose checksum matches (checkpoints written before checksums are trusted as-is)"""
+        if checksums is None:
+            return [result for result in results if isinstance(result, dict)]
+        verified = []
+        for position, result in enumerate(results):
+            if position < len(checksums) and record_checksum(result) == checksums[position]:
+                verified.append(result)
+            else:
+                print(f"⚠️ Dropping checkpoint result {position} in {self.snapshot_path}: checksum mismatch")
+        return verified
+
+    def _replay_journal(self) -> int:
+        """Append journaled results newer than the snapshot, skipping torn or corrupted lines"""
+        if not self.journal_path.exists():
+            return 0
+        replayed = 0
+        with open(self.journal_path, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    checksum = record.pop('sha256', None)
+                    seq = record['seq']
+                    result = record['result']
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    # A crash mid-append leaves at most a torn last line
+                    print(f"⚠️ Skipping malformed journal line {line_number} in {self.journal_path}")
+                    continue
+                if checksum is not None and checksum != record_checksum(record):
+                    print(f"⚠️ Skipping journal line {line_number} in {self.journal_path}: checksum mismatch")
+                    continue
+                if seq <= self._seq:
+                    continue
+                self.results[result_key(result)] = result
+                self.header.update(record.get('header', {}))
+                self._seq = seq
+                replayed += 1
+        return replayed
+
+    def set_header(self, **fields):
+        """Run metadata (timestamps, settings, progress counters) written with every snapshot"""
+        with self._lock:
+            self.header.update(fields)
+
+    def append(self, result: Dict[str, Any], **header_fields):
+        """
+        Journal one finished question, replacing any earlier result for it
+        header_fields (e.g. completed_count) are replayed with it
+        """
+        with self._lock:
+            self._seq += 1
+            self.results[result_key(result)] = result
+            self.header.update(header_fields)
+
+            record = {'seq': self._seq, 'result': result}
+            if header_fields:
+                record['header'] = header_fields
+            record['sha256'] = record_checksum(record)
+            if self._journal is None:
+                self._journal = self._open_journal()
+            self._journal.write(json.dumps(record, default=str) + "\n")
+            self._journal.flush()
+
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                self._sync()
+
+            self._since_compaction += 1
+            compact_now = self.compact_every and self._since_compaction >= self.compact_every
+        if compact_now:
+            self.compact()
+
+    def compact(self):
+        """Atomically replace the snapshot with header + every result, then start an empty journal"""
+        with self._lock:
+            atomic_write_json(self.snapshot_path, {
+                **self.header,
+                'journal_seq': self._seq,
+                'result_checksums': [record_checksum(result) for result in self.results.values()],
+                'results': list(self.results.values())
+            })
+
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self._unsynced = 0
+            self._since_compaction = 0
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+            self._write_manifest()
+        print(f"💾 Checkpoint saved: {self.snapshot_path} ({len(self.results)} results)")
+
+    def close(self):
+        """Fsync any journaled results that are not yet on disk"""
+        with self._lock:
+            if self._journal is not None:
+                self._sync()
+                self._journal.close()
+                self._journal = None
+
+    def _open_journal(self):
+        # Start on a fresh line if the previous run died mid-append
+        torn = False
+        if self.journal_path.exists() and self.journal_path.stat().st_size > 0:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        journal = open(self.journal_path, 'a')
+        if torn:
+            journal.write("\n")
+        return journal
+
+    def _sync(self):
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._unsynced = 0
+        self._write_manifest()
+
+    def _write_manifest(self):
+        """Progress counters for listing and resume; written whenever results become durable"""
+        successful = sum(1 for result in self.results.values() if result.get('success', False))
+        atomic_write_json(self.manifest_path, {
+            'run_timestamp': self.header.get('run_timestamp'),
+            'snapshot': self.snapshot_path.name,
+            'total_questions': self.header.get('total_questions'),
+            'completed_count': len(self.results),
+            'successful_count': successful,
+            'failed_count': len(self.results) - successful,
+            'updated_at': datetime.now().isoformat()
+        })
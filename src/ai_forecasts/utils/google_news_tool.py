@@ -6,14 +6,24 @@ Includes intelligent caching to minimize redundant API calls
 """
 
 import os
-import json
+import asyncio
 import hashlib
-import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
+from .search_cache import RETRY_AS_LEADER, get_shared_search_cache
+from .search_budget import SearchBudgetScope
+from .article_store import NewsArticle, as_news_articles, timeframe_bounds
+from .serp_client import get_serp_client
+from .search_corpus import (
+    get_search_mode, get_corpus_path, get_search_corpus, RecordingSerpClient, ReplaySerpClient
+)
+
 
 class GoogleNewsInput(BaseModel):
     """Input model for Google News search"""
@@ -23,6 +33,33 @@ class GoogleNewsInput(BaseModel):
     cutoff_date: Optional[str] = Field(None, description="ISO date string for benchmark cutoff (YYYY-MM-DD). Articles must be at least 1 day before this date.")
 
 
+@lru_cache(maxsize=4096)
+def _format_article_listing(query: str, search_type: str, articles: Tuple[NewsArticle, ...],
+                            period_start: str, period_end: str, original_cutoff: Optional[str]) -> str:
+    """Render the (static) article listing of a search result; memoized since cache hits repeat it"""
+    parts = [f"Found {len(articles)} articles for {search_type} search '{query}':\n\n"]
+    
+    for i, article in enumerate(articles, 1):
+        parts.append(f"{i}. **{article.title}**\n")
+        parts.append(f"   Source: {article.source}\n")
+        if article.date:
+            parts.append(f"   Date: {article.date}\n")
+        if article.snippet:
+            parts.append(f"   Summary: {article.snippet}\n")
+        parts.append(f"   URL: {article.link}\n")
+        if article.query != query:
+            parts.append(f"   Found via: {article.query}\n")
+        parts.append("\n")
+    
+    parts.append(f"\nSearch period: {period_start} to {period_end}\n")
+    
+    # Add benchmark constraint information
+    if original_cutoff is not None:
+        parts.append(f"🛡️ BENCHMARK CONSTRAINT APPLIED: Search limited to articles at least 1 day before cutoff date ({original_cutoff})\n")
+    
+    return "".join(parts)
+
+
 class CachedGoogleNewsTool:
     """
     Cached Google News search tool with intelligent caching to minimize API calls
@@ -36,33 +73,68 @@ class CachedGoogleNewsTool:
     
     Features:
     - Query-based caching with content deduplication
-    - Cross-agent result sharing within session
+    - URL-keyed article store: new cutoffs inside searched windows are filtered locally
+    - Cross-agent result sharing across every tool instance in the process
+    - Identical concurrent searches share one in-flight request
+    - Pooled, rate-limited SERP client with retry on 429/5xx responses
     - Automatic cache invalidation for time-sensitive queries
+    - Background janitor for TTL expiry and size-bounded LRU eviction of the disk cache
     - Strategic API usage with fallback to similar queries
+    - Async search path (_arun) for non-blocking use inside event loops
+    - Record/replay mode backed by a recorded SERP corpus for offline runs
     
     Use priority='high' for critical forecasting questions, 'medium' for supporting research,
     'low' for background information. Results are used when available.
     """
     args_schema: type = GoogleNewsInput
     
-    def __init__(self, serp_api_key: str = None, search_timeframe: Dict[str, str] = None, cache_dir: str = None):
+    def __init__(self, serp_api_key: str = None, search_timeframe: Dict[str, str] = None, cache_dir: str = None,
+                 memory_cache_size: int = 2048, max_concurrent_searches: int = 4,
+                 search_mode: str = None, corpus_path: str = None, max_cache_bytes: int = None,
+                 max_searches_per_session: int = 50):
         # Store configuration in internal attributes
         self._serp_api_key = serp_api_key or os.getenv("SERP_API_KEY")
+        self._search_mode = get_search_mode(search_mode)  # live, record or replay
+        # Recording answers every search from the SERP client (never from the caches or the
+        # article store), so each query a replay will make has its response in the corpus
+        self._bypass_cache = self._search_mode == "record"
+        self._corpus_path = get_corpus_path(corpus_path)
         self._search_timeframe = search_timeframe or {
             "start": "06/01/2024",  # From June 2024 to freeze date
             "end": datetime.now().strftime("%m/%d/%Y")
         }
         
-        # Setup caching
-        self._cache_dir = Path(cache_dir or "cache/google_news")
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._session_cache = {}  # In-memory cache for current session
+        # Setup caching (replayed results are kept apart from the live cache)
+        self._cache_dir = Path(cache_dir or ("cache/google_news_replay" if self._search_mode == "replay" else "cache/google_news"))
         self._cache_ttl_hours = 6  # Cache validity in hours
         
+        # Process-wide cache (LRU memory tier + indexed disk store + query index)
+        # shared by every tool instance and worker thread using this cache_dir
+        self._cache = get_shared_search_cache(
+            self._cache_dir,
+            memory_size=memory_cache_size,
+            index_max_age_seconds=self._cache_ttl_seconds
+        )
+        
+        # Background TTL expiry and LRU eviction keep housekeeping off the request path
+        if max_cache_bytes is None:
+            max_cache_bytes = int(os.getenv("GOOGLE_NEWS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+        self._cache.start_janitor(
+            ttl_seconds=self._cache_ttl_seconds,
+            max_bytes=max_cache_bytes,
+            interval_seconds=float(os.getenv("GOOGLE_NEWS_CACHE_JANITOR_INTERVAL", "300"))
+        )
+        
         self._setup_serp_client()
         self._search_count = 0  # Track API usage
         self._cache_hits = 0  # Track cache efficiency
-        self._max_searches_per_session = 50  # Increased limit for actual research
+        self._coalesced_requests = 0  # Searches served by another caller's in-flight request
+        # The session limit applies per question (the budget scope's question), so a tool reused
+        # across questions by a worker, a batch or a native eval gets a fresh limit for each one
+        self._max_searches_per_session = max_searches_per_session
+        self._session_search_counts: Dict[Optional[str], int] = {}
+        self._max_concurrent_searches = max(1, max_concurrent_searches)  # Parallel sub-query cap
+        self._search_count_lock = threading.Lock()
         self._benchmark_cutoff_date = None  # For benchmark constraints
         
         print(f"🗄️ Google News cache initialized at: {self._cache_dir}")
@@ -99,24 +171,158 @@ class CachedGoogleNewsTool:
         }
     
     def _setup_serp_client(self):
-        """Setup SERP API client"""
-        try:
-            from serpapi import GoogleSearch
-            if self._serp_api_key:
-                self._serp_client = GoogleSearch
-                self._client_available = True
-                print("✅ SERP API client ready for Google News search")
-            else:
-                self._serp_client = None
-                self._client_available = False
-                print("⚠️ SERP API key not found, Google News search will be simulated")
-        except ImportError:
+        """Setup SERP API client (pooled and rate limited, shared by every tool instance)"""
+        if self._search_mode == "replay":
+            corpus = get_search_corpus(self._corpus_path)
+            self._serp_client = ReplaySerpClient(corpus)
+            self._client_available = True
+            print(f"📼 Replaying Google News searches from {self._corpus_path} ({len(corpus)} recorded responses)")
+        elif self._serp_api_key:
+            self._serp_client = get_serp_client()
+            if self._search_mode == "record":
+                self._serp_client = RecordingSerpClient(self._serp_client, get_search_corpus(self._corpus_path))
+                print(f"⏺️ Recording Google News searches to {self._corpus_path}")
+            self._client_available = True
+            print("✅ SERP API client ready for Google News search")
+        else:
             self._serp_client = None
             self._client_available = False
-            print("⚠️ google-search-results not installed, Google News search will be simulated")
+            print("⚠️ SERP API key not found, Google News search will be simulated")
     
-    def _run(self, query: str, search_type: str = "focused", priority: str = "high", cutoff_date: str = None) -> str:
-        """Execute strategic Google News search with intelligent caching and benchmark date constraints"""
+    def _run(self, query: str, search_type: str = "focused", priority: str = "high", cutoff_date: str = None,
+             budget_scope: SearchBudgetScope = None) -> str:
+        """
+        Execute strategic Google News search with intelligent caching and benchmark date constraints
+        API calls are charged to budget_scope (question + debate role) when one is given
+        """
+
+        while True:
+            cache_key, effective_timeframe, cached = self._lookup_cached_search(
+                query, search_type, priority, cutoff_date, budget_scope
+            )
+            if cached is not None:
+                return cached
+
+            # Coalesce identical concurrent searches onto a single outstanding request
+            is_leader, flight = self._cache.join_in_flight(cache_key)
+            if is_leader:
+                break
+            print(f"⏳ Waiting on in-flight search for '{query}'")
+            cache_data = flight.result()
+            if cache_data is not RETRY_AS_LEADER:
+                return self._record_coalesced(cache_data, budget_scope)
+            print(f"🔁 In-flight search for '{query}' did not complete, searching under this caller's budget")
+
+        try:
+            result, cache_data = self._search_and_cache(query, search_type, priority, cache_key, effective_timeframe, budget_scope)
+        except BaseException as e:
+            self._cache.finish_in_flight(cache_key, error=e)
+            raise
+        self._finish_flight(cache_key, cache_data)
+        return result
+
+    async def _arun(self, query: str, search_type: str = "focused", priority: str = "high", cutoff_date: str = None,
+                    budget_scope: SearchBudgetScope = None) -> str:
+        """Async variant of _run: SERP requests use non-blocking HTTP and cache I/O runs off the event loop"""
+
+        while True:
+            cache_key, effective_timeframe, cached = await asyncio.to_thread(
+                self._lookup_cached_search, query, search_type, priority, cutoff_date, budget_scope
+            )
+            if cached is not None:
+                return cached
+
+            # Coalesce identical concurrent searches onto a single outstanding request
+            is_leader, flight = self._cache.join_in_flight(cache_key)
+            if is_leader:
+                break
+            print(f"⏳ Waiting on in-flight search for '{query}'")
+            cache_data = await asyncio.wrap_future(flight)
+            if cache_data is not RETRY_AS_LEADER:
+                return self._record_coalesced(cache_data, budget_scope)
+            print(f"🔁 In-flight search for '{query}' did not complete, searching under this caller's budget")
+
+        try:
+            result, cache_data = await self._asearch_and_cache(query, search_type, priority, cache_key,
+                                                               effective_timeframe, budget_scope)
+        except BaseException as e:
+            self._cache.finish_in_flight(cache_key, error=e)
+            raise
+        self._finish_flight(cache_key, cache_data)
+        return result
+
+    def _finish_flight(self, cache_key: str, cache_data: Optional[Dict[str, Any]]):
+        """
+        Share the leader's cache entry with coalesced waiters only if it is the complete, cached search;
+        refusals, cache fallbacks and partial results depend on the leader's budget, so waiters retry
+        """
+        self._cache.finish_in_flight(cache_key, result=cache_data if cache_data is not None else RETRY_AS_LEADER)
+
+    def _search_and_cache(self, query: str, search_type: str, priority: str, cache_key: str,
+                          effective_timeframe: Dict[str, str],
+                          budget_scope: SearchBudgetScope = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Perform the SERP searches for a cache miss and cache the formatted result
+        Returns the response and the complete cache entry it was rendered from (None if nothing was cached)
+        """
+
+        # A search for the same key may have finished between our cache lookup and becoming leader
+        cached = None if self._bypass_cache else self._cache.get_memory(cache_key, max_age_seconds=self._cache_ttl_seconds)
+        if cached and self._is_full_result(cached):
+            return self._result_text(cached, budget_scope), cached
+
+        unavailable = self._check_search_unavailable(query, search_type, effective_timeframe, budget_scope, priority)
+        if unavailable is not None:
+            return unavailable, None
+
+        try:
+            all_articles, pending_queries, skipped_queries = self._plan_sub_queries(
+                query, search_type, priority, effective_timeframe, budget_scope
+            )
+            search_results = self._execute_searches_concurrently([q for q, _ in pending_queries], effective_timeframe)
+            return self._finalize_search(query, search_type, cache_key, effective_timeframe,
+                                         all_articles, pending_queries, search_results, skipped_queries, budget_scope)
+        except Exception as e:
+            return self._handle_search_error(query, search_type, e, effective_timeframe, budget_scope), None
+
+    async def _asearch_and_cache(self, query: str, search_type: str, priority: str, cache_key: str,
+                                 effective_timeframe: Dict[str, str],
+                                 budget_scope: SearchBudgetScope = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Async variant of _search_and_cache"""
+
+        # A search for the same key may have finished between our cache lookup and becoming leader
+        cached = None if self._bypass_cache else self._cache.get_memory(cache_key, max_age_seconds=self._cache_ttl_seconds)
+        if cached and self._is_full_result(cached):
+            return self._result_text(cached, budget_scope), cached
+
+        unavailable = await asyncio.to_thread(self._check_search_unavailable, query, search_type, effective_timeframe,
+                                              budget_scope, priority)
+        if unavailable is not None:
+            return unavailable, None
+
+        try:
+            all_articles, pending_queries, skipped_queries = await asyncio.to_thread(
+                self._plan_sub_queries, query, search_type, priority, effective_timeframe, budget_scope
+            )
+            search_results = await self._aexecute_searches_concurrently([q for q, _ in pending_queries], effective_timeframe)
+            return await asyncio.to_thread(
+                self._finalize_search, query, search_type, cache_key, effective_timeframe,
+                all_articles, pending_queries, search_results, skipped_queries, budget_scope
+            )
+        except Exception as e:
+            return await asyncio.to_thread(self._handle_search_error, query, search_type, e, effective_timeframe, budget_scope), None
+
+    def _record_coalesced(self, cache_data: Dict[str, Any], budget_scope: SearchBudgetScope = None) -> str:
+        """Count and render a cache entry received from another caller's in-flight search"""
+        with self._search_count_lock:
+            self._cache_hits += 1
+            self._coalesced_requests += 1
+        print(f"🤝 Reused in-flight search result (Coalesced: {self._coalesced_requests}, Cache hits: {self._cache_hits})")
+        return self._result_text(cache_data, budget_scope)
+
+    def _lookup_cached_search(self, query: str, search_type: str, priority: str, cutoff_date: str = None,
+                              budget_scope: SearchBudgetScope = None):
+        """Resolve the effective timeframe and cache key, returning a cached result if one is available"""
         
         # Use provided cutoff_date or stored benchmark cutoff date
         effective_cutoff = cutoff_date or self._benchmark_cutoff_date
@@ -126,88 +332,233 @@ class CachedGoogleNewsTool:
         
         # Generate cache key for this search (include timeframe for uniqueness)
         cache_key = self._generate_cache_key(query, search_type, priority, effective_timeframe)
+        if self._bypass_cache:
+            return cache_key, effective_timeframe, None
         
-        # Check session cache first (fastest)
-        if cache_key in self._session_cache:
-            self._cache_hits += 1
-            print(f"🎯 Session cache hit for '{query}' (Cache hits: {self._cache_hits})")
-            return self._session_cache[cache_key]["result"]
+        # Check shared memory cache first (fastest)
+        cached_result = self._cache.get_memory(cache_key, max_age_seconds=self._cache_ttl_seconds)
+        if cached_result and self._is_full_result(cached_result):
+            print(f"🎯 Memory cache hit for '{query}' (Cache hits: {self._record_cache_hit()})")
+            return cache_key, effective_timeframe, self._result_text(cached_result, budget_scope)
         
         # Check persistent cache
         cached_result = self._load_from_cache(cache_key)
         if cached_result:
-            self._cache_hits += 1
-            self._session_cache[cache_key] = cached_result
-            print(f"💾 Disk cache hit for '{query}' (Cache hits: {self._cache_hits})")
-            return cached_result["result"]
+            print(f"💾 Disk cache hit for '{query}' (Cache hits: {self._record_cache_hit()})")
+            return cache_key, effective_timeframe, self._result_text(cached_result, budget_scope)
         
         # Check for similar cached queries to avoid redundant searches
-        similar_result = self._find_similar_cached_query(query, search_type)
+        similar_result = self._find_similar_cached_query(query, search_type, effective_timeframe, budget_scope)
         if similar_result:
-            self._cache_hits += 1
-            print(f"🔄 Using similar cached query for '{query}' (Cache hits: {self._cache_hits})")
-            return similar_result
+            print(f"🔄 Using similar cached query for '{query}' (Cache hits: {self._record_cache_hit()})")
+            return cache_key, effective_timeframe, similar_result
+        
+        return cache_key, effective_timeframe, None
+    
+    def _check_search_unavailable(self, query: str, search_type: str, effective_timeframe: Dict[str, str] = None,
+                                  budget_scope: SearchBudgetScope = None, priority: str = "medium") -> Optional[str]:
+        """
+        Return a fallback message if a new search cannot be performed, otherwise None
+        Refused searches are still recorded as attempted in the budget scope's ledger
+        """
         
         # No cache hit - perform new search if API available and under limits
         if not self._client_available:
             return f"❌ SERP API not available for Google News search: '{query}'. Configure SERP_API_KEY environment variable."
         
         # Check API usage limits - use cached alternatives instead of simulation
-        if self._search_count >= self._max_searches_per_session:
+        if self._session_searches(budget_scope) >= self._max_searches_per_session:
             print(f"⚠️ Reached API limit ({self._max_searches_per_session} searches), trying cache alternatives")
-            fallback_result = self._get_cache_fallback(query, search_type)
+            self._record_refused_search(query, search_type, priority, budget_scope)
+            fallback_result = self._get_cache_fallback(query, search_type, effective_timeframe, budget_scope)
             if fallback_result:
                 return fallback_result
             return f"❌ API limit reached and no cached alternatives available for '{query}'. Consider increasing search limit or using more specific queries."
         
-        try:
-            # Generate strategic search queries based on type and priority
-            search_queries = self._generate_strategic_queries(query, search_type, priority)
-            
-            all_articles = []
+        # Check the per-question budget of the debate role making this search
+        if budget_scope is not None and budget_scope.exhausted():
+            print(f"⚠️ {budget_scope.role} search budget spent on question {budget_scope.question_id}, trying cache alternatives")
+            self._record_refused_search(query, search_type, priority, budget_scope)
+            fallback_result = self._get_cache_fallback(query, search_type, effective_timeframe, budget_scope)
+            if fallback_result:
+                return fallback_result
+            return f"❌ Search budget exhausted ({budget_scope.used()} searches used) and no cached alternatives available for '{query}'. Argue from the evidence already gathered."
+        
+        return None
+    
+    def _record_refused_search(self, query: str, search_type: str, priority: str, budget_scope: SearchBudgetScope = None):
+        """Count the sub-queries a refused search would have made towards its role's attempted searches"""
+        if budget_scope is not None:
+            budget_scope.refuse(len(self._generate_strategic_queries(query, search_type, priority)))
+    
+    def _plan_sub_queries(self, query: str, search_type: str, priority: str, effective_timeframe: Dict[str, str],
+                          budget_scope: SearchBudgetScope = None):
+        """
+        Expand the query into strategic sub-queries, returning cached articles, the sub-queries
+        to search and how many more were planned but not granted by the search limits
+        """
+        
+        # Generate strategic search queries based on type and priority
+        search_queries = self._generate_strategic_queries(query, search_type, priority)
+        
+        all_articles = []
+        pending_queries = []
+        
+        for search_query in search_queries:
+            # Check if we have this specific query cached
+            sub_cache_key = self._generate_cache_key(search_query, search_type, priority, effective_timeframe)
+            if self._bypass_cache:
+                pending_queries.append((search_query, sub_cache_key))
+                continue
             
-            for search_query in search_queries:
-                if self._search_count >= self._max_searches_per_session:
-                    break
-                
-                # Check if we have this specific query cached
-                sub_cache_key = self._generate_cache_key(search_query, search_type, priority, effective_timeframe)
-                if sub_cache_key in self._session_cache:
-                    cached_articles = self._session_cache[sub_cache_key].get("articles", [])
-                    all_articles.extend(cached_articles)
-                    print(f"🎯 Using cached sub-query: '{search_query}'")
-                    continue
-                
-                articles = self._execute_single_search(search_query, effective_timeframe)
-                all_articles.extend(articles)
-                self._search_count += 1
-                
-                # Cache individual query results
-                self._cache_query_result(sub_cache_key, search_query, articles)
-                
-                print(f"🔍 Search {self._search_count}/{self._max_searches_per_session}: '{search_query}' - Found {len(articles)} articles")
+            cached_sub_query = self._cache.get_memory(sub_cache_key, max_age_seconds=self._cache_ttl_seconds)
+            if cached_sub_query:
+                cached_articles = as_news_articles(cached_sub_query.get("articles", ()))
+                all_articles.extend(cached_articles)
+                print(f"🎯 Using cached sub-query: '{search_query}'")
+                continue
             
-            # Remove duplicates and sort by relevance
-            unique_articles = self._deduplicate_articles(all_articles)
+            # Answer from stored articles if this query already searched a window containing the timeframe
+            stored_articles = self._load_stored_articles(search_query, effective_timeframe)
+            if stored_articles is not None:
+                all_articles.extend(stored_articles)
+                self._cache_query_result(sub_cache_key, search_query, stored_articles)
+                self._record_cache_hit()
+                print(f"🗃️ Reusing {len(stored_articles)} stored articles for '{search_query}' (window already searched)")
+                continue
             
-            if not unique_articles:
-                result = f"No recent news articles found for {search_type} search about: '{query}'"
-            else:
-                # Format results
-                result = self._format_search_results(query, search_type, unique_articles, effective_timeframe)
+            pending_queries.append((search_query, sub_cache_key))
+        
+        # Reserve API budget up front so concurrent sub-queries cannot overshoot the limit
+        granted = self._reserve_searches(len(pending_queries), budget_scope)
+        
+        return all_articles, pending_queries[:granted], len(pending_queries) - granted
+    
+    def _finalize_search(self, query: str, search_type: str, cache_key: str, effective_timeframe: Dict[str, str],
+                         all_articles: List[NewsArticle], pending_queries: List[tuple],
+                         search_results: List[Optional[List[NewsArticle]]], skipped_queries: int = 0,
+                         budget_scope: SearchBudgetScope = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Cache sub-query results, merge and format the articles, and cache the final result
+        The merged result is only cached (and returned as the cache entry) when every planned sub-query was searched
+        """
+        
+        session_searches = self._session_searches(budget_scope)
+        failed_queries = 0
+        for (search_query, sub_cache_key), articles in zip(pending_queries, search_results):
+            if articles is None:
+                failed_queries += 1
+                print(f"🔍 Search '{search_query}' failed (API searches used this question: {session_searches})")
+                continue  # Nothing to store or cache for this window
             
-            # Cache the final result
-            self._save_to_cache(cache_key, query, search_type, result, unique_articles, effective_timeframe)
+            self._store_searched_articles(search_query, effective_timeframe, articles)
+            all_articles.extend(articles)
             
-            return result
+            # Cache individual query results
+            self._cache_query_result(sub_cache_key, search_query, articles)
             
+            print(f"🔍 Search '{search_query}' - Found {len(articles)} articles (API searches used this question: {session_searches})")
+        
+        # Remove duplicates and sort by relevance
+        unique_articles = self._deduplicate_articles(all_articles)
+        
+        missing_queries = skipped_queries + failed_queries
+        if missing_queries:
+            # A partial result must not be served later as the complete search
+            print(f"⚠️ Partial result for '{query}' ({missing_queries} sub-queries not searched), not caching it")
+            cache_data = self._cache_entry(query, search_type, unique_articles, effective_timeframe)
+            return (self._result_text(cache_data, budget_scope) +
+                    f"\n\n⚠️ NOTE: {missing_queries} sub-queries could not be searched (search limit reached or search failed); results may be incomplete."), None
+        
+        # Cache the article records; the response text is rendered lazily from them
+        cache_data = self._save_to_cache(cache_key, query, search_type, unique_articles, effective_timeframe)
+        
+        return self._result_text(cache_data, budget_scope), cache_data
+    
+    def _load_stored_articles(self, search_query: str, effective_timeframe: Dict[str, str]) -> Optional[List[NewsArticle]]:
+        """Stored articles for a sub-query filtered to the timeframe, or None if the window was never searched"""
+        timeframe = effective_timeframe or self._search_timeframe
+        try:
+            window = self._cache.articles.covering_window(search_query, timeframe, max_age_seconds=self._cache_ttl_seconds)
+            if window is None:
+                return None
+            exact_window = window == timeframe_bounds(timeframe)
+            return self._cache.articles.articles_for(search_query, timeframe, include_undated=exact_window)
         except Exception as e:
-            print(f"❌ Error in Google News search: {str(e)}")
-            # Try cache fallback before giving up
-            fallback_result = self._get_cache_fallback(query, search_type)
-            if fallback_result:
-                return fallback_result
-            return f"❌ Google News search failed for '{query}': {str(e)}. No cached alternatives available."
+            print(f"⚠️ Error reading article store: {e}")
+            return None
+    
+    def _store_searched_articles(self, search_query: str, effective_timeframe: Dict[str, str], articles: List[NewsArticle]):
+        """Record a completed sub-query search in the article store"""
+        try:
+            self._cache.articles.record_search(search_query, effective_timeframe or self._search_timeframe, articles)
+        except Exception as e:
+            print(f"⚠️ Error saving to article store: {e}")
+    
+    def _handle_search_error(self, query: str, search_type: str, error: Exception, effective_timeframe: Dict[str, str] = None,
+                             budget_scope: SearchBudgetScope = None) -> str:
+        """Report a failed search and fall back to similar cached results if possible"""
+        print(f"❌ Error in Google News search: {str(error)}")
+        # Try cache fallback before giving up
+        fallback_result = self._get_cache_fallback(query, search_type, effective_timeframe, budget_scope)
+        if fallback_result:
+            return fallback_result
+        return f"❌ Google News search failed for '{query}': {str(error)}. No cached alternatives available."
+    
+    def _reserve_searches(self, requested: int, budget_scope: SearchBudgetScope = None) -> int:
+        """
+        Reserve up to `requested` API searches from the session budget and, when given,
+        the question/role budget scope; returns how many were granted
+        """
+        session_key = self._session_key(budget_scope)
+        with self._search_count_lock:
+            session_used = self._session_search_counts.get(session_key, 0)
+            available = max(0, self._max_searches_per_session - session_used)
+            if budget_scope is not None:
+                granted = budget_scope.reserve(requested, available)
+            else:
+                granted = max(0, min(requested, available))
+            self._search_count += granted
+            self._session_search_counts[session_key] = session_used + granted
+        return granted
+    
+    @staticmethod
+    def _session_key(budget_scope: SearchBudgetScope = None) -> Optional[str]:
+        """Question a search session is counted under (None for searches made without a budget scope)"""
+        return budget_scope.question_id if budget_scope is not None else None
+    
+    def _session_searches(self, budget_scope: SearchBudgetScope = None) -> int:
+        """API searches made so far in the session of budget_scope's question"""
+        with self._search_count_lock:
+            return self._session_search_counts.get(self._session_key(budget_scope), 0)
+    
+    def _record_cache_hit(self) -> int:
+        """Count a search answered without an API call and return the running total"""
+        with self._search_count_lock:
+            self._cache_hits += 1
+            return self._cache_hits
+    
+    def _execute_searches_concurrently(self, search_queries: List[str], effective_timeframe: Dict[str, str] = None) -> List[Optional[List[NewsArticle]]]:
+        """Run several SERP searches in parallel, returning article lists (None for failures) in query order"""
+        if len(search_queries) <= 1 or self._max_concurrent_searches == 1:
+            return [self._execute_single_search(q, effective_timeframe) for q in search_queries]
+        
+        max_workers = min(self._max_concurrent_searches, len(search_queries))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-news") as executor:
+            return list(executor.map(lambda q: self._execute_single_search(q, effective_timeframe), search_queries))
+    
+    async def _aexecute_searches_concurrently(self, search_queries: List[str], effective_timeframe: Dict[str, str] = None) -> List[Optional[List[NewsArticle]]]:
+        """Run several SERP searches concurrently on the event loop, returning article lists in query order"""
+        if not search_queries:
+            return []
+        
+        semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+        
+        async def bounded_search(search_query: str) -> Optional[List[NewsArticle]]:
+            async with semaphore:
+                return await self._aexecute_single_search(search_query, effective_timeframe)
+        
+        return list(await asyncio.gather(*(bounded_search(q) for q in search_queries)))
     
     def _generate_cache_key(self, query: str, search_type: str, priority: str, effective_timeframe: Dict[str, str] = None) -> str:
         """Generate a cache key for the query parameters including timeframe"""
@@ -218,143 +569,162 @@ class CachedGoogleNewsTool:
     
     def _load_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Load cached result from disk if still valid"""
-        cache_file = self._cache_dir / f"{cache_key}.pkl"
-        
-        if not cache_file.exists():
-            return None
-        
         try:
-            with open(cache_file, 'rb') as f:
-                cached_data = pickle.load(f)
-            
-            # Check if cache is still valid (TTL check)
-            cache_time = datetime.fromisoformat(cached_data.get('timestamp', '2020-01-01'))
-            if datetime.now() - cache_time > timedelta(hours=self._cache_ttl_hours):
-                print(f"🕒 Cache expired for key {cache_key[:8]}...")
-                cache_file.unlink()  # Remove expired cache
-                return None
-            
-            return cached_data
-            
+            # TTL is enforced by the store's timestamp index; hits are promoted to memory
+            return self._cache.get_disk(cache_key, max_age_seconds=self._cache_ttl_seconds)
         except Exception as e:
             print(f"⚠️ Error loading cache {cache_key[:8]}...: {e}")
             return None
     
-    def _save_to_cache(self, cache_key: str, query: str, search_type: str, result: str, articles: List[Dict[str, Any]], effective_timeframe: Dict[str, str] = None):
-        """Save search result to both session and disk cache"""
+    @property
+    def _cache_ttl_seconds(self) -> float:
+        """Cache validity in seconds"""
+        return self._cache_ttl_hours * 3600
+    
+    def _save_to_cache(self, cache_key: str, query: str, search_type: str, articles: List[NewsArticle],
+                       effective_timeframe: Dict[str, str] = None) -> Dict[str, Any]:
+        """Save search result to both session and disk cache and return the cache entry"""
+        cache_data = self._cache_entry(query, search_type, articles, effective_timeframe)
+        
+        # Save to shared memory and disk cache
+        try:
+            self._cache.put(cache_key, cache_data)
+        except Exception as e:
+            print(f"⚠️ Error saving cache: {e}")
+        
+        return cache_data
+    
+    def _cache_entry(self, query: str, search_type: str, articles: List[NewsArticle],
+                     effective_timeframe: Dict[str, str] = None) -> Dict[str, Any]:
+        """Cache entry (article records and search metadata) for a search result"""
         timeframe = effective_timeframe or self._search_timeframe
         
-        cache_data = {
+        return {
             'timestamp': datetime.now().isoformat(),
             'query': query,
             'search_type': search_type,
-            'result': result,
-            'articles': articles,
+            'articles': tuple(articles),
             'search_count': self._search_count,
             'timeframe_used': timeframe,
             'benchmark_safe': timeframe.get('benchmark_safe', False)
         }
+    
+    @staticmethod
+    def _is_full_result(cached_data: Dict[str, Any]) -> bool:
+        """Whether a cache entry is a complete search result (not an individual sub-query)"""
+        return cached_data.get('search_type') != 'sub_query'
+    
+    def _result_text(self, cached_data: Dict[str, Any], budget_scope: SearchBudgetScope = None) -> str:
+        """Render the tool response for a cached search result, with the usage footer of budget_scope's question"""
+        if 'result' in cached_data:
+            return cached_data['result']  # Entries cached before lazy formatting
         
-        # Save to session cache
-        self._session_cache[cache_key] = cache_data
+        articles = as_news_articles(cached_data.get('articles', ()))
+        if not articles:
+            return f"No recent news articles found for {cached_data.get('search_type')} search about: '{cached_data.get('query')}'"
         
-        # Save to disk cache
-        try:
-            cache_file = self._cache_dir / f"{cache_key}.pkl"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
-        except Exception as e:
-            print(f"⚠️ Error saving cache: {e}")
+        return self._format_search_results(cached_data['query'], cached_data['search_type'], articles,
+                                           cached_data.get('timeframe_used'), budget_scope)
     
-    def _cache_query_result(self, cache_key: str, query: str, articles: List[Dict[str, Any]]):
+    def _cache_query_result(self, cache_key: str, query: str, articles: List[NewsArticle]):
         """Cache individual query results for reuse"""
         cache_data = {
             'timestamp': datetime.now().isoformat(),
             'query': query,
-            'articles': articles,
+            'articles': tuple(articles),
             'search_type': 'sub_query'
         }
-        self._session_cache[cache_key] = cache_data
+        self._cache.put_memory(cache_key, cache_data)
     
-    def _find_similar_cached_query(self, query: str, search_type: str) -> Optional[str]:
+    def _find_similar_cached_query(self, query: str, search_type: str, effective_timeframe: Dict[str, str] = None,
+                                   budget_scope: SearchBudgetScope = None) -> Optional[str]:
         """Find similar cached queries to avoid redundant searches"""
-        query_words = set(query.lower().split())
+        # Only candidates sharing a token with the query are scored
+        match = self._cache.best_match(
+            query,
+            search_type=search_type,
+            min_similarity=0.6,  # Queries must share >60% of their words
+            max_age_seconds=self._cache_ttl_seconds
+        )
+        if not match:
+            return None
         
-        # Check session cache for similar queries
-        for cached_key, cached_data in self._session_cache.items():
-            if cached_data.get('search_type') == search_type:
-                cached_query = cached_data.get('query', '')
-                cached_words = set(cached_query.lower().split())
-                
-                # Calculate word overlap
-                overlap = len(query_words.intersection(cached_words))
-                total_words = len(query_words.union(cached_words))
-                similarity = overlap / total_words if total_words > 0 else 0
-                
-                # If queries are similar enough (>60% word overlap), reuse results
-                if similarity > 0.6:
-                    print(f"🔄 Found similar cached query: '{cached_query}' (similarity: {similarity:.2f})")
-                    return cached_data['result']
+        cached_key, similarity, cached_query = match
         
-        # Check disk cache for similar queries
-        try:
-            for cache_file in self._cache_dir.glob("*.pkl"):
-                try:
-                    with open(cache_file, 'rb') as f:
-                        cached_data = pickle.load(f)
-                    
-                    # Check TTL
-                    cache_time = datetime.fromisoformat(cached_data.get('timestamp', '2020-01-01'))
-                    if datetime.now() - cache_time > timedelta(hours=self._cache_ttl_hours):
-                        continue
-                    
-                    if cached_data.get('search_type') == search_type:
-                        cached_query = cached_data.get('query', '')
-                        cached_words = set(cached_query.lower().split())
-                        
-                        overlap = len(query_words.intersection(cached_words))
-                        total_words = len(query_words.union(cached_words))
-                        similarity = overlap / total_words if total_words > 0 else 0
-                        
-                        if similarity > 0.6:
-                            print(f"💾 Found similar disk cached query: '{cached_query}' (similarity: {similarity:.2f})")
-                            # Load into session cache for faster future access
-                            cache_key = self._generate_cache_key(query, search_type, "medium")
-                            self._session_cache[cache_key] = cached_data
-                            return cached_data['result']
-                            
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            print(f"⚠️ Error searching disk cache for similar queries: {e}")
+        cached_data = self._cache.get_memory(cached_key, max_age_seconds=self._cache_ttl_seconds)
+        if cached_data and not self._is_within_timeframe(cached_data, effective_timeframe):
+            return None
+        if cached_data:
+            print(f"🔄 Found similar cached query: '{cached_query}' (similarity: {similarity:.2f})")
+            return self._result_text(cached_data, budget_scope)
         
-        return None
+        # Disk hits are promoted into the shared memory tier for faster future access
+        cached_data = self._load_from_cache(cached_key)
+        if not cached_data:
+            self._cache.index.remove(cached_key)
+            return None
+        if not self._is_within_timeframe(cached_data, effective_timeframe):
+            return None
+        
+        print(f"💾 Found similar disk cached query: '{cached_query}' (similarity: {similarity:.2f})")
+        return self._result_text(cached_data, budget_scope)
+    
+    def _is_within_timeframe(self, cached_data: Dict[str, Any], effective_timeframe: Dict[str, str] = None) -> bool:
+        """Whether a cached result searched no later than the requested timeframe end (no post-cutoff articles)"""
+        cached_timeframe = cached_data.get('timeframe_used')
+        if not cached_timeframe:
+            return False
+        timeframe = effective_timeframe or self._search_timeframe
+        try:
+            return timeframe_bounds(cached_timeframe)[1] <= timeframe_bounds(timeframe)[1]
+        except (KeyError, ValueError):
+            return False
     
-    def _get_cache_fallback(self, query: str, search_type: str) -> Optional[str]:
-        """Get best available cached result when API limits are reached"""
-        # Try to find any cached result related to this query
-        query_words = set(query.lower().split())
+    def _is_same_window(self, cached_data: Dict[str, Any], effective_timeframe: Dict[str, str] = None) -> bool:
+        """Whether a cached result searched exactly the requested timeframe"""
+        cached_timeframe = cached_data.get('timeframe_used')
+        if not cached_timeframe:
+            return False
+        timeframe = effective_timeframe or self._search_timeframe
+        try:
+            return timeframe_bounds(cached_timeframe) == timeframe_bounds(timeframe)
+        except (KeyError, ValueError):
+            return False
+    
+    def _get_cache_fallback(self, query: str, search_type: str, effective_timeframe: Dict[str, str] = None,
+                            budget_scope: SearchBudgetScope = None) -> Optional[str]:
+        """
+        Get best available cached result when API limits are reached
+        Only a fresh result of the same search type over the same search window is
+        used, so the fallback never hands one question another question's articles
+        """
+        if self._bypass_cache:
+            return None
         
-        best_match = None
-        best_similarity = 0
+        match = self._cache.best_match(
+            query,
+            search_type=search_type,
+            min_similarity=0.5,  # Queries must share at least half of their words
+            max_age_seconds=self._cache_ttl_seconds
+        )
+        if not match:
+            return None
         
-        # Check all cached results for best match
-        for cached_key, cached_data in self._session_cache.items():
-            cached_query = cached_data.get('query', '')
-            cached_words = set(cached_query.lower().split())
-            
-            overlap = len(query_words.intersection(cached_words))
-            total_words = len(query_words.union(cached_words))
-            similarity = overlap / total_words if total_words > 0 else 0
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = cached_data
+        cached_key, best_similarity, _ = match
+        best_match = self._cache.get_memory(cached_key, max_age_seconds=self._cache_ttl_seconds)
+        if best_match is None:
+            try:
+                best_match = self._cache.get_disk(cached_key, max_age_seconds=self._cache_ttl_seconds)
+            except Exception as e:
+                print(f"⚠️ Error loading fallback cache {cached_key[:8]}...: {e}")
+                return None
         
-        if best_match and best_similarity > 0.3:  # Lower threshold for fallback
+        if best_match and not self._is_same_window(best_match, effective_timeframe):
+            return None
+        
+        if best_match:
             print(f"🆘 Using fallback cached result (similarity: {best_similarity:.2f})")
-            fallback_result = best_match['result']
+            fallback_result = self._result_text(best_match, budget_scope)
             fallback_result += f"\n\n⚠️ NOTE: This is a cached result from a similar query due to API limits."
             return fallback_result
         
@@ -365,50 +735,45 @@ class CachedGoogleNewsTool:
         total_requests = self._search_count + self._cache_hits
         cache_hit_rate = self._cache_hits / total_requests if total_requests > 0 else 0
         
-        return {
+        stats = {
             "cache_hits": self._cache_hits,
             "api_calls": self._search_count,
             "total_requests": total_requests,
             "cache_hit_rate": cache_hit_rate,
-            "session_cache_size": len(self._session_cache),
-            "disk_cache_files": len(list(self._cache_dir.glob("*.pkl")))
+            "coalesced_requests": self._coalesced_requests,
+            "memory_cache_size": self._cache.memory_entries(),
+            "disk_cache_entries": self._cache.store.count(),
+            "stored_articles": self._cache.articles.count(),
+            "disk_cache_bytes": self._cache.total_bytes(),
+            "expired_entries": self._cache.janitor.expired_total,
+            "evicted_entries": self._cache.janitor.evicted_total
         }
+        if isinstance(self._serp_client, ReplaySerpClient):
+            stats["replay_hits"] = self._serp_client.replay_hits
+            stats["replay_misses"] = self._serp_client.replay_misses
+        return stats
     
     def clear_expired_cache(self):
-        """Clear expired cache files from disk"""
+        """Run a cache janitor pass now (TTL expiry and size-bounded eviction)"""
         try:
-            expired_count = 0
-            for cache_file in self._cache_dir.glob("*.pkl"):
-                try:
-                    with open(cache_file, 'rb') as f:
-                        cached_data = pickle.load(f)
-                    
-                    cache_time = datetime.fromisoformat(cached_data.get('timestamp', '2020-01-01'))
-                    if datetime.now() - cache_time > timedelta(hours=self._cache_ttl_hours):
-                        cache_file.unlink()
-                        expired_count += 1
-                        
-                except Exception:
-                    cache_file.unlink()  # Remove corrupted cache files
-                    expired_count += 1
+            removed = self._cache.janitor.run_once()
             
-            if expired_count > 0:
-                print(f"🧹 Cleared {expired_count} expired cache files")
+            if removed["expired"] == 0 and removed["evicted"] == 0:
+                print("🧹 No expired or over-budget cache entries")
                 
         except Exception as e:
             print(f"⚠️ Error clearing expired cache: {e}")
     
     def clear_all_cache(self):
-        """Clear all cache (session and disk)"""
-        self._session_cache.clear()
+        """Clear all cache (memory and disk)"""
         try:
-            for cache_file in self._cache_dir.glob("*.pkl"):
-                cache_file.unlink()
-            print("🧹 Cleared all cache files")
+            self._cache.clear()
+            print("🧹 Cleared all cache entries")
         except Exception as e:
             print(f"⚠️ Error clearing cache: {e}")
     
-    def _generate_strategic_queries(self, query: str, search_type: str, priority: str) -> List[str]:
+    @staticmethod
+    def _generate_strategic_queries(query: str, search_type: str, priority: str) -> List[str]:
         """Generate strategic search queries to maximize information with minimal API calls"""
         
         queries = []
@@ -471,79 +836,101 @@ class CachedGoogleNewsTool:
         
         return queries[:4]  # Maximum 4 queries even for comprehensive searches
     
-    def _execute_single_search(self, query: str, effective_timeframe: Dict[str, str] = None) -> List[Dict[str, Any]]:
-        """Execute a single SERP API search with timeframe constraints"""
+    def _build_search_params(self, query: str, effective_timeframe: Dict[str, str] = None) -> Dict[str, Any]:
+        """Build SERP API parameters for a Google News search with timeframe constraints"""
+        
+        # Use effective timeframe if provided, otherwise use default
+        timeframe = effective_timeframe or self._search_timeframe
+        
+        # Log benchmark constraint if applied
+        if effective_timeframe and effective_timeframe.get("benchmark_safe"):
+            print(f"🛡️ Benchmark constraint applied: searching until {timeframe['end']} (1 day before cutoff {effective_timeframe.get('original_cutoff', 'unknown')})")
+        
+        # Configure search parameters for Google News
+        return {
+            "api_key": self._serp_api_key,
+            "engine": "google",
+            "q": query,
+            "tbm": "nws",  # News search
+            "tbs": f"cdr:1,cd_min:{timeframe['start']},cd_max:{timeframe['end']}",
+            "num": 20,  # More results per search to maximize efficiency
+            "hl": "en",
+            "gl": "us"
+        }
+    
+    def _execute_single_search(self, query: str, effective_timeframe: Dict[str, str] = None) -> Optional[List[NewsArticle]]:
+        """Execute a single SERP API search with timeframe constraints (None if the search failed)"""
         
         try:
-            # Use effective timeframe if provided, otherwise use default
-            timeframe = effective_timeframe or self._search_timeframe
-            
-            # Configure search parameters for Google News
-            search_params = {
-                "api_key": self._serp_api_key,
-                "engine": "google",
-                "q": query,
-                "tbm": "nws",  # News search
-                "tbs": f"cdr:1,cd_min:{timeframe['start']},cd_max:{timeframe['end']}",
-                "num": 20,  # More results per search to maximize efficiency
-                "hl": "en",
-                "gl": "us"
-            }
-            
-            # Log benchmark constraint if applied
-            if effective_timeframe and effective_timeframe.get("benchmark_safe"):
-                print(f"🛡️ Benchmark constraint applied: searching until {timeframe['end']} (1 day before cutoff {effective_timeframe.get('original_cutoff', 'unknown')})")
+            search_params = self._build_search_params(query, effective_timeframe)
             
             # Perform the search
-            search = self._serp_client(search_params)
-            search_result = search.get_dict()
-            
-            articles = []
+            search_result = self._serp_client.search(search_params)
             
-            # Process news results
-            if "news_results" in search_result:
-                for article in search_result["news_results"]:
-                    articles.append({
-                        "title": article.get("title", ""),
-                        "source": article.get("source", ""),
-                        "link": article.get("link", ""),
-                        "snippet": article.get("snippet", ""),
-                        "date": article.get("date", ""),
-                        "position": article.get("position", 0),
-                        "query": query  # Track which query found this
-                    })
+            return self._parse_search_results(query, search_result)
             
-            # Also check organic results for additional news
-            if "organic_results" in search_result:
-                for result in search_result["organic_results"][:5]:
-                    if self._is_news_source(result.get("link", "")):
-                        articles.append({
-                            "title": result.get("title", ""),
-                            "source": result.get("displayed_link", ""),
-                            "link": result.get("link", ""),
-                            "snippet": result.get("snippet", ""),
-                            "date": "Recent",
-                            "position": result.get("position", 0),
-                            "query": query
-                        })
+        except Exception as e:
+            print(f"❌ Search failed for '{query}': {str(e)}")
+            return None
+    
+    async def _aexecute_single_search(self, query: str, effective_timeframe: Dict[str, str] = None) -> Optional[List[NewsArticle]]:
+        """Execute a single SERP API search over non-blocking HTTP (None if the search failed)"""
+        
+        try:
+            search_params = self._build_search_params(query, effective_timeframe)
+            search_result = await self._serp_client.asearch(search_params)
             
-            return articles
+            return self._parse_search_results(query, search_result)
             
         except Exception as e:
             print(f"❌ Search failed for '{query}': {str(e)}")
-            return []
+            return None
     
-    def _deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _parse_search_results(self, query: str, search_result: Dict[str, Any]) -> List[NewsArticle]:
+        """Extract article records from a raw SERP API response"""
+        
+        articles = []
+        
+        # Process news results (query tracks which sub-query found the article)
+        if "news_results" in search_result:
+            for article in search_result["news_results"]:
+                articles.append(NewsArticle(
+                    article.get("title", ""),
+                    article.get("source", ""),
+                    article.get("link", ""),
+                    article.get("snippet", ""),
+                    article.get("date", ""),
+                    article.get("position", 0),
+                    query
+                ))
+        
+        # Also check organic results for additional news
+        if "organic_results" in search_result:
+            for result in search_result["organic_results"][:5]:
+                if self._is_news_source(result.get("link", "")):
+                    articles.append(NewsArticle(
+                        result.get("title", ""),
+                        result.get("displayed_link", ""),
+                        result.get("link", ""),
+                        result.get("snippet", ""),
+                        "Recent",
+                        result.get("position", 0),
+                        query
+                    ))
+        
+        return articles
+    
+    def _deduplicate_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """Remove duplicate articles and sort by relevance"""
         
         seen_urls = set()
         unique_articles = []
         
         # Sort by position (lower is better) and source credibility
-        articles.sort(key=lambda x: (x.get("position", 999), 0 if self._is_credible_source(x.get("source", "")) else 1))
+        articles.sort(key=lambda x: (x.position, 0 if self._is_credible_source(x.source) else 1))
         
         for article in articles:
-            url = article.get("link", "")
+            url = article.link
             if url and url not in seen_urls:
                 seen_urls.add(url)
                 unique_articles.append(article)
@@ -573,37 +960,28 @@ class CachedGoogleNewsTool:
         ]
         return any(credible in source for credible in credible_sources)
     
-    def _format_search_results(self, query: str, search_type: str, articles: List[Dict[str, Any]], effective_timeframe: Dict[str, str] = None) -> str:
+    def _format_search_results(self, query: str, search_type: str, articles: Tuple[NewsArticle, ...], effective_timeframe: Dict[str, str] = None,
+                               budget_scope: SearchBudgetScope = None) -> str:
         """Format search results for agent consumption with cache info"""
         
-        cache_stats = self.get_cache_stats()
         timeframe = effective_timeframe or self._search_timeframe
-        
-        result_text = f"Found {len(articles)} articles for {search_type} search '{query}':\n\n"
-        
-        for i, article in enumerate(articles, 1):
-            result_text += f"{i}. **{article['title']}**\n"
-            result_text += f"   Source: {article['source']}\n"
-            if article['date']:
-                result_text += f"   Date: {article['date']}\n"
-            if article['snippet']:
-                result_text += f"   Summary: {article['snippet']}\n"
-            result_text += f"   URL: {article['link']}\n"
-            if article.get('query') != query:
-                result_text += f"   Found via: {article.get('query')}\n"
-            result_text += "\n"
-        
-        result_text += f"\nSearch period: {timeframe['start']} to {timeframe['end']}\n"
-        
-        # Add benchmark constraint information
+        original_cutoff = None
         if effective_timeframe and effective_timeframe.get("benchmark_safe"):
-            result_text += f"🛡️ BENCHMARK CONSTRAINT APPLIED: Search limited to articles at least 1 day before cutoff date ({effective_timeframe.get('original_cutoff', 'unknown')})\n"
+            original_cutoff = effective_timeframe.get('original_cutoff', 'unknown')
         
-        result_text += f"API searches used: {self._search_count}/{self._max_searches_per_session}\n"
-        result_text += f"Cache hits: {cache_stats['cache_hits']} | Hit rate: {cache_stats['cache_hit_rate']:.1%}\n"
-        result_text += f"Search strategy: {search_type}"
+        listing = _format_article_listing(query, search_type, tuple(articles),
+                                          timeframe['start'], timeframe['end'], original_cutoff)
         
-        return result_text
+        # Session counters change on every call, so only this footer is rendered per response
+        total_requests = self._search_count + self._cache_hits
+        cache_hit_rate = self._cache_hits / total_requests if total_requests > 0 else 0
+        
+        return (
+            f"{listing}"
+            f"API searches used: {self._session_searches(budget_scope)} (limit {self._max_searches_per_session} per question)\n"
+            f"Cache hits: {self._cache_hits} | Hit rate: {cache_hit_rate:.1%}\n"
+            f"Search strategy: {search_type}"
+        )
     
     def _simulate_search(self, query: str, search_type: str) -> str:
         """Simulate search when API is not available"""
@@ -0,0 +1,59 @@
+"""
+Resolution index for ForecastBench scoring
+Loads a resolutions file once into a (question_id, resolution_date) -> resolved_to
+hash map, so scoring a (question, horizon) pair is a dict lookup instead of a
+scan over every resolution. The runners and the Inspect AI dataset loader share
+the same cached index per file
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Any, Optional, Tuple, Union
+
+
+class ResolutionIndex:
+    """(question_id, resolution_date) -> resolved_to lookup; unresolved entries (resolved_to null) are skipped"""
+
+    def __init__(self, resolutions: Iterable[Dict[str, Any]] = ()):
+        self._resolved: Dict[Tuple[str, str], float] = {}
+        for resolution in resolutions:
+            question_id = resolution.get('id')
+            resolved_to = resolution.get('resolved_to')
+            if question_id is None or resolved_to is None:
+                continue
+            # Keep the first resolution listed for a (question, date), as a linear scan would
+            self._resolved.setdefault((str(question_id), str(resolution.get('resolution_date'))), resolved_to)
+
+    @classmethod
+    def from_data(cls, resolutions_data: Dict[str, Any]) -> "ResolutionIndex":
+        """Index the 'resolutions' list of a parsed ForecastBench resolutions file"""
+        return cls(resolutions_data.get('resolutions', []))
+
+    def get(self, question_id: str, resolution_date: str) -> Optional[float]:
+        """Resolved value of a question on a date, or None if it has not resolved"""
+        return self._resolved.get((str(question_id), str(resolution_date)))
+
+    def __len__(self) -> int:
+        return len(self._resolved)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return (str(key[0]), str(key[1])) in self._resolved
+
+
+_index_cache: Dict[Tuple[str, int], ResolutionIndex] = {}
+_index_cache_lock = threading.Lock()
+
+
+def load_resolution_index(resolutions_file: Union[str, Path]) -> ResolutionIndex:
+    """Resolution index for a file, parsed once per process (and again only if the file changes)"""
+    path = Path(resolutions_file).resolve()
+    cache_key = (str(path), os.stat(path).st_mtime_ns)
+    with _index_cache_lock:
+        index = _index_cache.get(cache_key)
+        if index is None:
+            with open(path, 'r') as f:
+                index = ResolutionIndex.from_data(json.load(f))
+            _index_cache[cache_key] = index
+        return index
@@ -0,0 +1,137 @@
+"""
+Search budget ledger for debate forecasting
+Counts actual SERP API calls per run, per question and per debate role with
+thread-safe counters. The Google News tool reserves calls through a scope
+(question + role) before searching, so advocates cannot overspend their
+budget, and solvers read the same counts back for prompts and penalties.
+Searches refused by an enforced budget are still counted as attempted, so
+the search penalty reflects how far a role tried to overspend
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+DEBATE_ROLES = ("high_advocate", "low_advocate")
+
+
+class SearchBudgetScope:
+    """A (question, role) view of a ledger handed to one tool instance"""
+
+    def __init__(self, ledger: "SearchBudgetLedger", question_id: str, role: str):
+        self.ledger = ledger
+        self.question_id = question_id
+        self.role = role
+
+    def reserve(self, requested: int, available: Optional[int] = None) -> int:
+        return self.ledger.reserve(self.question_id, self.role, requested, available)
+
+    def refuse(self, requested: int = 1):
+        self.ledger.refuse(self.question_id, self.role, requested)
+
+    def used(self) -> int:
+        return self.ledger.used(self.question_id, self.role)
+
+    def remaining(self) -> Optional[int]:
+        return self.ledger.remaining(self.question_id, self.role)
+
+    def exhausted(self) -> bool:
+        """True once an enforced budget is spent"""
+        remaining = self.remaining()
+        return self.ledger.enforce and remaining is not None and remaining <= 0
+
+
+class SearchBudgetLedger:
+    """
+    Atomic search counters shared by every tool instance in a run
+    budget_per_role is the number of SERP calls each (question, role) may make;
+    with enforce=True the tool is refused further calls once it is spent,
+    otherwise overspend is granted; either way searches attempted beyond the
+    budget count towards the search penalty
+    """
+
+    def __init__(self, budget_per_role: Optional[int] = None, penalty_rate: float = 0.01, enforce: bool = True):
+        self.budget_per_role = budget_per_role
+        self.enforce = enforce
+        self.penalty_rate = penalty_rate
+        self._lock = threading.Lock()
+        self._run_total = 0
+        self._question_totals: Dict[str, int] = defaultdict(int)
+        self._role_totals: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._role_attempts: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def scope(self, question_id: str, role: str) -> SearchBudgetScope:
+        """Budget scope for one debate role on one question"""
+        return SearchBudgetScope(self, str(question_id), role)
+
+    def reserve(self, question_id: str, role: str, requested: int, available: Optional[int] = None) -> int:
+        """
+        Reserve up to `requested` searches for a role and return how many were granted
+        `available` caps the grant by a limit outside the ledger (e.g. the tool's session limit);
+        every requested search counts as attempted, granted or not
+        """
+        with self._lock:
+            self._role_attempts[(question_id, role)] += max(0, requested)
+            granted = max(0, requested if available is None else min(requested, available))
+            if self.enforce and self.budget_per_role is not None:
+                granted = min(granted, max(0, self.budget_per_role - self._role_totals[(question_id, role)]))
+            if granted:
+                self._role_totals[(question_id, role)] += granted
+                self._question_totals[question_id] += granted
+                self._run_total += granted
+            return granted
+
+    def refuse(self, question_id: str, role: str, requested: int = 1):
+        """Count searches a role attempted but was refused without a reservation"""
+        with self._lock:
+            self._role_attempts[(question_id, role)] += max(0, requested)
+
+    def attempted(self, question_id: str, role: str = None) -> int:
+        """Searches a role (or a whole question) attempted, including refused ones"""
+        question_id = str(question_id)
+        with self._lock:
+            return sum(count for (qid, r), count in self._role_attempts.items()
+                       if qid == question_id and (role is None or r == role))
+
+    def used(self, question_id: str = None, role: str = None) -> int:
+        """Searches used by a role on a question, by a whole question, or by the whole run"""
+        with self._lock:
+            if question_id is None:
+                return self._run_total
+            if role is None:
+                return self._question_totals.get(str(question_id), 0)
+            return self._role_totals.get((str(question_id), role), 0)
+
+    def remaining(self, question_id: str, role: str) -> Optional[int]:
+        """Searches a role may still make on a question (None when uncapped)"""
+        if self.budget_per_role is None:
+            return None
+        return max(0, self.budget_per_role - self.used(question_id, role))
+
+    def searches_by_role(self, question_id: str) -> Dict[str, int]:
+        """Per-role search counts for a question"""
+        question_id = str(question_id)
+        with self._lock:
+            return {role: count for (qid, role), count in self._role_totals.items() if qid == question_id}
+
+    def search_penalty(self, question_id: str = None) -> float:
+        """Penalty for searches attempted beyond each role's budget, for one question or the whole run"""
+        if self.budget_per_role is None:
+            return 0.0
+        with self._lock:
+            overspend = sum(
+                max(0, count - self.budget_per_role)
+                for (qid, _), count in self._role_attempts.items()
+                if question_id is None or qid == str(question_id)
+            )
+        return overspend * self.penalty_rate
+
+    def question_summary(self, question_id: str) -> Dict[str, object]:
+        """Search accounting for a question, in the shape written to per-question logs"""
+        return {
+            "search_count": self.used(question_id),
+            "searches_by_role": self.searches_by_role(question_id),
+            "searches_attempted": self.attempted(question_id),
+            "budget_per_role": self.budget_per_role,
+            "search_penalty": self.search_penalty(question_id),
+        }
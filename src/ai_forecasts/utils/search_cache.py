@@ -0,0 +1,597 @@
+"""
+Indexed on-disk store for Google News search results
+Keeps every cached search in a single SQLite file indexed by cache key,
+timestamp and search type so lookups, TTL expiry and stats never scan the cache,
+plus an in-memory inverted token index for similar-query lookups, a
+process-wide shared cache that every tool instance and worker thread reuses,
+and a background janitor for TTL expiry and size-bounded LRU eviction
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, FrozenSet, Tuple, Union
+
+from .article_store import ArticleStore
+
+UNIMPORTED_SUFFIX = ".unimported"
+
+# Published to coalesced waiters when the leader's result is not theirs to reuse
+RETRY_AS_LEADER = object()
+
+
+class SearchCacheStore:
+    """
+    SQLite-backed store for cached search results
+    Payloads are pickled blobs; query text, search type and timestamp are stored
+    as indexed columns so metadata queries never deserialize payloads
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS search_cache (
+        cache_key TEXT PRIMARY KEY,
+        query TEXT NOT NULL,
+        search_type TEXT,
+        timestamp REAL NOT NULL,
+        payload BLOB NOT NULL,
+        size_bytes INTEGER NOT NULL DEFAULT 0,
+        last_access REAL NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_search_cache_timestamp ON search_cache(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_search_cache_type ON search_cache(search_type, timestamp);
+    """
+
+    # Indexes on columns added after the first release (created after migration)
+    POST_MIGRATION_SCHEMA = """
+    CREATE INDEX IF NOT EXISTS idx_search_cache_last_access ON search_cache(last_access);
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared across threads, serialized by our own lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        # Incremental auto-vacuum lets evictions give disk space back (applies to new databases)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+        self._conn.executescript(self.POST_MIGRATION_SCHEMA)
+
+        # Reads only record access times here; the janitor flushes them in batches
+        self._pending_access: Dict[str, float] = {}
+
+    def _migrate(self):
+        """Add size/access columns to stores created before size-bounded eviction"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(search_cache)")}
+        if "size_bytes" in columns:
+            return
+        with self._lock:
+            self._conn.execute("ALTER TABLE search_cache ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("ALTER TABLE search_cache ADD COLUMN last_access REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE search_cache SET size_bytes = length(payload), last_access = timestamp")
+            # Switch the existing file to incremental auto-vacuum (takes effect after a full VACUUM)
+            if self._conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                self._conn.execute("VACUUM")
+
+    @staticmethod
+    def _to_epoch(timestamp: Any) -> float:
+        """Convert an ISO timestamp (as stored in cache entries) to epoch seconds"""
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _min_timestamp(max_age_seconds: Optional[float]) -> float:
+        """Oldest timestamp still considered valid for the given age limit"""
+        if max_age_seconds is None:
+            return 0.0
+        return time.time() - max_age_seconds
+
+    def get(self, cache_key: str, max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Load a cached entry by key if it exists and is younger than max_age_seconds"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM search_cache WHERE cache_key = ? AND timestamp >= ?",
+                (cache_key, self._min_timestamp(max_age_seconds))
+            ).fetchone()
+
+            if row is not None:
+                self.touch(cache_key)
+
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def touch(self, cache_key: str):
+        """Record an access for LRU eviction (written to disk in batches by flush_access_times)"""
+        with self._lock:
+            self._pending_access[cache_key] = time.time()
+
+    def put(self, cache_key: str, cache_data: Dict[str, Any]):
+        """Insert or replace a cached entry"""
+        payload = pickle.dumps(cache_data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO search_cache
+                   (cache_key, query, search_type, timestamp, payload, size_bytes, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    cache_key,
+                    cache_data.get('query', ''),
+                    cache_data.get('search_type'),
+                    self._to_epoch(cache_data.get('timestamp')),
+                    sqlite3.Binary(payload),
+                    len(payload),
+                    time.time()
+                )
+            )
+
+    def queries(self, search_type: str = None, max_age_seconds: Optional[float] = None) -> List[Tuple[str, str, str, float]]:
+        """List (cache_key, query, search_type, timestamp) rows without loading payloads"""
+        min_timestamp = self._min_timestamp(max_age_seconds)
+        with self._lock:
+            if search_type is None:
+                rows = self._conn.execute(
+                    "SELECT cache_key, query, search_type, timestamp FROM search_cache WHERE timestamp >= ?",
+                    (min_timestamp,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT cache_key, query, search_type, timestamp FROM search_cache WHERE search_type = ? AND timestamp >= ?",
+                    (search_type, min_timestamp)
+                ).fetchall()
+        return rows
+
+    def count(self, max_age_seconds: Optional[float] = None) -> int:
+        """Number of stored entries, optionally only those younger than max_age_seconds"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM search_cache WHERE timestamp >= ?",
+                (self._min_timestamp(max_age_seconds),)
+            ).fetchone()
+        return row[0]
+
+    def total_bytes(self) -> int:
+        """Total payload size of all stored entries"""
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM search_cache").fetchone()
+        return row[0]
+
+    def flush_access_times(self) -> int:
+        """Write batched last-access times recorded by get() and return how many were written"""
+        with self._lock:
+            pending = list(self._pending_access.items())
+            self._pending_access.clear()
+            if pending:
+                self._conn.executemany(
+                    "UPDATE search_cache SET last_access = ? WHERE cache_key = ?",
+                    [(accessed, key) for key, accessed in pending]
+                )
+        return len(pending)
+
+    def delete_expired(self, max_age_seconds: float) -> int:
+        """Delete entries older than max_age_seconds and return how many were removed"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM search_cache WHERE timestamp < ?",
+                (self._min_timestamp(max_age_seconds),)
+            )
+        return cursor.rowcount
+
+    def evict_to_budget(self, max_bytes: int) -> List[Tuple[str, str]]:
+        """
+        Delete least recently used entries until the payload total fits max_bytes
+        Returns the (cache_key, query) of every evicted entry
+        """
+        excess = self.total_bytes() - max_bytes
+        if excess <= 0:
+            return []
+
+        evicted = []
+        with self._lock:
+            for cache_key, cached_query, size_bytes in self._conn.execute(
+                "SELECT cache_key, query, size_bytes FROM search_cache ORDER BY last_access ASC"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                evicted.append((cache_key, cached_query))
+                excess -= size_bytes
+            self._conn.executemany("DELETE FROM search_cache WHERE cache_key = ?", [(key,) for key, _ in evicted])
+        return evicted
+
+    def reclaim_space(self):
+        """Return pages freed by deletions to the filesystem"""
+        with self._lock:
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def clear(self):
+        """Delete every stored entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._pending_access.clear()
+
+    def import_legacy_pickles(self, cache_dir: Union[str, Path]) -> int:
+        """
+        Move old one-pickle-per-query cache files into the store
+        Files that cannot be imported are kept as <name>.pkl.unimported instead of being deleted
+        """
+        imported = 0
+        for cache_file in Path(cache_dir).glob("*.pkl"):
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached_data = pickle.load(f)
+                if not isinstance(cached_data, dict) or 'result' not in cached_data:
+                    raise ValueError("not a cached search result")
+                self.put(cache_file.stem, cached_data)
+            except Exception as e:
+                unimported_file = cache_file.with_name(cache_file.name + UNIMPORTED_SUFFIX)
+                print(f"⚠️ Could not import legacy cache file {cache_file.name} ({e}); kept as {unimported_file.name}")
+                os.replace(cache_file, unimported_file)
+                continue
+            cache_file.unlink(missing_ok=True)
+            imported += 1
+        return imported
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class QueryTokenIndex:
+    """
+    In-memory inverted index from query tokens to cache keys
+    Similar-query lookups only score entries that share at least one token
+    with the query, using precomputed token-set sizes for Jaccard similarity
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        # cache_key -> (tokens, token_count, query, search_type, timestamp)
+        self._entries: Dict[str, Tuple[FrozenSet[str], int, str, str, float]] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def tokenize(query: str) -> FrozenSet[str]:
+        """Split a query into the lower-cased word set used for similarity"""
+        return frozenset(query.lower().split())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, cache_key: str) -> bool:
+        return cache_key in self._entries
+
+    def add(self, cache_key: str, query: str, search_type: str, timestamp: Any = None):
+        """Index (or re-index) a cached query"""
+        tokens = self.tokenize(query)
+        entry_time = SearchCacheStore._to_epoch(timestamp) if timestamp is not None else time.time()
+        with self._lock:
+            self._remove_unlocked(cache_key)
+            self._entries[cache_key] = (tokens, len(tokens), query, search_type, entry_time)
+            for token in tokens:
+                self._postings[token].add(cache_key)
+
+    def remove(self, cache_key: str):
+        """Drop a cache key from the index"""
+        with self._lock:
+            self._remove_unlocked(cache_key)
+
+    def _remove_unlocked(self, cache_key: str):
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+        for token in entry[0]:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(cache_key)
+                if not posting:
+                    del self._postings[token]
+
+    def remove_older_than(self, min_timestamp: float) -> int:
+        """Drop entries older than min_timestamp and return how many were removed"""
+        with self._lock:
+            stale_keys = [key for key, entry in self._entries.items() if entry[4] < min_timestamp]
+            for key in stale_keys:
+                self._remove_unlocked(key)
+        return len(stale_keys)
+
+    def clear(self):
+        """Drop every indexed entry"""
+        with self._lock:
+            self._postings.clear()
+            self._entries.clear()
+
+    def best_match(self, query: str, search_type: str = None, min_similarity: float = 0.0,
+                   min_timestamp: float = 0.0) -> Optional[Tuple[str, float, str]]:
+        """
+        Find the indexed query most similar to `query`
+        
+        Returns (cache_key, similarity, cached_query) for the best candidate whose
+        Jaccard similarity exceeds min_similarity, or None
+        """
+        query_tokens = self.tokenize(query)
+        if not query_tokens:
+            return None
+
+        with self._lock:
+            # Intersect posting lists: overlap count per candidate key
+            overlaps = Counter()
+            for token in query_tokens:
+                posting = self._postings.get(token)
+                if posting:
+                    overlaps.update(posting)
+
+            best = None
+            best_similarity = min_similarity
+            query_size = len(query_tokens)
+            for cache_key, overlap in overlaps.items():
+                _, token_count, cached_query, cached_type, entry_time = self._entries[cache_key]
+                if search_type is not None and cached_type != search_type:
+                    continue
+                if entry_time < min_timestamp:
+                    continue
+                similarity = overlap / (query_size + token_count - overlap)
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best = (cache_key, similarity, cached_query)
+
+        return best
+
+
+class SharedSearchCache:
+    """
+    Process-wide, thread-safe search cache shared by every tool instance
+    Combines a bounded LRU memory tier, the indexed SQLite store and the
+    inverted token index, so a result found by one forecaster is an in-memory
+    hit for every other forecaster in the run
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], memory_size: int = 2048,
+                 index_max_age_seconds: Optional[float] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self.janitor: Optional["CacheJanitor"] = None
+
+        self.store = SearchCacheStore(self.cache_dir / "search_cache.sqlite3")
+        migrated = self.store.import_legacy_pickles(self.cache_dir)
+        if migrated:
+            print(f"📦 Migrated {migrated} legacy cache files into {self.store.db_path}")
+
+        # Article-level store (URL-keyed, date-parsed) in the same database file
+        self.articles = ArticleStore(self.store.db_path)
+
+        self.index = QueryTokenIndex()
+        for cache_key, cached_query, cached_type, cached_time in self.store.queries(max_age_seconds=index_max_age_seconds):
+            self.index.add(cache_key, cached_query, cached_type, cached_time)
+
+    @staticmethod
+    def _is_fresh(cache_data: Dict[str, Any], max_age_seconds: Optional[float]) -> bool:
+        if max_age_seconds is None:
+            return True
+        entry_time = SearchCacheStore._to_epoch(cache_data.get('timestamp'))
+        return entry_time >= time.time() - max_age_seconds
+
+    def get_memory(self, cache_key: str, max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Look up the memory tier only, refreshing the entry's LRU position"""
+        with self._lock:
+            cache_data = self._memory.get(cache_key)
+            if cache_data is None:
+                return None
+            if not self._is_fresh(cache_data, max_age_seconds):
+                del self._memory[cache_key]
+                return None
+            self._memory.move_to_end(cache_key)
+        self.store.touch(cache_key)
+        return cache_data
+
+    def get_disk(self, cache_key: str, max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Look up the disk store and promote a hit into the memory tier"""
+        cache_data = self.store.get(cache_key, max_age_seconds=max_age_seconds)
+        if cache_data is not None:
+            self.put_memory(cache_key, cache_data)
+        return cache_data
+
+    def get(self, cache_key: str, max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Look up memory first, then disk"""
+        cache_data = self.get_memory(cache_key, max_age_seconds)
+        if cache_data is not None:
+            return cache_data
+        return self.get_disk(cache_key, max_age_seconds)
+
+    def put_memory(self, cache_key: str, cache_data: Dict[str, Any]):
+        """Store an entry in the memory tier only, evicting the least recently used"""
+        with self._lock:
+            self._memory[cache_key] = cache_data
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def put(self, cache_key: str, cache_data: Dict[str, Any]):
+        """Store a full search result in memory and on disk and index its query"""
+        self.put_memory(cache_key, cache_data)
+        self.index.add(cache_key, cache_data.get('query', ''), cache_data.get('search_type'), cache_data.get('timestamp'))
+        self.store.put(cache_key, cache_data)
+
+    def join_in_flight(self, cache_key: str) -> Tuple[bool, Future]:
+        """
+        Register a search for cache_key, returning (is_leader, future)
+        The first caller becomes the leader and must call finish_in_flight;
+        concurrent callers for the same key wait on the leader's future instead
+        """
+        with self._lock:
+            future = self._in_flight.get(cache_key)
+            if future is not None:
+                return False, future
+            future = Future()
+            self._in_flight[cache_key] = future
+            return True, future
+
+    def finish_in_flight(self, cache_key: str, result: Any = None, error: Optional[BaseException] = None):
+        """
+        Publish the leader's result (or error) to every waiter and clear the in-flight entry
+        Pass RETRY_AS_LEADER as the result to make waiters search again themselves
+        """
+        with self._lock:
+            future = self._in_flight.pop(cache_key, None)
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+    def best_match(self, query: str, search_type: str = None, min_similarity: float = 0.0,
+                   max_age_seconds: Optional[float] = None) -> Optional[Tuple[str, float, str]]:
+        """Most similar indexed query, see QueryTokenIndex.best_match"""
+        min_timestamp = time.time() - max_age_seconds if max_age_seconds is not None else 0.0
+        return self.index.best_match(query, search_type=search_type, min_similarity=min_similarity,
+                                     min_timestamp=min_timestamp)
+
+    def memory_entries(self) -> int:
+        """Number of entries in the memory tier"""
+        with self._lock:
+            return len(self._memory)
+
+    def total_bytes(self) -> int:
+        """Size of the database file's contents: cached searches plus the article store"""
+        return self.store.total_bytes() + self.articles.total_bytes()
+
+    def delete_expired(self, max_age_seconds: float) -> int:
+        """
+        Expire old entries from every tier, and unsettled searched windows from the article store;
+        returns the number of entries and windows removed from disk
+        """
+        min_timestamp = time.time() - max_age_seconds
+        with self._lock:
+            stale_keys = [key for key, data in self._memory.items() if not self._is_fresh(data, max_age_seconds)]
+            for key in stale_keys:
+                del self._memory[key]
+        self.index.remove_older_than(min_timestamp)
+        return self.store.delete_expired(max_age_seconds) + self.articles.delete_expired(max_age_seconds)
+
+    def evict_to_budget(self, max_bytes: int) -> int:
+        """
+        Evict least recently used disk entries, with the stored articles of their queries, until the
+        database fits max_bytes; if the article store alone is still too large, its least recently
+        searched queries are forgotten too. Returns the number of entries and windows evicted
+        """
+        excess = self.total_bytes() - max_bytes
+        if excess <= 0:
+            return 0
+
+        evicted = self.store.evict_to_budget(self.store.total_bytes() - excess)
+        for cache_key, _ in evicted:
+            self.index.remove(cache_key)
+        evicted_windows = self.articles.forget_queries(cached_query for _, cached_query in evicted)
+        evicted_windows += self.articles.evict_to_budget(max(0, max_bytes - self.store.total_bytes()))
+        return len(evicted) + evicted_windows
+
+    def start_janitor(self, ttl_seconds: float, max_bytes: Optional[int] = None,
+                      interval_seconds: float = 300.0) -> "CacheJanitor":
+        """Start the background janitor for this cache (once per process)"""
+        with self._lock:
+            if self.janitor is None:
+                self.janitor = CacheJanitor(self, ttl_seconds, max_bytes=max_bytes, interval_seconds=interval_seconds)
+                self.janitor.start()
+            return self.janitor
+
+    def clear(self):
+        """Drop every entry from every tier"""
+        with self._lock:
+            self._memory.clear()
+        self.index.clear()
+        self.store.clear()
+        self.articles.clear()
+
+
+class CacheJanitor(threading.Thread):
+    """
+    Background housekeeping for a SharedSearchCache
+    Periodically flushes batched access times, expires entries and unsettled
+    article windows by TTL and evicts least recently used disk entries (with
+    their stored articles) once the byte budget is exceeded,
+    so the request path never pays for cleanup
+    """
+
+    def __init__(self, cache: SharedSearchCache, ttl_seconds: float, max_bytes: Optional[int] = None,
+                 interval_seconds: float = 300.0):
+        super().__init__(name="search-cache-janitor", daemon=True)
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._run_lock = threading.Lock()
+
+        self.expired_total = 0
+        self.evicted_total = 0
+        self.last_run: Optional[float] = None
+
+    def run_once(self) -> Dict[str, int]:
+        """Run a single housekeeping pass and return what it removed"""
+        with self._run_lock:
+            self.cache.store.flush_access_times()
+            expired = self.cache.delete_expired(self.ttl_seconds)
+            evicted = self.cache.evict_to_budget(self.max_bytes) if self.max_bytes is not None else 0
+            if expired or evicted:
+                self.cache.store.reclaim_space()
+
+            self.expired_total += expired
+            self.evicted_total += evicted
+            self.last_run = time.time()
+
+        if expired or evicted:
+            print(f"🧹 Search cache janitor: expired {expired}, evicted {evicted} entries "
+                  f"({self.cache.total_bytes() / 1e6:.1f} MB on disk)")
+        return {"expired": expired, "evicted": evicted}
+
+    def run(self):
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"⚠️ Search cache janitor error: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_shared_caches: Dict[Path, SharedSearchCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_search_cache(cache_dir: Union[str, Path], memory_size: int = 2048,
+                            index_max_age_seconds: Optional[float] = None) -> SharedSearchCache:
+    """Return the process-wide cache for `cache_dir`, creating it on first use"""
+    cache_path = Path(cache_dir).resolve()
+    with _shared_caches_lock:
+        shared_cache = _shared_caches.get(cache_path)
+        if shared_cache is None:
+            shared_cache = SharedSearchCache(cache_path, memory_size=memory_size,
+                                             index_max_age_seconds=index_max_age_seconds)
+            _shared_caches[cache_path] = shared_cache
+        return shared_cache
@@ -0,0 +1,161 @@
+"""
+Record/replay corpus for Google News SERP searches
+In record mode every raw SERP response is appended to a compact JSONL corpus
+(the tool skips its caches while recording, so every search reaches the corpus);
+in replay mode searches are answered deterministically from that corpus
+(keyed by query + timeframe) with no network access and no API key; a
+search missing from the corpus fails instead of replaying an empty result
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+SEARCH_MODES = ("live", "record", "replay")
+DEFAULT_CORPUS_PATH = "cache/google_news/search_corpus.jsonl"
+
+# Only the fields CachedGoogleNewsTool reads from a SERP response are recorded
+_RECORDED_RESULT_FIELDS = {
+    "news_results": ("title", "source", "link", "snippet", "date", "position"),
+    "organic_results": ("title", "displayed_link", "link", "snippet", "position"),
+}
+
+
+def get_search_mode(search_mode: str = None) -> str:
+    """Resolve the search mode from the argument or GOOGLE_NEWS_SEARCH_MODE (default: live)"""
+    mode = (search_mode or os.getenv("GOOGLE_NEWS_SEARCH_MODE") or "live").lower()
+    if mode not in SEARCH_MODES:
+        print(f"⚠️ Unknown search mode '{mode}', using live searches")
+        return "live"
+    return mode
+
+
+def get_corpus_path(corpus_path: str = None) -> Path:
+    """Resolve the corpus path from the argument or GOOGLE_NEWS_CORPUS"""
+    return Path(corpus_path or os.getenv("GOOGLE_NEWS_CORPUS") or DEFAULT_CORPUS_PATH)
+
+
+class ReplayMissError(LookupError):
+    """A replayed search has no recorded response in the corpus"""
+
+
+class SearchCorpus:
+    """Append-only JSONL corpus of compacted SERP responses keyed by query + timeframe"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def corpus_key(params: Dict[str, Any]) -> str:
+        """Replay key: normalized query plus the tbs timeframe filter"""
+        return f"{str(params.get('q', '')).lower().strip()}|{params.get('tbs', '')}"
+
+    @staticmethod
+    def compact(search_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Strip a SERP response down to the fields used for article extraction"""
+        compacted = {}
+        for section, fields in _RECORDED_RESULT_FIELDS.items():
+            if section in search_result:
+                compacted[section] = [
+                    {field: item[field] for field in fields if field in item}
+                    for item in search_result[section]
+                ]
+        return compacted
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    self._responses[record["key"]] = record["response"]
+                except (json.JSONDecodeError, KeyError):
+                    print(f"⚠️ Skipping malformed corpus line {line_number} in {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Recorded response for these search parameters, if any"""
+        return self._responses.get(self.corpus_key(params))
+
+    def record(self, params: Dict[str, Any], search_result: Dict[str, Any]):
+        """Append a search response to the corpus (last recording for a key wins on replay)"""
+        key = self.corpus_key(params)
+        response = self.compact(search_result)
+        line = json.dumps({"key": key, "q": params.get("q", ""), "tbs": params.get("tbs", ""), "response": response},
+                          separators=(",", ":"))
+        with self._lock:
+            self._responses[key] = response
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(line + "\n")
+
+
+class RecordingSerpClient:
+    """Wraps a live SERP client and records every successful response into the corpus"""
+
+    def __init__(self, client, corpus: SearchCorpus):
+        self.client = client
+        self.corpus = corpus
+
+    def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        search_result = self.client.search(params)
+        self.corpus.record(params, search_result)
+        return search_result
+
+    async def asearch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        search_result = await self.client.asearch(params)
+        self.corpus.record(params, search_result)
+        return search_result
+
+
+class ReplaySerpClient:
+    """
+    Answers SERP searches from a recorded corpus without network access
+    Unrecorded searches raise ReplayMissError, so the tool treats them as failed
+    sub-queries (never cached) rather than as searches that found no news
+    """
+
+    def __init__(self, corpus: SearchCorpus):
+        self.corpus = corpus
+        self._lock = threading.Lock()
+        self.replay_hits = 0
+        self.replay_misses = 0
+
+    def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        search_result = self.corpus.get(params)
+        with self._lock:
+            if search_result is None:
+                self.replay_misses += 1
+            else:
+                self.replay_hits += 1
+        if search_result is None:
+            raise ReplayMissError(f"No recorded response for '{params.get('q', '')}' in {self.corpus.path}")
+        return search_result
+
+    async def asearch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self.search(params)
+
+
+_corpora: Dict[str, SearchCorpus] = {}
+_corpora_lock = threading.Lock()
+
+
+def get_search_corpus(corpus_path: Union[str, Path]) -> SearchCorpus:
+    """Process-wide corpus for a path, so recordings from every tool instance share one file handle lock"""
+    path = Path(corpus_path).resolve()
+    with _corpora_lock:
+        corpus = _corpora.get(str(path))
+        if corpus is None:
+            corpus = SearchCorpus(path)
+            _corpora[str(path)] = corpus
+        return corpus
@@ -0,0 +1,182 @@
+"""
+Search cache warm-up for benchmark runs
+Derives the searches advocates are likely to make from each question's text,
+source and resolution criteria, and runs them in bulk with bounded
+concurrency before the debates start, so the debate-time tool calls become
+cache hits instead of serial SERP round trips
+"""
+
+import asyncio
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from .google_news_tool import CachedGoogleNewsTool
+from .search_budget import SearchBudgetLedger
+
+PREFETCH_ROLE = "prefetch"
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{[^}]*\}")
+_URL_PATTERN = re.compile(r"https?://\S+")
+_WORD_PATTERN = re.compile(r"\w[\w'&.-]*")
+_QUESTION_PREFIXES = (
+    "what is the probability that ",
+    "according to wikipedia, ",
+    "will ",
+)
+_LEADING_FILLER = {"the", "there", "be", "a", "an"}
+# Questions from these platforms resolve to another site's question, so their criteria name no subject
+_MARKET_SOURCES = {"manifold", "metaculus", "infer", "polymarket"}
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "by", "with", "from", "as",
+    "is", "be", "been", "are", "was", "will", "have", "has", "had", "its", "it", "this", "that",
+    "than", "more", "less", "there", "their", "any", "before", "after", "between", "compared",
+    "value", "higher", "lower", "increased", "decreased", "least", "most", "many", "much", "times",
+    "one", "plus", "over", "days", "day", "date", "what", "probability", "according", "s",
+    "ten", "they", "which", "when", "during", "its",
+}
+# Words in resolution criteria that say how a question resolves rather than what it is about
+_CRITERIA_BOILERPLATE = {
+    "resolves", "resolution", "outcome", "question", "questions", "found", "calculated", "published",
+    "data", "dataset", "market", "markets", "close", "price", "quote", "series", "www", "com", "org",
+    "pub", "en", "wiki", "once", "http", "https", "if", "coincides", "closed", "previous", "weekend", "holiday", "etc",
+}
+
+
+def _keywords(text: str, limit: int, exclude: set = None) -> List[str]:
+    """Distinct content words of text in order of appearance"""
+    exclude = exclude or set()
+    keywords = []
+    seen = set()
+    for word in _WORD_PATTERN.findall(text):
+        word = re.sub(r"'s$", "", word).strip(".'-")
+        lowered = word.lower()
+        if (len(lowered) < 2 or lowered in _STOPWORDS or lowered in exclude
+                or lowered in seen or lowered.isdigit() and len(lowered) != 4
+                or len(word) > 6 and any(c.isdigit() for c in word) and any(c.isalpha() for c in word)):
+            continue
+        seen.add(lowered)
+        keywords.append(word)
+        if len(keywords) >= limit:
+            break
+    return keywords
+
+
+def _question_core(question: str, max_words: int = 14) -> str:
+    """Question text without date placeholders, leading question phrasing and punctuation"""
+    text = _PLACEHOLDER_PATTERN.sub(" ", question.split("\n")[0])
+    text = " ".join(text.split()).strip(" ?")
+    lowered = text.lower()
+    for prefix in _QUESTION_PREFIXES:
+        if lowered.startswith(prefix):
+            text = text[len(prefix):]
+            lowered = lowered[len(prefix):]
+    words = text.split()
+    while words and words[0].lower() in _LEADING_FILLER:
+        words = words[1:]
+    return " ".join(words[:max_words])
+
+
+def _criteria_terms(question_data: Dict[str, Any], exclude: set) -> List[str]:
+    """Subject terms from the resolution criteria and source (e.g. a ticker or ranking in the URL)"""
+    if str(question_data.get("source", "")).lower() in _MARKET_SOURCES:
+        return []
+    criteria = str(question_data.get("resolution_criteria") or "")
+    url_words = " ".join(
+        re.sub(r"[-_/.=?]+", " ", url.split("://", 1)[-1].split("/", 1)[-1])
+        for url in _URL_PATTERN.findall(criteria)
+    )
+    # URL paths usually name the subject (ticker, series, ranking), so they come first
+    text = f"{question_data.get('source') or ''} {url_words} {_URL_PATTERN.sub(' ', criteria)}"
+    return _keywords(text, 3, exclude | _CRITERIA_BOILERPLATE)
+
+
+def derive_prefetch_queries(question_data: Dict[str, Any], max_queries: int = 3) -> List[str]:
+    """
+    Likely advocate searches for a question: the question itself, its key terms,
+    and key terms combined with subject terms from the resolution criteria
+    """
+    core = _question_core(question_data.get("question", ""))
+    if not core:
+        return []
+
+    core_keywords = _keywords(core, 6)
+    queries = [core]
+    if len(core_keywords) >= 2:
+        queries.append(" ".join(core_keywords))
+
+    criteria_terms = _criteria_terms(question_data, {k.lower() for k in core_keywords})
+    if criteria_terms:
+        queries.append(" ".join(core_keywords[:3] + criteria_terms))
+
+    unique_queries = []
+    for query in queries:
+        if query.lower() not in (q.lower() for q in unique_queries):
+            unique_queries.append(query)
+    return unique_queries[:max_queries]
+
+
+async def _aprefetch(tool: CachedGoogleNewsTool, searches: List[Tuple[str, str]], cutoff_date: Optional[str],
+                     max_concurrency: int, search_ledger: Optional[SearchBudgetLedger]) -> int:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    failures = 0
+
+    async def warm(question_id: str, query: str):
+        nonlocal failures
+        budget_scope = search_ledger.scope(question_id, PREFETCH_ROLE) if search_ledger else None
+        async with semaphore:
+            try:
+                await tool._arun(query, cutoff_date=cutoff_date, budget_scope=budget_scope)
+            except Exception as e:
+                failures += 1
+                print(f"⚠️ Prefetch failed for '{query}': {e}")
+
+    await asyncio.gather(*(warm(question_id, query) for question_id, query in searches))
+    return failures
+
+
+def prefetch_searches(questions: List[Dict[str, Any]], cutoff_date: str = None, serp_api_key: str = None,
+                      max_concurrency: int = 8, queries_per_question: int = 3,
+                      search_ledger: SearchBudgetLedger = None) -> Dict[str, Any]:
+    """
+    Warm the shared search cache for a batch of questions
+    Searches use the same timeframe and default search type as the debate
+    tools, so their cache keys match; API calls are charged to each question's
+    'prefetch' ledger scope, never to an advocate's budget
+    """
+    searches = [
+        (str(question_data.get("id", idx)), query)
+        for idx, question_data in enumerate(questions)
+        for query in derive_prefetch_queries(question_data, queries_per_question)
+    ]
+    if not searches:
+        return {"queries": 0, "api_calls": 0, "cache_hits": 0, "failed": 0, "duration_seconds": 0.0}
+
+    # The session limit must cover every planned sub-query (searches with the default focused,
+    # high-priority type); it is counted per question when searches are charged to a ledger
+    planned_sub_queries = defaultdict(int)
+    for question_id, query in searches:
+        session_key = question_id if search_ledger else None
+        planned_sub_queries[session_key] += len(CachedGoogleNewsTool._generate_strategic_queries(query, "focused", "high"))
+    tool = CachedGoogleNewsTool(
+        serp_api_key=serp_api_key,
+        max_concurrent_searches=max_concurrency,
+        max_searches_per_session=max(planned_sub_queries.values())
+    )
+
+    print(f"🔥 Prefetching {len(searches)} searches for {len(questions)} questions (concurrency: {max_concurrency})")
+    start = time.time()
+    failures = asyncio.run(_aprefetch(tool, searches, cutoff_date, max_concurrency, search_ledger))
+    stats = tool.get_cache_stats()
+
+    summary = {
+        "queries": len(searches),
+        "api_calls": stats["api_calls"],
+        "cache_hits": stats["cache_hits"],
+        "failed": failures,
+        "duration_seconds": time.time() - start,
+    }
+    print(f"✅ Search cache warmed: {summary['queries']} queries, {summary['api_calls']} API calls, "
+          f"{summary['cache_hits']} already cached ({summary['duration_seconds']:.1f}s)")
+    return summary
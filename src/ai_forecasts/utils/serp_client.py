@@ -0,0 +1,250 @@
+"""
+Pooled, rate-limited SERP API client
+A single keep-alive HTTP session (plus one async client running on a
+long-lived background event loop) is shared by every Google News tool
+instance in the process. Requests pass
+through a token-bucket rate limiter and are retried with exponential backoff
+on 429/5xx responses, honoring the provider's Retry-After header
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+SERP_API_ENDPOINT = "https://serpapi.com/search"
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    Tokens refill continuously at `rate` per second up to `capacity`; callers
+    reserve a token and wait until it becomes available
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait for a token without blocking the event loop"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop):
+    """Run a background event loop until it is stopped, then close it"""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class SerpApiClient:
+    """SERP API client with connection pooling, rate limiting and retry-with-backoff"""
+
+    def __init__(self, rate_per_second: float = 5.0, burst: float = 5.0, max_retries: int = 3,
+                 backoff_seconds: float = 1.0, max_backoff_seconds: float = 30.0,
+                 timeout_seconds: float = 30.0, pool_size: int = 32):
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        self.pool_size = pool_size
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # httpx clients are bound to the event loop they run on, so every async request runs on one
+        # long-lived background loop instead of the caller's (often short-lived) loop
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client = None
+        self._async_lock = threading.Lock()
+
+        # Counters are shared by every worker thread and event loop using the client
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self._retry_count = 0
+
+    @property
+    def request_count(self) -> int:
+        """HTTP requests sent, including retries"""
+        with self._stats_lock:
+            return self._request_count
+
+    @property
+    def retry_count(self) -> int:
+        """Requests that were retried after a transport error or a retryable status"""
+        with self._stats_lock:
+            return self._retry_count
+
+    def _count_request(self):
+        with self._stats_lock:
+            self._request_count += 1
+
+    def _count_retry(self):
+        with self._stats_lock:
+            self._retry_count += 1
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt, preferring the provider's Retry-After header"""
+        if retry_after:
+            try:
+                return min(self.max_backoff_seconds, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    return min(self.max_backoff_seconds, max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()))
+                except (TypeError, ValueError):
+                    pass
+        delay = self.backoff_seconds * (2 ** attempt)
+        return min(self.max_backoff_seconds, delay + random.uniform(0, delay / 2))
+
+    @staticmethod
+    def _request_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        request_params = dict(params)
+        request_params.setdefault("output", "json")
+        return request_params
+
+    def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a SERP API search and return the decoded JSON response"""
+        request_params = self._request_params(params)
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            self._count_request()
+            try:
+                response = self._session.get(SERP_API_ENDPOINT, params=request_params, timeout=self.timeout_seconds)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                print(f"⏳ SERP request failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response.json()
+                delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                print(f"⏳ SERP API returned {response.status_code}, retrying in {delay:.1f}s")
+
+            self._count_retry()
+            time.sleep(delay)
+
+    def _get_async_loop(self) -> asyncio.AbstractEventLoop:
+        """Background event loop, started on first use, that owns the keep-alive async client"""
+        with self._async_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=_run_event_loop, args=(loop,), name="serp-async-client", daemon=True).start()
+                self._async_client = httpx.AsyncClient(
+                    timeout=self.timeout_seconds,
+                    limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+                )
+                self._async_loop = loop
+            return self._async_loop
+
+    async def asearch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of search using non-blocking HTTP on the client's background event loop"""
+        if httpx is None:
+            # No async HTTP client available - run the blocking request in a worker thread
+            return await asyncio.to_thread(self.search, params)
+
+        future = asyncio.run_coroutine_threadsafe(self._asearch_on_loop(params), self._get_async_loop())
+        return await asyncio.wrap_future(future)
+
+    async def _asearch_on_loop(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an async search on the background loop"""
+        client = self._async_client
+        request_params = self._request_params(params)
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async()
+            self._count_request()
+            try:
+                response = await client.get(SERP_API_ENDPOINT, params=request_params)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                print(f"⏳ SERP request failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response.json()
+                delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                print(f"⏳ SERP API returned {response.status_code}, retrying in {delay:.1f}s")
+
+            self._count_retry()
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Close the HTTP session, the async client and its background event loop"""
+        with self._async_lock:
+            loop, client = self._async_loop, self._async_client
+            self._async_loop = self._async_client = None
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=self.timeout_seconds)
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+        self._session.close()
+
+
+_shared_client: Optional[SerpApiClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_serp_client() -> SerpApiClient:
+    """
+    Process-wide SERP client shared by every tool instance
+    Throughput is configured with SERP_RATE_LIMIT_PER_SECOND, SERP_RATE_LIMIT_BURST,
+    SERP_MAX_RETRIES and SERP_POOL_SIZE
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = SerpApiClient(
+                rate_per_second=float(os.getenv("SERP_RATE_LIMIT_PER_SECOND", "5")),
+                burst=float(os.getenv("SERP_RATE_LIMIT_BURST", "5")),
+                max_retries=int(os.getenv("SERP_MAX_RETRIES", "3")),
+                pool_size=int(os.getenv("SERP_POOL_SIZE", "32"))
+            )
+        return _shared_client
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the journaled checkpoint store
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_forecasts.utils.checkpoint_store import (
+    CheckpointStore, atomic_write_json, list_checkpoints, read_manifest, record_checksum, resume_state
+)
+
+
+def make_result(question_id: str, success: bool = True) -> dict:
+    return {'question_id': question_id, 'success': success, 'predictions': [0.25, 0.5]}
+
+
+def test_legacy_checkpoint_gets_a_manifest_when_listed(tmp_path):
+    """Runs checkpointed before manifests are read once and listed with their progress"""
+    snapshot_path = tmp_path / "benchmark_checkpoint_20240101_000000.json"
+    snapshot_path.write_text(json.dumps({
+        'run_timestamp': "20240101_000000",
+        'total_questions': 3,
+        'results': [make_result("a"), make_result("b", success=False)]
+    }))
+
+    checkpoints = list_checkpoints(tmp_path, "benchmark_checkpoint_*.json")
+
+    manifest = checkpoints[0]['manifest']
+    assert manifest['completed_count'] == 2
+    assert manifest['failed_count'] == 1
+    assert manifest['total_questions'] == 3
+    assert read_manifest(CheckpointStore(snapshot_path).manifest_path) == manifest
+    assert snapshot_path.exists()
+
+
+def test_journaled_results_replay_on_load(tmp_path):
+    """Results appended since the last compaction are recovered from the journal"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    store.set_header(run_timestamp="run", total_questions=3)
+    store.compact()
+    store.append(make_result("a"), completed_count=1)
+    store.append(make_result("b"), completed_count=2)
+    store.close()
+
+    data = CheckpointStore(snapshot_path).load()
+
+    assert [r['question_id'] for r in data['results']] == ["a", "b"]
+    assert data['completed_count'] == 2
+    assert data['total_questions'] == 3
+
+
+def test_journal_records_already_in_the_snapshot_are_not_replayed(tmp_path):
+    """A crash after compacting but before truncating the journal never duplicates results"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    store.append(make_result("a"))
+    store.append(make_result("b"))
+    store.close()
+    stale_journal = store.journal_path.read_text()
+    store.compact()
+    store.journal_path.write_text(stale_journal)  # Journal that compaction did not get to remove
+
+    reloaded = CheckpointStore(snapshot_path)
+    reloaded.load()
+    reloaded.append(make_result("c"))
+    reloaded.close()
+
+    assert [r['question_id'] for r in CheckpointStore(snapshot_path).load()['results']] == ["a", "b", "c"]
+
+
+def test_torn_journal_line_is_skipped(tmp_path):
+    """A crash mid-append loses only the torn record; later appends start on a fresh line"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    store.append(make_result("a"))
+    store.close()
+    with open(store.journal_path, 'a') as f:
+        f.write('{"seq": 2, "result": {"question_id": "b"')
+
+    resumed = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    assert [r['question_id'] for r in resumed.load()['results']] == ["a"]
+    resumed.append(make_result("c"))
+    resumed.close()
+
+    assert [r['question_id'] for r in CheckpointStore(snapshot_path).load()['results']] == ["a", "c"]
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    """Snapshots are replaced by rename, so only the finished file remains"""
+    path = tmp_path / "run.json"
+    atomic_write_json(path, {'results': [make_result("a")]})
+    atomic_write_json(path, {'results': [make_result("b")]})
+
+    assert json.loads(path.read_text())['results'][0]['question_id'] == "b"
+    assert [p.name for p in tmp_path.iterdir()] == ["run.json"]
+
+
+def test_truncated_snapshot_is_salvaged(tmp_path):
+    """A snapshot cut off mid-write keeps every intact result and is set aside as .damaged"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, compact_every=0)
+    store.set_header(run_timestamp="run", total_questions=3)
+    for question_id in ("a", "b", "c"):
+        store.append(make_result(question_id))
+    store.compact()
+    text = snapshot_path.read_text()
+    snapshot_path.write_text(text[:text.rindex('"question_id": "c"')])
+
+    data = CheckpointStore(snapshot_path).load()
+
+    assert [r['question_id'] for r in data['results']] == ["a", "b"]
+    assert data['total_questions'] == 3
+    assert (tmp_path / "run.json.damaged").exists()
+    assert not snapshot_path.exists()
+
+
+def test_results_with_mismatched_checksums_are_dropped(tmp_path):
+    """Corrupted snapshot results and journal records are skipped; the rest still load"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    store.append(make_result("a"))
+    store.append(make_result("b"))
+    store.compact()
+    store.append(make_result("c"))
+    store.append(make_result("d"))
+    store.close()
+
+    snapshot = json.loads(snapshot_path.read_text())
+    snapshot['results'][0]['predictions'] = [0.9, 0.9]
+    snapshot_path.write_text(json.dumps(snapshot))
+    lines = store.journal_path.read_text().splitlines()
+    record = json.loads(lines[1])
+    record['result']['success'] = False
+    lines[1] = json.dumps(record)
+    store.journal_path.write_text("\n".join(lines) + "\n")
+
+    data = CheckpointStore(snapshot_path).load()
+
+    assert [r['question_id'] for r in data['results']] == ["b", "c"]
+    assert snapshot['result_checksums'][1] == record_checksum(make_result("b"))
+
+
+def test_newer_result_for_a_question_replaces_the_older_one(tmp_path):
+    """A retried question keeps only its latest result, across the journal and compaction"""
+    snapshot_path = tmp_path / "run.json"
+    store = CheckpointStore(snapshot_path, fsync_every=1, compact_every=0)
+    store.append(make_result("a", success=False))
+    store.append(make_result("b"))
+    store.compact()
+    store.append(make_result("a"))
+    store.close()
+
+    results = CheckpointStore(snapshot_path).load()['results']
+
+    assert sorted(r['question_id'] for r in results) == ["a", "b"]
+    assert all(r['success'] for r in results)
+    assert read_manifest(store.manifest_path)['failed_count'] == 0
+
+
+def test_resume_skips_failed_questions_unless_retrying():
+    """--retry-failed re-runs failed questions; finished ones are never re-run"""
+    results = [make_result("a"), make_result("b", success=False), {'question_idx': 4, 'success': False}]
+
+    results_by_id, completed_ids, failed_ids = resume_state(results)
+    assert completed_ids == {"a", "b", "q_4"}
+    assert failed_ids == {"b", "q_4"}
+
+    results_by_id, completed_ids, failed_ids = resume_state(results, retry_failed=True)
+    assert completed_ids == {"a"}
+    assert set(results_by_id) == {"a", "b", "q_4"}
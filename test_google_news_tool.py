@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the Google News tool's search limits and result caching
+"""
+
+import pickle
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_forecasts.utils.article_store import NewsArticle
+from ai_forecasts.utils.google_news_tool import CachedGoogleNewsTool
+from ai_forecasts.utils.search_budget import SearchBudgetLedger
+from ai_forecasts.utils.search_cache import RETRY_AS_LEADER, SearchCacheStore, SharedSearchCache
+from ai_forecasts.utils.search_corpus import RecordingSerpClient, get_search_corpus
+
+
+def make_tool(tmp_path, **kwargs) -> CachedGoogleNewsTool:
+    return CachedGoogleNewsTool(serp_api_key="test-key", cache_dir=str(tmp_path / "cache"), **kwargs)
+
+
+def fake_search(query, effective_timeframe=None):
+    """Stand-in for a SERP request returning one article per sub-query"""
+    return [NewsArticle(f"{query} headline", "Reuters", f"https://example.com/{query.replace(' ', '-')}",
+                        "", "", 1, query)]
+
+
+def test_session_limit_is_counted_per_question(tmp_path):
+    """A tool reused across questions gives every question the full session limit"""
+    tool = make_tool(tmp_path, max_searches_per_session=3)
+    ledger = SearchBudgetLedger(budget_per_role=10)
+
+    for question_id in ("q1", "q2", "q3"):
+        scope = ledger.scope(question_id, "high_advocate")
+        assert tool._reserve_searches(2, scope) == 2
+        assert tool._reserve_searches(2, scope) == 1
+        assert tool._check_search_unavailable("query", "focused", None, scope).startswith("❌ API limit reached")
+
+    assert tool.get_cache_stats()["api_calls"] == 9
+
+
+def test_concurrent_samples_sharing_a_tool_keep_separate_limits(tmp_path):
+    """Samples of one eval searching through the same tool at once never spend each other's limit"""
+    tool = make_tool(tmp_path, max_searches_per_session=5)
+    ledger = SearchBudgetLedger(budget_per_role=None)
+    scopes = [ledger.scope(f"q{i}", role) for i in range(8) for role in ("high_advocate", "low_advocate")]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        granted = list(executor.map(lambda scope: sum(tool._reserve_searches(1, scope) for _ in range(5)), scopes))
+
+    assert sum(granted) == 8 * 5
+    assert all(ledger.used(f"q{i}") == 5 for i in range(8))
+
+
+def test_partial_results_are_not_cached(tmp_path):
+    """A search cut short by the session limit is returned but never cached as the complete result"""
+    tool = make_tool(tmp_path, max_searches_per_session=1)
+    tool._execute_single_search = fake_search
+    ledger = SearchBudgetLedger(budget_per_role=None)
+    query = "partial cache test query"
+
+    # A focused, high-priority search plans two sub-queries but only one is granted
+    partial = tool._run(query, budget_scope=ledger.scope("q1", "high_advocate"))
+    assert "may be incomplete" in partial
+    assert tool._lookup_cached_search(query, "focused", "high")[2] is None
+
+    # With a fresh session the missing sub-query runs and the full result is cached
+    full = tool._run(query, budget_scope=ledger.scope("q2", "high_advocate"))
+    assert "may be incomplete" not in full
+    assert "Found 2 articles" in tool._lookup_cached_search(query, "focused", "high")[2]
+
+
+def test_only_complete_cached_results_are_shared_with_waiters(tmp_path):
+    """Coalesced waiters retry under their own budget unless the leader cached the complete result"""
+    tool = make_tool(tmp_path, max_searches_per_session=1)
+    tool._execute_single_search = fake_search
+    ledger = SearchBudgetLedger(budget_per_role=None)
+    query = "coalesced search query"
+    cache_key, effective_timeframe, _ = tool._lookup_cached_search(query, "focused", "high")
+
+    # Only one of the two planned sub-queries fits the first question's session limit
+    partial, cache_data = tool._search_and_cache(query, "focused", "high", cache_key, effective_timeframe,
+                                                 ledger.scope("q1", "high_advocate"))
+    assert "may be incomplete" in partial and cache_data is None
+    _, flight = tool._cache.join_in_flight(cache_key)
+    tool._finish_flight(cache_key, cache_data)
+    assert flight.result() is RETRY_AS_LEADER
+
+    full, cache_data = tool._search_and_cache(query, "focused", "high", cache_key, effective_timeframe,
+                                              ledger.scope("q2", "high_advocate"))
+    _, flight = tool._cache.join_in_flight(cache_key)
+    tool._finish_flight(cache_key, cache_data)
+    assert flight.result() is cache_data
+    assert "API searches used: 1 (limit 1 per question)" in full
+    assert "API searches used: 0 (limit 1 per question)" in tool._record_coalesced(cache_data, ledger.scope("q3", "high_advocate"))
+
+
+def test_usage_footer_counts_the_current_question(tmp_path):
+    """The footer reports the searching question's API calls, not the tool-wide total"""
+    tool = make_tool(tmp_path, max_searches_per_session=5)
+    tool._execute_single_search = fake_search
+    ledger = SearchBudgetLedger(budget_per_role=None)
+
+    first = tool._run("first footer query", budget_scope=ledger.scope("q1", "high_advocate"))
+    second = tool._run("second footer query", budget_scope=ledger.scope("q2", "high_advocate"))
+
+    assert "API searches used: 2 (limit 5 per question)" in first
+    assert "API searches used: 2 (limit 5 per question)" in second
+    assert tool.get_cache_stats()["api_calls"] == 4
+
+
+def test_cache_fallback_only_uses_the_same_search_type_and_window(tmp_path):
+    """The limit fallback never serves results of another search type, window or unrelated query"""
+    tool = make_tool(tmp_path)
+    tool._execute_single_search = fake_search
+    tool._run("european electric vehicle sales", search_type="focused", priority="medium", cutoff_date="2024-07-21")
+
+    window = tool._get_effective_timeframe("2024-07-21")
+    other_window = tool._get_effective_timeframe("2024-09-01")
+    assert tool._get_cache_fallback("european electric vehicle sales growth", "focused", window)
+    assert tool._get_cache_fallback("european electric vehicle sales growth", "comprehensive", window) is None
+    assert tool._get_cache_fallback("european electric vehicle sales growth", "focused", other_window) is None
+    assert tool._get_cache_fallback("european election polls", "focused", window) is None
+
+
+class FakeSerpClient:
+    """SERP client returning one news result per request"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def search(self, params):
+        self.requests += 1
+        return {"news_results": [{"title": f"{params['q']} headline", "source": "Reuters",
+                                  "link": f"https://example.com/{params['q'].replace(' ', '-')}", "position": 1}]}
+
+
+def test_record_mode_records_searches_the_cache_could_answer(tmp_path):
+    """Searches recorded while the live cache holds the query still replay from the corpus"""
+    corpus_path = str(tmp_path / "corpus.jsonl")
+    live = make_tool(tmp_path)
+    live._serp_client = FakeSerpClient()
+    live._run("record mode query", priority="medium", cutoff_date="2024-07-21")
+
+    recorder = make_tool(tmp_path, search_mode="record", corpus_path=corpus_path)
+    recorder._serp_client = RecordingSerpClient(FakeSerpClient(), get_search_corpus(corpus_path))
+    recorder._run("record mode query", priority="medium", cutoff_date="2024-07-21")
+    assert recorder._serp_client.client.requests == 1
+
+    replay = CachedGoogleNewsTool(cache_dir=str(tmp_path / "replay_cache"), search_mode="replay", corpus_path=corpus_path)
+    replayed = replay._run("record mode query", priority="medium", cutoff_date="2024-07-21")
+    assert "Found 1 articles" in replayed
+    assert replay._serp_client.replay_misses == 0
+
+
+def test_legacy_pickles_that_fail_to_import_are_kept(tmp_path):
+    """Only imported legacy cache files are deleted; unreadable ones are set aside"""
+    cache_dir = tmp_path / "legacy_cache"
+    cache_dir.mkdir()
+    with open(cache_dir / "good.pkl", 'wb') as f:
+        pickle.dump({'timestamp': "2024-07-01T00:00:00", 'query': "q", 'search_type': "focused", 'result': "text"}, f)
+    (cache_dir / "broken.pkl").write_bytes(b"not a pickle")
+
+    store = SearchCacheStore(cache_dir / "search_cache.sqlite3")
+    assert store.import_legacy_pickles(cache_dir) == 1
+    assert store.get("good")['result'] == "text"
+    assert not (cache_dir / "good.pkl").exists()
+    assert (cache_dir / "broken.pkl.unimported").exists()
+    store.close()
+
+
+def test_article_store_is_expired_and_evicted_with_the_search_cache(tmp_path):
+    """Stored articles count towards the cache size, unsettled windows expire and evicted searches take their articles"""
+    cache = SharedSearchCache(tmp_path / "cache")
+    settled = {'start': "06/01/2024", 'end': "07/20/2024"}
+    unsettled = {'start': "06/01/2024", 'end': time.strftime("%m/%d/%Y")}
+    week_ago = time.time() - 7 * 86400
+    cache.articles.record_search("settled query", settled, fake_search("settled query"), searched_at=week_ago)
+    cache.articles.record_search("recent query", unsettled, fake_search("recent query"), searched_at=week_ago)
+
+    assert cache.total_bytes() == cache.articles.total_bytes() > 0
+    assert cache.delete_expired(86400) == 1
+    assert cache.articles.covering_window("settled query", settled) is not None
+    assert cache.articles.count() == 1
+
+    cache.put("key", {'timestamp': "2024-07-21T00:00:00", 'query': "Settled Query", 'search_type': "focused", 'articles': ()})
+    cache.articles.record_search("settled query latest developments", settled,
+                                 fake_search("settled query latest developments"), searched_at=week_ago)
+    assert cache.evict_to_budget(0) == 3
+    assert cache.articles.count() == 0
+    assert cache.total_bytes() == 0
+
+
+def test_replay_misses_are_counted_and_never_cached(tmp_path):
+    """A search missing from the corpus is reported as incomplete, not cached as finding no news"""
+    replay = CachedGoogleNewsTool(cache_dir=str(tmp_path / "replay_cache"), search_mode="replay",
+                                  corpus_path=str(tmp_path / "empty_corpus.jsonl"))
+
+    result = replay._run("unrecorded query", priority="medium", cutoff_date="2024-07-21")
+
+    assert "may be incomplete" in result
+    assert replay._lookup_cached_search("unrecorded query", "focused", "medium", "2024-07-21")[2] is None
+    assert replay.get_cache_stats()["replay_misses"] == 1
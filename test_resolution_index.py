@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the ForecastBench resolution index
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_forecasts.utils.resolution_index import ResolutionIndex, load_resolution_index
+
+
+def write_resolutions(path: Path, resolutions: list):
+    path.write_text(json.dumps({'resolutions': resolutions}))
+
+
+def test_lookup_by_question_and_date():
+    """Resolved values are found by (question, date); unresolved entries are skipped"""
+    index = ResolutionIndex([
+        {'id': "a", 'resolution_date': "2024-07-28", 'resolved_to': 1.0},
+        {'id': "a", 'resolution_date': "2024-08-20", 'resolved_to': 0.0},
+        {'id': "a", 'resolution_date': "2024-08-20", 'resolved_to': 1.0},
+        {'id': "b", 'resolution_date': "2024-07-28", 'resolved_to': None},
+        {'resolution_date': "2024-07-28", 'resolved_to': 1.0},
+    ])
+
+    assert index.get("a", "2024-07-28") == 1.0
+    assert index.get("a", "2024-08-20") == 0.0  # First listed resolution wins, as in a linear scan
+    assert index.get("b", "2024-07-28") is None
+    assert ("a", "2024-07-28") in index
+    assert len(index) == 2
+
+
+def test_index_is_shared_until_the_file_changes(tmp_path):
+    """A file is parsed once per process and re-read only when its mtime changes"""
+    path = tmp_path / "resolutions.json"
+    write_resolutions(path, [{'id': "a", 'resolution_date': "2024-07-28", 'resolved_to': 1.0}])
+
+    index = load_resolution_index(path)
+    assert load_resolution_index(str(path)) is index
+
+    write_resolutions(path, [{'id': "a", 'resolution_date': "2024-07-28", 'resolved_to': 0.0}])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_resolution_index(path)
+    assert reloaded is not index
+    assert reloaded.get("a", "2024-07-28") == 0.0
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-question, per-role search budget ledger
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_forecasts.utils.search_budget import SearchBudgetLedger
+
+
+def test_enforced_budget_caps_each_role():
+    """A role is granted searches up to its budget; other roles and questions are unaffected"""
+    ledger = SearchBudgetLedger(budget_per_role=3)
+    high = ledger.scope("q1", "high_advocate")
+
+    assert high.reserve(2) == 2
+    assert high.reserve(2) == 1
+    assert high.reserve(1) == 0
+    assert high.exhausted()
+    assert ledger.scope("q1", "low_advocate").reserve(3) == 3
+    assert ledger.scope("q2", "high_advocate").remaining() == 3
+    assert ledger.question_summary("q1")['search_count'] == 6
+    assert ledger.question_summary("q1")['searches_attempted'] == 8
+
+
+def test_refused_searches_count_towards_the_penalty():
+    """An enforced cap grants no overspend, but searches refused beyond the budget are still penalized"""
+    ledger = SearchBudgetLedger(budget_per_role=3, penalty_rate=0.01)
+    scope = ledger.scope("q1", "high_advocate")
+
+    assert scope.reserve(5) == 3
+    scope.refuse(2)
+
+    assert ledger.used("q1") == 3
+    assert ledger.attempted("q1") == 7
+    assert ledger.search_penalty("q1") == 0.04
+    assert ledger.question_summary("q1")['search_penalty'] == 0.04
+    assert ledger.search_penalty("q2") == 0.0
+
+
+def test_unenforced_budget_counts_overspend_as_penalty():
+    """Without enforcement every search is granted and overspend is penalized"""
+    ledger = SearchBudgetLedger(budget_per_role=2, penalty_rate=0.01, enforce=False)
+    scope = ledger.scope("q1", "high_advocate")
+
+    assert scope.reserve(5) == 5
+    assert not scope.exhausted()
+    assert ledger.search_penalty("q1") == 0.03
+    assert ledger.search_penalty("q2") == 0.0
+
+
+def test_concurrent_reservations_never_exceed_the_budget():
+    """Reservations from many threads are atomic"""
+    ledger = SearchBudgetLedger(budget_per_role=50)
+    scope = ledger.scope("q1", "high_advocate")
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        granted = sum(executor.map(lambda _: scope.reserve(1), range(200)))
+
+    assert granted == 50
+    assert ledger.used("q1", "high_advocate") == 50
+    assert ledger.used() == 50